@@ -1,29 +1,23 @@
 ###
 # load actions
 #
-from importlib import import_module
 from os import listdir
-from os.path import isdir, isfile, basename, abspath, dirname, join
-
-import rich
+from os.path import isdir, abspath, dirname, join
 
+from sos_toolkit.meta import _global
+from sos_toolkit.meta._manifest import generate_manifest
 from sos_toolkit.meta._action import ActionRepo, SOS_ACTION
 
 action_path = dirname(abspath(__file__))
 __all__ = [ m for m in listdir(action_path) if isdir(join(action_path, m)) and not m.startswith("_")]
 
 p = "sos_toolkit.action"
-for action_root in __all__:
-    file_list = sorted([basename(f)[:-3] for f in listdir(join(action_path, action_root)) if basename(f).endswith(".py") and not basename(f).startswith("_")])
 
-    for action_file in file_list:
-        try:
-            import_path = f"{p}.{action_root}.{action_file}"
-            module = import_module(import_path)
+# action modules are imported the first time one of their keys is resolved
+SOS_ACTION.add_manifest(generate_manifest(action_path, p, "sos_action"))
 
-        except Exception as exc:
-            rich.print(f"ACTION LOAD ERROR: {action_root} - {action_file} - {exc}")
-            continue
+if not _global.LAZY_LOAD:
+    SOS_ACTION.load_manifest()
 
 #
 ###
\ No newline at end of file
@@ -0,0 +1,13 @@
+from sos_toolkit.meta import SOS_TOOL, log_debug
+
+
+def snapshot_inventory(__CTX__):
+    """Snapshot the docker inventory into __CTX__.__INVENTORY__ so the existence checks of a run share it
+
+    Without docker the checks ask the inventory themselves - the snapshot is skipped
+    """
+    try:
+        SOS_TOOL.docker.inventory_snapshot(__CTX__)
+
+    except Exception as exc:
+        log_debug(lambda: f"INVENTORY SNAPSHOT SKIPPED: {exc}")
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def action(
@@ -11,7 +10,7 @@ def action(
 ):
 
     """Run the Target Object from an SOSContext"""
-    rich.print({"SOS_ACTION":
+    log_info(lambda: {"SOS_ACTION":
             {
             "action":action
             }
@@ -1,11 +1,10 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
 from os import remove as os_remove
 from os.path import exists as path_exists
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, _global
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, _global, log_info
 
 @sos_action
 def clean(
@@ -14,7 +13,7 @@ def clean(
 ):
 
     """Clean up a System"""
-    rich.print({"SOS_CLEAN":
+    log_info(lambda: {"SOS_CLEAN":
             {
             "target":target,
             "context_file":context_file
@@ -33,10 +32,10 @@ def clean(
 
     if path_exists(file):
         if _global.ALLOW_DELETE:
-            rich.print(f"DELETING CONTEXT FILE: {file}")
+            log_info(f"DELETING CONTEXT FILE: {file}")
             os_remove(file)
 
         else:
-            rich.print(f"TEST DELETE CONTEXT FILE: {file}")
+            log_info(f"TEST DELETE CONTEXT FILE: {file}")
 
     return result
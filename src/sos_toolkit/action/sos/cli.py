@@ -1,11 +1,8 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
-
-from IPython.terminal.embed import InteractiveShellEmbed
 
 import sos_toolkit
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info, log_warning
 
 @sos_action
 def cli(
@@ -14,7 +11,9 @@ def cli(
 ):
 
     """Open an IPython console in an SOSContext"""
-    rich.print({"SOS_CLI":
+    from IPython.terminal.embed import InteractiveShellEmbed
+
+    log_info(lambda: {"SOS_CLI":
             {
             "context_file":context_file,
             "save_on_exit":save_on_exit
@@ -25,7 +24,7 @@ def cli(
         __CTX__ = SOSContext.file_load(context_file=context_file)
 
     except FileNotFoundError:
-        rich.print(f"NO CONTEXT_FILE FOUND - USING ROOT CONTEXT")
+        log_warning(f"NO CONTEXT_FILE FOUND - USING ROOT CONTEXT")
         __CTX__ = SOSContext.generate(system_file=False)
         save_on_exit = False
 
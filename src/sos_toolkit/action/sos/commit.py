@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def commit(
@@ -11,7 +10,7 @@ def commit(
 ):
 
     """Commit System objects"""
-    rich.print({"SOS_COMMIT":
+    log_info(lambda: {"SOS_COMMIT":
             {
             "target":target,
             "context_file":context_file,
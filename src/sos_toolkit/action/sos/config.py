@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def config(
@@ -11,7 +10,7 @@ def config(
 ):
 
     """Configure the System SOSContext"""
-    rich.print({"SOS_CONFIG":
+    log_info(lambda: {"SOS_CONFIG":
             {
             "target":target,
             "context_file":context_file
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info, log_print
 
 @sos_action
 def context(
@@ -12,7 +11,7 @@ def context(
 ):
 
     """Query the System SOSContext"""
-    rich.print({"SOS_CONTEXT":
+    log_info(lambda: {"SOS_CONTEXT":
             {
             "context_file":context_file,
             "target":target,
@@ -30,16 +29,12 @@ def context(
             __CTX__.file_save()
 
         else:
-            rich.print(f"TARGET: {target}")
-            obj = __CTX__.get(target)
-            try:
-                obj.print()
-
-            except:
-                rich.print(obj)
+            # the output asked for - printed in quiet mode too
+            log_print(f"TARGET: {target}")
+            log_print(__CTX__.get(target))
 
     else:
-        __CTX__.print()
+        log_print(__CTX__)
 
     result.set("__CTX__", __CTX__)
 
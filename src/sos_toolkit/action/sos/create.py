@@ -1,13 +1,12 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def create():
 
     """NOT IMPLEMENTED - Create a System"""
-    rich.print({"SOS_CREATE":True})
+    log_info(lambda: {"SOS_CREATE":True})
 
     raise NotImplementedError()
@@ -1,20 +1,21 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info, trace_start, trace_stop, trace_export
 
 @sos_action
 def debug(
     target: Annotated[Optional[str], Field(description="The context object to target")] = "",
     context_file: Annotated[Optional[str], Field(description="The target context_file")] = "",
+    trace: Annotated[Optional[str], Field(description="Write timing spans of the run to this file - Chrome trace JSON, or flamegraph stacks for .folded")] = "",
 ):
 
     """Debug Function"""
-    rich.print({"SOS_DEBUG":
+    log_info(lambda: {"SOS_DEBUG":
             {
             "target":target,
-            "context_file":context_file
+            "context_file":context_file,
+            "trace":trace
             }
         })
 
@@ -24,7 +25,17 @@ def debug(
     if target != "":
         _target = ".".join([_target, target])
 
-    result = __CTX__.run(_target)
+    if trace != "":
+        trace_start()
+
+    try:
+        result = __CTX__.run(_target)
+
+    finally:
+        if trace != "":
+            trace_stop()
+            trace_export(trace)
+            log_info(f"TRACE: {trace}")
 
     __CTX__.file_save()
     return result
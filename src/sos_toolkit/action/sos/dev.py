@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def dev(
@@ -11,7 +10,7 @@ def dev(
 ):
 
     """Setup a System for Development"""
-    rich.print({"SOS_DEV":
+    log_info(lambda: {"SOS_DEV":
             {
             "target":target,
             "context_file":context_file
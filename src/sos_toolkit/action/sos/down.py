@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def down(
@@ -11,7 +10,7 @@ def down(
 ):
 
     """Stop a System"""
-    rich.print({"SOS_DOWN":
+    log_info(lambda: {"SOS_DOWN":
             {
             "target":target,
             "context_file":context_file
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def fetch(
@@ -10,7 +9,7 @@ def fetch(
 ):
 
     """NOT IMPLEMENTED - Fetch the remote objects for a System"""
-    rich.print({"SOS_FETCH":
+    log_info(lambda: {"SOS_FETCH":
             {
             "target":target,
             }
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def profile(
@@ -11,7 +10,7 @@ def profile(
 ):
 
     """Set the System Profile"""
-    rich.print({"SOS_PROFILE":
+    log_info(lambda: {"SOS_PROFILE":
             {
             "profile":profile,
             "context_file":context_file,
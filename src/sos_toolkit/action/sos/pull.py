@@ -1,27 +1,36 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
 from os import getcwd
 from os.path import join as path_join
 from urllib.parse import urlparse
 
-from sos_toolkit.meta import SOS_TOOL, sos_action, ResultRepo
+from sos_toolkit.meta import SOS_TOOL, sos_action, ResultRepo, log_info, log_warning
 
 @sos_action
 def pull(
     remote_target: Annotated[Optional[str], Field(description="Remote Git Repo to Pull")] = None,
     local_target: Annotated[Optional[str], Field(description="Local Folder to use or create")] = "",
     remote_branch: Annotated[Optional[str], Field(description="Remote Branch to Pull")] = "main",
-    force: Annotated[bool, Field(default=False, description="If folder exists DELETE it before pull")] = False
+    force: Annotated[bool, Field(default=False, description="If folder exists DELETE it before pull")] = False,
+    depth: Annotated[Optional[int], Field(description="Shallow clone with this many commits of history - 0 for full history")] = 0,
+    single_branch: Annotated[bool, Field(description="Only clone the history of remote_branch")] = False,
+    clone_filter: Annotated[Optional[str], Field(description="Partial clone filter - blob:none for blobless, tree:0 for treeless")] = "",
+    reference: Annotated[Optional[str], Field(description="Local repo whose objects are borrowed instead of downloaded")] = "",
+    mirror: Annotated[bool, Field(description="Clone from a local mirror of the remote kept in SOS_GIT_MIRROR_DIR - not with depth, single_branch, clone_filter or reference")] = False,
 ):
 
     """Pull a System from a Git Target"""
-    rich.print({"SOS_PULL":
+    log_info(lambda: {"SOS_PULL":
             {"remote_target":remote_target,
              "local_target":local_target,
              "remote_branch":remote_branch,
-             "force":force
+             "force":force,
+             "depth":depth,
+             "single_branch":single_branch,
+             "clone_filter":clone_filter,
+             "reference":reference,
+             "mirror":mirror
             }
         })
 
@@ -51,7 +60,7 @@ def pull(
         SOS_TOOL.filesystem.directory_delete(local_target)
 
     elif exists:
-        rich.print(f"TARGET DIRECTORY EXISTS: {local_target}")
+        log_warning(f"TARGET DIRECTORY EXISTS: {local_target}")
         return
 
     SOS_TOOL.filesystem.directory_create(local_target)
@@ -59,6 +68,11 @@ def pull(
     SOS_TOOL.git.repo_clone(
         remote_target=remote_target,
         local_target=local_target,
-        remote_branch=remote_branch)
+        remote_branch=remote_branch,
+        depth=depth or None,
+        single_branch=single_branch,
+        clone_filter=clone_filter or None,
+        reference=reference or None,
+        mirror=mirror)
 
     return result
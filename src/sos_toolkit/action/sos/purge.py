@@ -1,13 +1,12 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def purge():
 
     """NOT IMPLEMENTED - Purge a System"""
-    rich.print({"SOS_PURGE":True})
+    log_info(lambda: {"SOS_PURGE":True})
 
     raise NotImplementedError()
@@ -1,13 +1,12 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def push():
 
     """NOT IMPLEMENTED - Push a System"""
-    rich.print({"SOS_PUSH":True})
+    log_info(lambda: {"SOS_PUSH":True})
 
     raise NotImplementedError()
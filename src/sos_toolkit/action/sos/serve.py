@@ -1,13 +1,12 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def serve():
 
     """NOT IMPLEMENTED - Start an API Server in an SOSContext"""
-    rich.print({"SOS_SERVE":True})
+    log_info(lambda: {"SOS_SERVE":True})
 
     raise NotImplementedError()
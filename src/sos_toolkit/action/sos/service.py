@@ -1,11 +1,10 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
 
 from os import listdir
 from os.path import isdir, join
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info, log_warning
 from sos_toolkit.service import SERVICE_PATH
 
 @sos_action
@@ -15,7 +14,7 @@ def service(
 ):
 
     """Run SOS-Service Actions"""
-    rich.print({"SOS_SERVICE":
+    log_info(lambda: {"SOS_SERVICE":
             {
             "target":target,
             "action":action,
@@ -45,7 +44,7 @@ def service(
 
         else:
             e = f"SERVICE TARGET DOES NOT SUPPORT ACTION: {_target}"
-            rich.print(e)
+            log_warning(e)
             result = ResultRepo(result=e)
 
     else:
@@ -59,7 +58,7 @@ def service(
 
             else:
                 e = f"SERVICE TARGET DOES NOT SUPPORT ACTION: {_target}"
-                rich.print(e)
+                log_warning(e)
                 _result = e
 
             result.set(service, _result)
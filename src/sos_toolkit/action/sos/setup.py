@@ -1,10 +1,10 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
 
 from os.path import exists as path_exists
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info, log_print
+from ._inventory import snapshot_inventory
 
 @sos_action
 def setup(
@@ -20,10 +20,11 @@ def setup(
     ignore_version: Annotated[Optional[bool], Field(description="If Ignore SOS-Toolkit Version Mismatch")] = False,
     test: Annotated[Optional[bool], Field(description="If test generate context for errors without saving")] = False,
     run_setup: Annotated[Optional[bool], Field(description="If run sos_setup from generated context")] = True,
+    inventory: Annotated[Optional[bool], Field(description="If snapshot the docker inventory for the existence checks")] = True,
 ):
 
     """Generate the System SOSContext"""
-    rich.print({"SOS_SETUP":
+    log_info(lambda: {"SOS_SETUP":
             {
             "system_file":system_file,
             "local_file":local_file,
@@ -36,7 +37,8 @@ def setup(
             "persist":persist,
             "ignore_version":ignore_version,
             "test":test,
-            "run_setup":run_setup
+            "run_setup":run_setup,
+            "inventory":inventory
             }
         })
 
@@ -50,7 +52,7 @@ def setup(
         ignore_version=ignore_version)
 
     if test:
-        rich.print(__CTX__)
+        log_print(__CTX__)
         result = ResultRepo(__CTX__=__CTX__)
 
     else:
@@ -61,6 +63,9 @@ def setup(
         __CTX__.run("hook.on_context_load")
 
         if run_setup:
+            if inventory:
+                snapshot_inventory(__CTX__)
+
             result = __CTX__.run("action.sos_setup")
 
         else:
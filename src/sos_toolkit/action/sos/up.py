@@ -1,25 +1,30 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
+from ._inventory import snapshot_inventory
 
 @sos_action
 def up(
     target: Annotated[Optional[str], Field(description="The context object to target")] = "",
     context_file: Annotated[Optional[str], Field(description="The target context_file")] = "",
+    inventory: Annotated[Optional[bool], Field(description="If snapshot the docker inventory for the existence checks")] = True,
 ):
 
     """Start a System"""
-    rich.print({"SOS_UP":
+    log_info(lambda: {"SOS_UP":
             {
             "target":target,
-            "context_file":context_file
+            "context_file":context_file,
+            "inventory":inventory
             }
         })
 
     __CTX__ = SOSContext.file_load(context_file=context_file, install_state=True)
 
+    if inventory:
+        snapshot_inventory(__CTX__)
+
     _target = "action.sos_up"
     if target != "":
         _target = ".".join([_target, target])
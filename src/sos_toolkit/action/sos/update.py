@@ -1,8 +1,7 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def update(
@@ -18,7 +17,7 @@ def update(
 ):
 
     """Update a System SOSContext"""
-    rich.print({"SOS_UPDATE":
+    log_info(lambda: {"SOS_UPDATE":
             {
             "system_file":system_file,
             "local_file":local_file,
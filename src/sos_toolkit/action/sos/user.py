@@ -1,11 +1,10 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
 from os import environ
 from pathlib import Path
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 from sos_toolkit.meta import _global
 
 @sos_action
@@ -14,7 +13,7 @@ def user(
 ):
 
     """NOT IMPLEMENTED - Set the location for an sos-user.yaml file"""
-    rich.print({"SOS_USER":
+    log_info(lambda: {"SOS_USER":
             {
             "file":file
             }
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Callable
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 from sos_toolkit.meta import SOSContext, ResultRepo
 
 from sos_toolkit.root import TOOLKIT_PATH
@@ -15,7 +14,7 @@ def version(
 ):
 
     """Change SOS-Toolkit Version"""
-    rich.print({"SOS_VERSION":
+    log_info(lambda: {"SOS_VERSION":
         {
         "target":target
         }
@@ -1,13 +1,12 @@
 from typing import Optional, Annotated
 from pydantic import Field
-import rich
 
-from sos_toolkit.meta import SOSContext, sos_action, ResultRepo
+from sos_toolkit.meta import SOSContext, sos_action, ResultRepo, log_info
 
 @sos_action
 def web():
 
     """NOT IMPLEMENTED - Start a Web UI in an SOSContext"""
-    rich.print({"SOS_WEB":True})
+    log_info(lambda: {"SOS_WEB":True})
 
     raise NotImplementedError()
@@ -1,19 +1,19 @@
 ###
 #
 from typing import Annotated, Optional
-import inspect
+import atexit
 import os
-import forge
 
 import rich
 import typer
 from click import Context
 
-import git
-
 import sos_toolkit
 
-from sos_toolkit.meta._global import DEBUG_ENABLE, SOS_SOURCE
+from sos_toolkit.meta._action import SOS_ACTION
+from sos_toolkit.meta._global import DEBUG_ENABLE, SOS_SOURCE, TRACE_FILE
+from sos_toolkit.meta._log import log_config
+from sos_toolkit.meta._trace import trace_start, trace_export
 from sos_toolkit.root import TOOLKIT_PATH
 
 RICH_ERRORS = DEBUG_ENABLE and os.environ.get("RICH_ERRORS", True)
@@ -24,15 +24,47 @@ RICH_ERRORS = DEBUG_ENABLE and os.environ.get("RICH_ERRORS", True)
 ###
 #
 # change command list order to insertion order
+# - actions are listed from the action manifest and only built when they are run
 class OrderCommands(typer.core.TyperGroup):
     def list_commands(self, ctx: Context):
         """Return list of commands in the order appear."""
 
         # get commands using self.commands
-        return list(self.commands)
+        return list(self.commands) + [key for key in _action_table() if key not in self.commands]
+
+    def get_command(self, ctx: Context, cmd_name: str):
+        """Return a command - an unbuilt action only gets its name and help for the command list"""
+        if (command := self.commands.get(cmd_name, None)) is not None:
+            return command
+
+        if (entry := _action_table().get(cmd_name, None)) is not None:
+            return typer.core.TyperCommand(name=cmd_name, help=entry.description)
+
+        return None
+
+    def resolve_command(self, ctx: Context, args):
+        """Build the action that is about to run"""
+        if len(args) and args[0] not in self.commands and args[0] in _action_table():
+            self.commands[args[0]] = _action_command(args[0], self.rich_markup_mode)
+
+        return super().resolve_command(ctx, args)
 
 cli_app = typer.Typer(cls=OrderCommands, pretty_exceptions_enable=RICH_ERRORS)
 
+@cli_app.callback()
+def cli_logging(
+    quiet: Annotated[bool, typer.Option(help="Only print warnings and errors")] = False,
+    log_level: Annotated[Optional[str], typer.Option(help="Console log level - DEBUG, INFO, WARNING, ERROR [default: SOS_LOG_LEVEL]", show_default=False)] = None,
+    log_file: Annotated[Optional[str], typer.Option(help="Also write JSON-lines log records to this file [default: SOS_LOG_FILE]", show_default=False)] = None,
+    trace: Annotated[Optional[str], typer.Option(help="Write timing spans of the run to this file - Chrome trace JSON, or flamegraph stacks for .folded [default: SOS_TRACE_FILE]", show_default=False)] = None,
+):
+    """Develop, package, and distribute local Digital Intelligence."""
+    log_config(level=log_level, log_file=log_file, quiet=True if quiet else None)
+
+    if (trace := trace or TRACE_FILE):
+        trace_start()
+        atexit.register(trace_export, trace)
+
 #
 ###
 
@@ -40,6 +72,9 @@ cli_app = typer.Typer(cls=OrderCommands, pretty_exceptions_enable=RICH_ERRORS)
 #
 @cli_app.command()
 def test():
+    # git is only needed here - keep it out of every other command's startup
+    import git
+
     rich.print(f"SOS_TOOLKIT CLI TEST - version: [green]{sos_toolkit.__version__}[/green]")
 
     # test toolkit source
@@ -47,6 +82,18 @@ def test():
     if remote != SOS_SOURCE:
         rich.print(f"[red]SOS_TOOLKIT SOURCE INCORRECT[/red] - valid: {SOS_SOURCE} - current: {remote}")
 
+
+@cli_app.command()
+def manifest():
+    """Regenerate the tool and action manifests shipped with the package"""
+    from sos_toolkit.meta._global import MANIFEST_FILE, TOOL_ROOT, ACTION_ROOT
+    from sos_toolkit.meta._manifest import generate_manifest
+
+    for package, decorator in [(TOOL_ROOT, "sos_tool"), (ACTION_ROOT, "sos_action")]:
+        path = os.path.join(os.path.dirname(os.path.abspath(sos_toolkit.__file__)), package.split(".")[-1])
+        entries = generate_manifest(path, package, decorator, rebuild=True, save=True)
+        rich.print(f"SOS_TOOLKIT MANIFEST - {os.path.join(path, MANIFEST_FILE)} - entries: {len(entries)}")
+
 #
 ###
 
@@ -60,7 +107,17 @@ def test():
 # - this is neat functionality that is intended for usage much latter
 # - do we need this?
 #
-for action in sos_toolkit.meta.SOS_ACTION.sos.values():
+def _action_table():
+    """The sos actions by key from the action manifest - nothing is imported"""
+    return {entry.key:entry for entry in SOS_ACTION.__MANIFEST__ or [] if entry.namespace == "sos"}
+
+
+def _action_command(key, rich_markup_mode):
+    """Import one action and build its command"""
+    import forge
+
+    action = getattr(SOS_ACTION.sos, key)
+
     optional = []
     required = []
     if "__CTX__" in action.sos_schema.keys():
@@ -97,7 +154,7 @@ for action in sos_toolkit.meta.SOS_ACTION.sos.values():
 
     action.function.__signature__ = sig.native
 
-    cli_app.registered_commands.append(
+    return typer.main.get_command_from_info(
         typer.models.CommandInfo(
             name=action.key,
             cls=typer.core.TyperCommand,
@@ -113,7 +170,9 @@ for action in sos_toolkit.meta.SOS_ACTION.sos.values():
             deprecated=False,
             # Rich settings
             rich_help_panel=typer.models.Default(None),
-        )
+        ),
+        pretty_exceptions_short=cli_app.pretty_exceptions_short,
+        rich_markup_mode=rich_markup_mode,
     )
 
 #
@@ -26,17 +26,45 @@ from sos_toolkit.meta._meta import (
     MetaRoot,
     MetaAnnotation,
     MetaCondition,
+    ConditionPredicate,
+    condition_predicate,
+    condition_resolve,
     MetaSchema,
     MetaRunnable,
     MetaObject,
     MetaConfig,
-    MetaResolvable
+    MetaResolvable,
+    ResolvePlan,
+    PathLookup,
+    MapPlan
+    )
+
+from sos_toolkit.meta._log import (
+    log,
+    log_debug,
+    log_info,
+    log_warning,
+    log_error,
+    log_print,
+    log_enabled,
+    log_config,
+    )
+
+from sos_toolkit.meta._manifest import (
+    ManifestParam,
+    ManifestEntry,
+    generate_manifest,
     )
 
 from sos_toolkit.meta._model import (
     ModelGet,
     ModelDict,
-    ModelParams
+    ModelParams,
+    PathTrie,
+    ConditionMemo,
+    PathVersions,
+    condition_memo,
+    condition_check
     )
 
 from sos_toolkit.meta._platform import (
@@ -50,6 +78,12 @@ from sos_toolkit.meta._hook import (
     HookConfig,
     )
 
+from sos_toolkit.meta._resolve import (
+    ConfigResolver,
+    SOS_RESOLVER,
+    parse_interpolation,
+    )
+
 from sos_toolkit.meta._result import (
     ResultData,
     ResultObject,
@@ -63,6 +97,15 @@ from sos_toolkit.meta._service import (
     ServiceConfig,
     )
 
+from sos_toolkit.meta._trace import (
+    span,
+    traced,
+    trace_enabled,
+    trace_start,
+    trace_stop,
+    trace_export,
+    )
+
 from sos_toolkit.meta._tool import (
     ToolObject,
     ToolRepo,
@@ -3,8 +3,8 @@ from pydantic import BaseModel, Field, field_validator
 from inspect import getfile
 from pathlib import Path
 import inspect
-import rich
 
+from sos_toolkit.meta._log import log_error
 from sos_toolkit.meta._model import ModelParams
 from sos_toolkit.meta._meta import MetaRepo, MetaRoot, MetaRunnable, MetaObject, MetaConfig
 
@@ -36,7 +36,7 @@ def sos_action(function):
 
     except Exception as exc:
         e = f"SOS_ACTION ERROR: {file} - {key} - {exc.__str__()}"
-        rich.print(e)
+        log_error(e)
 
     finally:
         return function
@@ -0,0 +1,165 @@
+###
+#
+from typing import Optional, Any, Dict, List, Annotated
+from pydantic import Field
+
+import pickle
+import hashlib
+import json
+
+from os import makedirs, listdir, replace, remove, getpid
+from os.path import join as path_join
+from os.path import exists as path_exists
+from os.path import getmtime
+
+from sos_toolkit.meta._log import log_warning
+from sos_toolkit.meta import _global
+
+#
+###
+
+###
+#
+# cached files only hold plain containers - a global in a file is refused instead of imported
+_SAFE_GLOBALS = {
+    ("pathlib", "Path"),
+    ("pathlib", "PosixPath"),
+    ("pathlib", "WindowsPath"),
+    ("pathlib", "PurePosixPath"),
+    ("pathlib", "PureWindowsPath"),
+    }
+
+
+class SafeUnpickler(pickle.Unpickler):
+    """Unpickler for plain data - loading a file never imports or calls anything"""
+    def find_class(self, module, name):
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+
+        e = f"UNSAFE PICKLE GLOBAL: {module}.{name}"
+        raise pickle.UnpicklingError(e)
+
+
+def safe_load(
+    f: Annotated[Any, Field(description="Binary file object to load from")]
+):
+    """Load plain data from a pickle file without running code from it"""
+    return SafeUnpickler(f).load()
+
+
+def file_digest(
+    target: Annotated[str, Field(description="Target file to hash")]
+):
+    """Return the sha256 hexdigest of a file or None if it does not exist"""
+    try:
+        with open(target, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    except (FileNotFoundError, IsADirectoryError, TypeError):
+        return None
+
+
+def cache_key(
+    files: Annotated[List[str], Field(description="Files whose content is part of the key")] = [],
+    values: Annotated[Dict[str, Any], Field(description="JSON serializable values that are part of the key")] = {},
+):
+    """Build a content hash over a list of files and a dict of values"""
+    h = hashlib.sha256()
+
+    for target in files:
+        h.update(str(target).encode())
+        h.update(str(file_digest(target)).encode())
+
+    h.update(json.dumps(values, sort_keys=True, default=str).encode())
+
+    return h.hexdigest()
+
+
+def cache_path(
+    namespace: Annotated[str, Field(description="Cache namespace")],
+    key: Annotated[Optional[str], Field(description="Cache key")] = None,
+):
+    """Get the path for a cache namespace or a cache entry"""
+    root = path_join(_global.CACHE_DIR, namespace)
+
+    if key is None:
+        return root
+
+    return path_join(root, f"{key}.pickle")
+
+
+def cache_load(
+    namespace: Annotated[str, Field(description="Cache namespace")],
+    key: Annotated[str, Field(description="Cache key")],
+    default: Annotated[Optional[Any], Field(description="Value returned on a cache miss")] = None,
+    force: Annotated[bool, Field(description="If read even with SOS_CACHE=0 - for state that is not a cache")] = False,
+):
+    """Load an object from the disk cache"""
+    if not _global.CACHE_ENABLE and not force:
+        return default
+
+    target = cache_path(namespace, key)
+
+    if not path_exists(target):
+        return default
+
+    try:
+        with open(target, "rb") as f:
+            return safe_load(f)
+
+    except Exception as exc:
+        log_warning(f"CACHE LOAD ERROR: {target} - {exc}")
+        return default
+
+
+def cache_save(
+    namespace: Annotated[str, Field(description="Cache namespace")],
+    key: Annotated[str, Field(description="Cache key")],
+    obj: Annotated[Any, Field(description="Plain data to store - dicts, lists, tuples, scalars and paths")],
+    force: Annotated[bool, Field(description="If write even with SOS_CACHE=0 - for state that is not a cache")] = False,
+):
+    """Store an object in the disk cache"""
+    if not _global.CACHE_ENABLE and not force:
+        return False
+
+    target = cache_path(namespace, key)
+
+    try:
+        makedirs(cache_path(namespace), exist_ok=True)
+
+        # write then rename so a concurrent reader never sees a partial file
+        _target = f"{target}.{getpid()}.tmp"
+        with open(_target, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        replace(_target, target)
+
+    except Exception as exc:
+        log_warning(f"CACHE SAVE ERROR: {target} - {exc}")
+        return False
+
+    cache_prune(namespace)
+
+    return True
+
+
+def cache_prune(
+    namespace: Annotated[str, Field(description="Cache namespace")],
+    size: Annotated[Optional[int], Field(description="Number of entries to keep")] = None,
+):
+    """Remove the oldest entries of a cache namespace"""
+    size = _global.CACHE_SIZE if size is None else size
+    root = cache_path(namespace)
+
+    try:
+        entries = [path_join(root, f) for f in listdir(root) if f.endswith(".pickle")]
+        entries.sort(key=getmtime, reverse=True)
+
+        for target in entries[size:]:
+            remove(target)
+
+    except FileNotFoundError:
+        pass
+
+#
+###
@@ -8,6 +8,12 @@ from collections import ChainMap
 from os import environ, getcwd, chdir, listdir
 from os.path import join as path_join
 from os.path import exists as path_exists
+from os.path import getmtime
+from os import replace, getpid
+from glob import glob
+import pickle
+import re
+from threading import get_ident
 
 import rich
 from omegaconf import OmegaConf, DictConfig
@@ -15,9 +21,11 @@ from pathlib import Path
 from copy import deepcopy
 
 from sos_toolkit.meta import _utils as utils
-from sos_toolkit.meta._model import ModelGet, ModelDict, ModelParams
+from sos_toolkit.meta._model import ModelGet, ModelDict, ModelParams, condition_memo
 from sos_toolkit.meta._meta import MetaConfig, MetaObject, MetaRunnable
 from sos_toolkit.meta import _global
+from sos_toolkit.meta._log import log_debug, log_info, log_warning
+from sos_toolkit.meta._trace import traced
 from sos_toolkit.meta._action import ActionConfig, ActionTask, ActionObject
 from sos_toolkit.meta._service import ServiceConfig, ServiceTask, ServiceObject
 from sos_toolkit.meta._hook import HookConfig, HookTask, HookObject
@@ -27,6 +35,8 @@ from sos_toolkit.meta._platform import get_platform
 from sos_toolkit.meta._tool import SOS_TOOL
 from sos_toolkit.meta._result import ResultData, ResultObject, ResultRepo
 from sos_toolkit.meta._utils import valid_keys
+from sos_toolkit.meta._cache import cache_key, cache_load, cache_save, safe_load
+from sos_toolkit.meta._resolve import SOS_RESOLVER
 
 from sos_toolkit.root import ROOT_PATH, TOOLKIT_PATH
 from sos_toolkit.service import SERVICE_PATH
@@ -78,6 +88,8 @@ class MetaConfig(ModelGet):
         description="The Root Config File Used")
     context_file: Optional[Union[bool, str]] = Field(default=_global.CONTEXT_FILE,
         description="The Context File Used")
+    context_binary: bool = Field(default=False,
+        description="Save the Context File in the Binary Format")
 
     # should we include these?
     # or is the file path good enough?
@@ -95,12 +107,33 @@ class SystemNamespace(ModelDict):
     __PRESERVE__ = True
     __OVERWRITE__ = False
 
+def _thread_slot(name):
+    """A context attribute with a value per thread - the branches of a parallel object do not share it"""
+    # stored apart from name => path lookups read __dict__ first and would get every thread's value
+    slot = f"_slots{name}"
+
+    def _get(self):
+        return self.__dict__.get(slot, {}).get(get_ident(), None)
+
+    def _set(self, value):
+        slots = self.__dict__.setdefault(slot, {})
+        if value is None:
+            slots.pop(get_ident(), None)
+
+        else:
+            slots[get_ident()] = value
+
+    return property(_get, _set)
+
+
 class SOSContext(ModelGet):
     """Context State for a System"""
     __PRESERVE__ = True
     __OVERWRITE__ = False
     __TARGET__ = None
-    __RESULT__ = None
+    __RESULT__ = _thread_slot("__RESULT__")
+    __tool__ = _thread_slot("__tool__")
+    __INVENTORY__ = None
 
     meta: MetaConfig = Field(description="The MetaConfig for the System")
     namespace: SystemNamespace = Field(default=SystemNamespace(),
@@ -139,10 +172,12 @@ class SOSContext(ModelGet):
         persist: Annotated[Optional[bool],
             Field(description="If persist from previous context_file")] = False,
         ignore_version: Annotated[Optional[bool],
-            Field(description="Ignore SOS-Toolkit Version Mismatch")] = True
+            Field(description="Ignore SOS-Toolkit Version Mismatch")] = True,
+        use_cache: Annotated[Optional[bool],
+            Field(description="If use the compiled context cache")] = True
     ):
         """Generate an SOSContext Object"""
-        rich.print({"GENERATE CONTEXT":
+        log_info(lambda: {"GENERATE CONTEXT":
                 {
                 "system_file":system_file,
                 "local_file":local_file,
@@ -155,6 +190,7 @@ class SOSContext(ModelGet):
                 "namespace_config":namespace_config,
                 "resolve_variables":resolve_variables,
                 "persist":persist,
+                "use_cache":use_cache,
                 }
             })
 
@@ -177,7 +213,7 @@ class SOSContext(ModelGet):
                 raise RuntimeError(e)
 
             else:
-                rich.print(f"LOAD SYSTEM_FILE: {system_file}")
+                log_debug(f"LOAD SYSTEM_FILE: {system_file}")
                 system_config = OmegaConf.load(system_file)
 
         cls._version(system_config, ignore_version)
@@ -191,11 +227,11 @@ class SOSContext(ModelGet):
             local_file = Path(local_file).absolute()
 
             if utils.valid_path(local_file):
-                rich.print(f"LOCAL_FILE: {local_file}")
+                log_debug(f"LOCAL_FILE: {local_file}")
                 local_config = OmegaConf.load(local_file)
 
             else:
-                rich.print(f"LOCAL_FILE: None")
+                log_debug(f"LOCAL_FILE: None")
                 local_file = False
                 local_config = zc({})
 
@@ -208,11 +244,11 @@ class SOSContext(ModelGet):
             user_file = Path(user_file).absolute()
 
             if utils.valid_path(user_file):
-                rich.print(f"USER_FILE: {user_file}")
+                log_debug(f"USER_FILE: {user_file}")
                 user_config = OmegaConf.load(user_file)
 
             else:
-                rich.print(f"USER_FILE: None")
+                log_debug(f"USER_FILE: None")
                 user_file = False
                 user_config = zc({})
 
@@ -225,11 +261,11 @@ class SOSContext(ModelGet):
             root_file = Path(root_file).absolute()
 
             if utils.valid_path(root_file):
-                rich.print(f"ROOT_FILE: {root_file}")
+                log_debug(f"ROOT_FILE: {root_file}")
                 root_config = OmegaConf.load(root_file)
 
             else:
-                rich.print(f"ROOT_FILE: None")
+                log_debug(f"ROOT_FILE: None")
                 root_file = False
                 root_config = zc({})
 
@@ -241,6 +277,25 @@ class SOSContext(ModelGet):
             context_file = _context_file or environ.get(_global.ENV_CONTEXT_FILE, _global.CONTEXT_FILE)
             context_file = Path(context_file).absolute()
 
+        # check the compiled context cache
+        if use_cache:
+            _key = cls._cache_key(
+                files=[system_file, local_file, user_file, root_file, context_file if persist else False],
+                values={
+                    "context_file":_context_file,
+                    "runtime_config":runtime_config,
+                    "runtime_update":runtime_update,
+                    "meta_config":meta_config,
+                    "namespace_config":namespace_config,
+                    "resolve_services":resolve_services,
+                    "resolve_variables":resolve_variables,
+                    "persist":persist,
+                })
+
+            if (config := cache_load("context", _key)) is not None:
+                log_debug(f"CONTEXT CACHE HIT: {_key}")
+                return cls.from_config(config)
+
         # check for persist
         #
         # TODO
@@ -301,8 +356,16 @@ class SOSContext(ModelGet):
             OmegaConf.update(config, key, value, force_add=True)
 
         # resolve the variables
+        # - only the interpolations whose inputs changed since the last generate of this system file
         if resolve_variables:
-            OmegaConf.resolve(config)
+            container = OmegaConf.to_container(config, resolve=False)
+            if (resolved := SOS_RESOLVER.resolve(container, key=str(system_file))) is None:
+                log_debug("RESOLVE: OMEGACONF")
+                OmegaConf.resolve(config)
+
+            else:
+                log_debug(f"RESOLVE: {len(SOS_RESOLVER.recomputed)} RECOMPUTED - {SOS_RESOLVER.reused} REUSED")
+                config = resolved
 
         # bundle the file paths
         if utils.valid_path(local_file):
@@ -347,9 +410,44 @@ class SOSContext(ModelGet):
         #config["meta"]["root_config"] = OmegaConf.to_container(root_config, resolve=False)
         #config["meta"]["runtime_config"] = OmegaConf.to_container(runtime_config, resolve=False)
 
+        if use_cache:
+            if not isinstance(config, dict):
+                config = OmegaConf.to_container(config, resolve=False)
+
+            cache_save("context", _key, config)
+
         return cls.from_config(config)
 
 
+    @staticmethod
+    def _cache_key(files, values):
+        """Build the compiled context cache key from the input files and generate arguments"""
+        # every service file can be pulled in by a sub-service
+        service_files = sorted(glob(path_join(SERVICE_PATH, "*", "platform", "*", "sos-service.yaml")))
+        files = [Path(f).as_posix() for f in files if isinstance(f, (str, Path))] + service_files
+
+        # environment values read through interpolation
+        env = {}
+        for target in files:
+            try:
+                with open(target, "r") as f:
+                    for name in re.findall(r"\$\{oc\.env:([^,}]+)", f.read()):
+                        env[name] = environ.get(name.strip(), None)
+
+            except FileNotFoundError:
+                continue
+
+        values = {
+            **values,
+            "env":env,
+            "cwd":getcwd(),
+            "platform":get_platform(),
+            "sos_version":__version__,
+            }
+
+        return cache_key(files=files, values=values)
+
+
     @classmethod
     def from_config(cls,
         config: Annotated[dict, Field(description="A dictionary for an SOSContext")]
@@ -442,9 +540,26 @@ class SOSContext(ModelGet):
         context_file = context_file or MetaConfig.__fields__["context_file"].default
         context_file = Path(context_file).absolute()
 
-        rich.print(f"LOADING CONTEXT - context_file: {context_file}")
+        log_info(f"LOADING CONTEXT - context_file: {context_file}")
+
+        config = None
+        binary_file = cls._binary_file(context_file)
+
+        if binary_file == context_file:
+            if (config := cls._binary_load(binary_file)) is None:
+                e = f"BINARY CONTEXT_FILE SCHEMA INVALID: {binary_file}"
+                raise RuntimeError(e)
 
-        config = OmegaConf.load(context_file)
+        elif path_exists(binary_file) and (not path_exists(context_file) or getmtime(binary_file) >= getmtime(context_file)):
+            # the binary file is only used while it is newer than the yaml file
+            try:
+                config = cls._binary_load(binary_file)
+
+            except Exception as exc:
+                log_warning(f"BINARY CONTEXT_FILE NOT LOADED: {binary_file} - {exc}")
+
+        if config is None:
+            config = OmegaConf.load(context_file)
 
         #
         # TODO
@@ -493,19 +608,98 @@ class SOSContext(ModelGet):
 
     def file_save(self,
         context_file: Annotated[Optional[str], Field(description="The target context_file to save to")] = None,
-        run_hooks: Annotated[Optional[bool], Field(description="If run on_context_save hooks")] = True
+        run_hooks: Annotated[Optional[bool], Field(description="If run on_context_save hooks")] = True,
+        file_format: Annotated[Optional[Literal["yaml", "binary"]], Field(description="The format to save - None uses the extension and meta.context_binary")] = None
     ):
         """Save an SOSContext object to a context_file"""
         context_file = context_file or self.get("meta.context_file", _global.CONTEXT_FILE)
 
-        rich.print(f"SAVING CONTEXT - context_file: {context_file}")
+        if file_format is None:
+            binary = Path(context_file).suffix == _global.CONTEXT_BINARY_SUFFIX or self.meta.context_binary
+            file_format = "binary" if binary else "yaml"
+
+        log_info(f"SAVING CONTEXT - context_file: {context_file} - file_format: {file_format}")
 
         if run_hooks:
             self.run("hook.on_context_save")
 
         self.__TARGET__ = None
         self.__RESULT__ = None
-        OmegaConf.save(self.dict(), context_file)
+        self.__INVENTORY__ = None
+
+        match file_format:
+            case "yaml":
+                OmegaConf.save(self.dict(), context_file)
+
+            case "binary":
+                binary_file = self._binary_file(context_file)
+                if binary_file != Path(context_file).absolute():
+                    self._yaml_supersede(context_file, binary_file)
+
+                self._binary_save(binary_file)
+
+            case _:
+                e = f"INVALID CONTEXT FILE_FORMAT: {file_format}"
+                raise RuntimeError(e)
+
+
+    @staticmethod
+    def _binary_file(context_file):
+        """Get the binary companion path for a context_file"""
+        context_file = Path(context_file).absolute()
+
+        if context_file.suffix == _global.CONTEXT_BINARY_SUFFIX:
+            return context_file
+
+        return context_file.with_name(f"{context_file.name}{_global.CONTEXT_BINARY_SUFFIX}")
+
+
+    @staticmethod
+    def _yaml_supersede(context_file, binary_file):
+        """Mark a yaml context_file as out of date while its binary companion holds the context"""
+        marker = f"{_global.CONTEXT_SUPERSEDED} {binary_file.name} - this file is stale until it is saved with file_format=yaml or edited"
+
+        try:
+            with open(context_file, "r") as f:
+                text = f.read()
+
+        except FileNotFoundError:
+            return False
+
+        if text.startswith(_global.CONTEXT_SUPERSEDED):
+            # already marked - an edit keeps the marker but makes the yaml file newer
+            return False
+
+        # written before the binary file so the binary file stays the newer one
+        with open(context_file, "w") as f:
+            f.write(f"{marker}\n{text}")
+
+        return True
+
+
+    @staticmethod
+    def _binary_load(binary_file):
+        """Load the config dict from a binary context_file - None if the schema does not match"""
+        with open(binary_file, "rb") as f:
+            header, config = safe_load(f)
+
+        if not isinstance(header, dict) or header.get("schema", None) != _global.CONTEXT_BINARY_SCHEMA:
+            log_warning(f"BINARY CONTEXT_FILE SCHEMA MISMATCH: {binary_file} - {header}")
+            return None
+
+        return config
+
+
+    def _binary_save(self, binary_file):
+        """Save the context to a binary context_file"""
+        header = {"schema":_global.CONTEXT_BINARY_SCHEMA, "sos_version":__version__}
+
+        # write then rename so a failed save never leaves a partial context
+        _binary_file = f"{binary_file}.{getpid()}.tmp"
+        with open(_binary_file, "wb") as f:
+            pickle.dump((header, self.dict()), f, protocol=5)
+
+        replace(_binary_file, binary_file)
 
 
     #
@@ -515,6 +709,7 @@ class SOSContext(ModelGet):
     # - probably need to reimplement the entire order for run actions context <=> tool <=> object
     # - => MetaRunnable
     #
+    @traced("context", lambda self, target: (f"run:{target}", {}))
     def run(self,
         target: Annotated[str, Field(description="The target object to run")]
     ):
@@ -522,11 +717,17 @@ class SOSContext(ModelGet):
         obj = self.get(target, None)
         if obj is None:
             e = f"RUN TARGET IS NONE: {target}"
-            rich.print(e)
+            log_warning(e)
             return ResultRepo(result=e)
 
         elif isinstance(obj, (MetaConfig, MetaObject, MetaRunnable)):
-            return obj(self)
+            with condition_memo() as memo:
+                result = obj(self)
+
+                if memo.depth == 1:
+                    log_debug(lambda: {"CONDITION_MEMO":{"target":target, "hits":memo.hits, "misses":memo.misses}})
+
+            return result
 
         else:
             e = f"INVALID TARGET: {target} - obj: {type(obj)}"
@@ -585,7 +786,7 @@ class SOSContext(ModelGet):
                 obj.set(key, value, overwrite=True)
 
         if len(delete):
-            rich.print(f"DELETE: {delete}")
+            log_debug(f"DELETE: {delete}")
 
             for key in delete:
                 obj.remove(key)
@@ -636,15 +837,33 @@ class SOSContext(ModelGet):
         # - which brings us back to the sos_services implementation problems
         #
         system_service = system_service or {}
+        local_service = local_service or {}
+        user_service = user_service or {}
+        root_service = root_service or {}
         runtime_service = runtime_service or {}
 
         service_set = OmegaConf.merge(system_service, runtime_service)
 
-        output_service = {}
-        while len(service_set):
-            key = list(service_set.keys())[0]
-            _system = service_set.pop(key)
-            rich.print(f"CONTEXT.SERVICE - start: {key}")
+        #
+        # DISCOVER
+        # - load every service file exactly once
+        # - a declaration from the system / runtime wins over one from a parent service
+        # - a false declaration is skipped unless another service depends on it
+        #
+        loaded = {}
+        depends_on = {}
+        pending = list(service_set.items())
+        while len(pending):
+            key, _system = pending.pop(0)
+
+            if key in loaded.keys():
+                #
+                # TODO
+                # - handle version / namespace collisions
+                #
+                # for now just ignore them since we don't have service versions
+                #
+                continue
 
             match _system:
                 case MutableMapping():
@@ -660,46 +879,8 @@ class SOSContext(ModelGet):
                     e = f"INVALID _SYSTEM: {key} - {type(_system)}"
                     raise RuntimeError(e)
 
-            #
-            # CHECK SERVICE ALREAD LOADED
-            #
-            if key in output_service.keys():
-                #
-                # TODO
-                # - handle version / namespace collisions
-                #
-                # for now just ignore them since we don't have service versions
-                #
-                continue
-
-            #
-            # CHECK SERVICE EXISTS
-            #
-            service_root = path_join(SERVICE_PATH, key)
-            if not path_exists(service_root):
-                e = f"SERVICE NOT INSTALLED: {key}"
-                raise RuntimeError(e)
-
-            #
-            # CHECK PLATFORM
-            #
-            service_platform = path_join(service_root, "platform", platform)
-            if not path_exists(service_platform):
-                default_path = path_join(service_root, "platform", "default")
-                if not path_exists(default_path):
-                    e = f"SERVICE DOES NOT SUPPORT PLATFORM AND NO DEFAULT: {platform} - {key}"
-                    raise RuntimeError(e)
-
-                else:
-                    rich.print(f"SERVICE DOES NOT SUPPORT PLATFORM - WILL ATTEMPT TO USE DEFAULT: {key}")
-                    service_platform = default_path
-                    #platform = "default"
-
-            # CHECK SERVICE FILE
-            service_file = path_join(service_platform, "sos-service.yaml")
-            if not path_exists(service_file):
-                e = f"SERVICE FILE DOES NOT EXIST: {key}"
-                raise RuntimeError(e)
+            log_debug(f"CONTEXT.SERVICE - start: {key}")
+            service_root, service_file = SOSContext._service_file(key, platform)
 
             _output = SOSContext.generate(
                 system_file=service_file,
@@ -708,44 +889,101 @@ class SOSContext(ModelGet):
                 root_file=False,
                 meta_config={"platform":platform, "system_path":service_root, "context_file":False},
                 resolve_services=False,
-                resolve_variables=False)
+                resolve_variables=False,
+                use_cache=False)
+
+            # SUB-SERVICES
+            # - the overlays can declare sub-services too
+            _sub = dict(_output.service.items())
+            for _overlay in [root_service.get(key, {}), user_service.get(key, {}), _system, local_service.get(key, {})]:
+                if isinstance(_overlay, MutableMapping):
+                    _sub.update(_overlay.get("service", {}) or {})
+
+            loaded[key] = (_output, _system)
+            depends_on[key] = []
+            for _key, _value in _sub.items():
+                if _key == key or _value is False:
+                    continue
+
+                log_debug(f"CONTEXT.SERVICE - add: {_key}")
+                depends_on[key].append(_key)
+                pending.append((_key, _value))
+
+        #
+        # SORT
+        # - dependencies before dependents, otherwise declaration order
+        #
+        order = []
+        state = {}
+
+        def _visit(key, path):
+            if state.get(key) == "done":
+                return
+
+            if state.get(key) == "visit":
+                cycle = path[path.index(key):] + [key]
+                e = f"SERVICE DEPENDENCY CYCLE: {' -> '.join(cycle)}"
+                raise RuntimeError(e)
+
+            state[key] = "visit"
+            for _key in depends_on[key]:
+                _visit(_key, path + [key])
+
+            state[key] = "done"
+            order.append(key)
+
+        for key in loaded.keys():
+            _visit(key, [])
+
+        #
+        # MERGE CONFIGS
+        #
+        output_service = {}
+        for key in order:
+            _output, _system = loaded[key]
 
-            # MERGE CONFIGS
             _root = root_service.get(key, {})
             _user = user_service.get(key, {})
             _local = local_service.get(key, {})
-            _runtime = runtime_service.get(key, {})
             _output = OmegaConf.merge(_output.dict(), _root, _user, _system, _local)
+            _output.service = {}
+
+            log_debug(f"CONTEXT.SERVICE - output: {key}")
+            output_service[key] = _output
 
-            # HANDLE SUB-SERVICES
-            _sub = False
-            for _key, _value in _output.service.items():
-                if _key not in output_service:
-                    _sub = True
+        return output_service
 
-                if _key not in service_set and _key != key:
-                    rich.print(f"CONTEXT.SERVICE - add: {_key}")
-                    service_set[_key] = _value
 
-            _output.service = {}
+    @staticmethod
+    def _service_file(key, platform):
+        """Find the sos-service.yaml of an installed service for the platform"""
+        #
+        # CHECK SERVICE EXISTS
+        #
+        service_root = path_join(SERVICE_PATH, key)
+        if not path_exists(service_root):
+            e = f"SERVICE NOT INSTALLED: {key}"
+            raise RuntimeError(e)
 
-            # OUTPUT
-            if _sub:
-                # service has dependencies
-                # - need to run them first
-                # - readd this service to the processing list
-                # - THIS COULD INFINITE LOOP IF SERVICE DEPDENDENCY FAILS
-                # - would be nice to run this check earlier so we don't need to compute the complete service
-                # - but that could retrun a false negative
-                rich.print(f"CONTEXT.SERVICE - recycle: {key}")
-                service_set[key] = _system
+        #
+        # CHECK PLATFORM
+        #
+        service_platform = path_join(service_root, "platform", platform)
+        if not path_exists(service_platform):
+            default_path = path_join(service_root, "platform", "default")
+            if not path_exists(default_path):
+                e = f"SERVICE DOES NOT SUPPORT PLATFORM AND NO DEFAULT: {platform} - {key}"
+                raise RuntimeError(e)
 
             else:
-                #
-                # service computed
-                # - add to output
-                #
-                rich.print(f"CONTEXT.SERVICE - output: {key}")
-                output_service[key] = _output
+                log_warning(f"SERVICE DOES NOT SUPPORT PLATFORM - WILL ATTEMPT TO USE DEFAULT: {key}")
+                service_platform = default_path
+                #platform = "default"
+
+        # CHECK SERVICE FILE
+        service_file = path_join(service_platform, "sos-service.yaml")
+        if not path_exists(service_file):
+            e = f"SERVICE FILE DOES NOT EXIST: {key}"
+            raise RuntimeError(e)
 
-        return output_service
+        return service_root, service_file
@@ -1,8 +1,30 @@
 ###
 #
 from os import environ
+from os.path import join as path_join
+from pathlib import Path
 DEBUG_ENABLE = environ.get("SOS_DEBUG", False)
 ALLOW_DELETE = environ.get("SOS_DELETE", True)
+LAZY_LOAD = environ.get("SOS_LAZY_LOAD", "1") not in ["0", "false", "False"]
+CACHE_ENABLE = environ.get("SOS_CACHE", "1") not in ["0", "false", "False"]
+CACHE_DIR = environ.get("SOS_CACHE_DIR", path_join(Path.home(), ".cache", "sos-toolkit"))
+CACHE_SIZE = int(environ.get("SOS_CACHE_SIZE", 64))
+PATH_CACHE_SIZE = int(environ.get("SOS_PATH_CACHE_SIZE", 4096))
+PARALLEL_WORKERS = int(environ.get("SOS_PARALLEL_WORKERS", 8))
+DOCKER_POOL_SIZE = int(environ.get("SOS_DOCKER_POOL_SIZE", 32))
+DOCKER_INVENTORY_TTL = float(environ.get("SOS_DOCKER_INVENTORY_TTL", 5))
+CACHE_BUST_TTL = float(environ.get("SOS_CACHE_BUST_TTL", 300))
+CACHE_BUST_TIMEOUT = float(environ.get("SOS_CACHE_BUST_TIMEOUT", 10))
+GIT_MIRROR_DIR = environ.get("SOS_GIT_MIRROR_DIR", path_join(CACHE_DIR, "git"))
+GIT_MIRROR_TTL = float(environ.get("SOS_GIT_MIRROR_TTL", 60))
+GIT_STATUS_TTL = float(environ.get("SOS_GIT_STATUS_TTL", 5))
+LOG_LEVEL = environ.get("SOS_LOG_LEVEL", "DEBUG" if DEBUG_ENABLE else "INFO")
+LOG_QUIET = environ.get("SOS_QUIET", "0") not in ["", "0", "false", "False"]
+LOG_FILE = environ.get("SOS_LOG_FILE", None)
+LOG_FILE_LEVEL = environ.get("SOS_LOG_FILE_LEVEL", "DEBUG")
+
+# trace every runnable / object / tool call - .folded writes flamegraph stacks, else Chrome trace JSON
+TRACE_FILE = environ.get("SOS_TRACE_FILE", None)
 
 #
 ###
@@ -37,5 +59,13 @@ LOCAL_FILE = "sos-local.yaml"
 ROOT_FILE = "sos-root.yaml"
 CONTEXT_FILE = "sos-context.yaml"
 
+CONTEXT_BINARY_SUFFIX = ".pickle"
+CONTEXT_BINARY_SCHEMA = 1
+CONTEXT_SUPERSEDED = "# SUPERSEDED BY"
+
+# generated tool / action manifest stored in the tool and action package
+MANIFEST_FILE = "_manifest.json"
+MANIFEST_SCHEMA = 1
+
 #
 ###
\ No newline at end of file
@@ -0,0 +1,165 @@
+###
+#
+import json
+import rich
+import rich.markup
+
+from threading import Lock
+from time import time
+from types import FunctionType
+
+from sos_toolkit.meta import _global
+
+#
+###
+
+###
+#
+# quiet mode keeps warnings and errors - QUIET is above every level and silences the console
+LEVELS = {"DEBUG":10, "INFO":20, "WARNING":30, "ERROR":40, "QUIET":100}
+
+_LOCK = Lock()
+_STATE = {"console":None, "file":None, "sink":None, "sink_level":None}
+
+#
+###
+
+###
+#
+def _level(level):
+    if isinstance(level, int):
+        return level
+
+    if (value := LEVELS.get(str(level).upper(), None)) is None:
+        e = f"INVALID LOG LEVEL: {level} - valid: {list(LEVELS.keys())}"
+        raise RuntimeError(e)
+
+    return value
+
+
+def _plain(message):
+    """Markup free text for the sink"""
+    try:
+        return rich.markup.render(message).plain
+
+    except Exception:
+        return message
+
+
+def _default(obj):
+    """JSON fallback - models as their fields, anything else as text"""
+    if hasattr(obj, "model_dump"):
+        try:
+            return obj.model_dump()
+
+        except Exception:
+            pass
+
+    return str(obj)
+
+
+def _configure():
+    """Read the globals the first time anything is logged"""
+    if _STATE["console"] is None:
+        log_config()
+
+
+def log_config(level=None, log_file=None, file_level=None, quiet=None):
+    """Set the console level, the JSON-lines sink and quiet mode - unset arguments come from the globals"""
+    level = _global.LOG_LEVEL if level is None else level
+    log_file = _global.LOG_FILE if log_file is None else log_file
+    file_level = _global.LOG_FILE_LEVEL if file_level is None else file_level
+    quiet = _global.LOG_QUIET if quiet is None else quiet
+
+    with _LOCK:
+        _STATE["console"] = max(_level(level), LEVELS["WARNING"]) if quiet else _level(level)
+        _STATE["sink_level"] = _level(file_level)
+
+        if log_file != _STATE["file"]:
+            if _STATE["sink"] is not None:
+                _STATE["sink"].close()
+
+            _STATE["file"] = log_file
+            _STATE["sink"] = open(log_file, "a", buffering=1) if log_file else None
+
+    return {"level":_STATE["console"], "log_file":_STATE["file"], "file_level":_STATE["sink_level"]}
+
+
+def log_enabled(level):
+    """If a message at level is rendered anywhere - check before building an expensive payload"""
+    _configure()
+    level = _level(level)
+
+    return level >= _STATE["console"] or (_STATE["sink"] is not None and level >= _STATE["sink_level"])
+
+
+def _record(level, message):
+    """Write a message to the JSON-lines sink - console renderables like rules have nothing to record"""
+    if hasattr(message, "__rich_console__"):
+        return
+
+    record = {
+        "time":time(),
+        "level":next((k for k, v in LEVELS.items() if v >= level), "QUIET"),
+        "message":_plain(message) if isinstance(message, str) else message,
+        }
+
+    line = json.dumps(record, default=_default)
+    with _LOCK:
+        if _STATE["sink"] is not None:
+            _STATE["sink"].write(line + "\n")
+
+
+def log(level, message):
+    """Log a message or payload - a function message (a lambda) is only called when the level is enabled
+
+    only plain functions are lazy - callable objects like runnables and models are logged as they are
+    """
+    _configure()
+    level = _level(level)
+
+    console = level >= _STATE["console"]
+    sink = _STATE["sink"] is not None and level >= _STATE["sink_level"]
+    if not console and not sink:
+        return
+
+    if isinstance(message, FunctionType):
+        message = message()
+
+    if console:
+        rich.print(message)
+
+    if sink:
+        _record(level, message)
+
+
+def log_print(message):
+    """Print output the user asked for - the console level and quiet mode do not apply, the sink records it at INFO"""
+    _configure()
+
+    if isinstance(message, FunctionType):
+        message = message()
+
+    rich.print(message)
+
+    if _STATE["sink"] is not None and LEVELS["INFO"] >= _STATE["sink_level"]:
+        _record(LEVELS["INFO"], message)
+
+
+def log_debug(message):
+    log("DEBUG", message)
+
+
+def log_info(message):
+    log("INFO", message)
+
+
+def log_warning(message):
+    log("WARNING", message)
+
+
+def log_error(message):
+    log("ERROR", message)
+
+#
+###
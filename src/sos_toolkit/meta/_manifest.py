@@ -0,0 +1,226 @@
+###
+#
+from typing import Optional, Any, Dict, List, Annotated
+from pydantic import Field
+
+import ast
+import json
+
+from os import listdir, replace, getpid
+from os.path import isdir, basename, join, dirname, abspath
+
+from sos_toolkit.meta import _global
+from sos_toolkit.meta._cache import file_digest, cache_key, cache_load, cache_save
+from sos_toolkit.meta._log import log_debug, log_error
+from sos_toolkit.meta._model import ModelGet
+
+#
+###
+
+###
+#
+class ManifestParam(ModelGet):
+    key: str = Field(description="Parameter Name")
+    description: Optional[str] = Field(default=None, description="Parameter Description")
+    kind: str = Field(default="Any", description="Parameter Type as Source")
+    default: Optional[Any] = Field(default=None, description="Parameter Default")
+    required: bool = Field(default=True, description="If the Parameter has no Default")
+
+
+class ManifestEntry(ModelGet):
+    namespace: str = Field(description="Registry Namespace")
+    key: str = Field(description="Registry Key")
+    module: str = Field(description="Import Path of the Module that Registers the Key")
+    description: Optional[str] = Field(default=None, description="Function Description")
+    sos_schema: List[ManifestParam] = Field(default=[], description="Function Parameters")
+
+#
+###
+
+###
+#
+def _annotation(node):
+    """Split an Annotated[kind, Field(description=...)] node into (kind, description)"""
+    if node is None:
+        return "Any", None
+
+    if isinstance(node, ast.Subscript) and ast.unparse(node.value) in ["Annotated", "typing.Annotated"]:
+        elts = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        kind = ast.unparse(elts[0])
+        description = None
+
+        for meta in elts[1:]:
+            if isinstance(meta, ast.Call):
+                for kw in meta.keywords:
+                    if kw.arg == "description" and isinstance(kw.value, ast.Constant):
+                        description = kw.value.value
+
+        return kind, description
+
+    return ast.unparse(node), None
+
+
+def _default(node):
+    try:
+        return ast.literal_eval(node)
+
+    except Exception:
+        # non-literal defaults are only known once the module is imported
+        return ast.unparse(node)
+
+
+def _schema(function):
+    args = function.args
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+
+    params = list(zip(positional, defaults)) + list(zip(args.kwonlyargs, args.kw_defaults))
+
+    schema = []
+    for arg, default in params:
+        kind, description = _annotation(arg.annotation)
+        schema.append(ManifestParam(
+            key=arg.arg,
+            description=description,
+            kind=kind,
+            default=None if default is None else _default(default),
+            required=default is None))
+
+    return schema
+
+
+def manifest_file(
+    file: Annotated[str, Field(description="Python file to scan")],
+    module: Annotated[str, Field(description="Import path of the file")],
+    namespace: Annotated[str, Field(description="Registry namespace for the file")],
+    decorator: Annotated[str, Field(description="Name of the registering decorator")],
+):
+    """Statically scan a python file for registered functions without importing it"""
+    with open(file, "r") as f:
+        tree = ast.parse(f.read(), filename=file)
+
+    output = []
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+
+        if not any(ast.unparse(d).split(".")[-1] == decorator for d in node.decorator_list):
+            continue
+
+        output.append(ManifestEntry(
+            namespace=namespace,
+            key=node.name,
+            module=module,
+            description=ast.get_docstring(node, clean=False),
+            sos_schema=_schema(node)))
+
+    return output
+
+
+def _manifest_read(target):
+    """The stored manifest file - None if it is missing or unreadable"""
+    try:
+        with open(target, "r") as f:
+            return json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+
+def _manifest_files(stored, package, decorator):
+    """The file records of a stored manifest - {} if it was made by another schema, package or decorator"""
+    if not isinstance(stored, dict) or stored.get("schema") != _global.MANIFEST_SCHEMA or stored.get("package") != package or stored.get("decorator") != decorator:
+        return {}
+
+    return stored.get("files", {})
+
+
+def _manifest_write(target, manifest):
+    """Store the manifest file in the package - only done by the `sos-toolkit manifest` command"""
+    try:
+        # write then rename so a concurrent start never reads a partial file
+        _target = f"{target}.{getpid()}.tmp"
+        with open(_target, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True, default=repr)
+            f.write("\n")
+
+        replace(_target, target)
+        return True
+
+    except OSError as exc:
+        log_debug(f"MANIFEST NOT SAVED: {target} - {exc}")
+        return False
+
+
+def generate_manifest(
+    root_path: Annotated[str, Field(description="Directory containing the namespace packages")],
+    package: Annotated[str, Field(description="Import path of root_path")],
+    decorator: Annotated[str, Field(description="Name of the registering decorator")],
+    rebuild: Annotated[bool, Field(description="If scan every file instead of reusing the stored manifest")] = False,
+    save: Annotated[bool, Field(description="If store the manifest as MANIFEST_FILE in root_path - build time only")] = False,
+):
+    """Generate the registry manifest for every namespace package under root_path
+
+    The manifest stored as MANIFEST_FILE in root_path ships with the package and is never written at
+    runtime. Each file is only scanned again when its digest no longer matches the shipped one, and
+    the regenerated manifest is kept in the user cache so the next start can reuse it
+    """
+    namespaces = sorted([m for m in listdir(root_path) if isdir(join(root_path, m)) and not m.startswith("_")])
+
+    files = []
+    for namespace in namespaces:
+        file_list = sorted([basename(f)[:-3] for f in listdir(join(root_path, namespace)) if basename(f).endswith(".py") and not basename(f).startswith("_")])
+        files.extend((namespace, file) for file in file_list)
+
+    target = join(root_path, _global.MANIFEST_FILE)
+    key = cache_key(values={"root":abspath(root_path), "package":package, "decorator":decorator})
+
+    shipped = {} if rebuild else _manifest_files(_manifest_read(target), package, decorator)
+    cached = {} if rebuild else _manifest_files(cache_load("manifest", key), package, decorator)
+
+    record = {}
+    output = []
+    for namespace, file in files:
+        name = f"{namespace}/{file}.py"
+        digest = file_digest(join(root_path, namespace, f"{file}.py"))
+
+        # hashing the files is much cheaper than parsing them
+        for known in [shipped, cached]:
+            if (entry := known.get(name, None)) is not None and entry.get("digest") == digest:
+                entries = [ManifestEntry(**e) for e in entry["entries"]]
+                break
+
+        else:
+            try:
+                entries = manifest_file(
+                    file=join(root_path, namespace, f"{file}.py"),
+                    module=f"{package}.{namespace}.{file}",
+                    namespace=namespace,
+                    decorator=decorator)
+
+            except Exception as exc:
+                # not stored => the error is reported again on the next start
+                log_error(f"MANIFEST ERROR: {namespace} - {file} - {exc}")
+                continue
+
+        record[name] = {"digest":digest, "entries":[e.model_dump() for e in entries]}
+        output.extend(entries)
+
+    manifest = {
+        "schema":_global.MANIFEST_SCHEMA,
+        "package":package,
+        "decorator":decorator,
+        "files":record,
+        }
+
+    if save:
+        _manifest_write(target, manifest)
+
+    elif record != shipped and record != cached:
+        # the package may be read-only or shared => changes go to the user cache
+        cache_save("manifest", key, manifest)
+
+    return output
+
+#
+###
@@ -15,24 +15,35 @@ from typing import (
     _CallableType
     )
 
-from pydantic import BaseModel, Field, create_model, validate_call, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, create_model, validate_call, field_validator
 from inspect import signature as inspect_signature
 from collections.abc import MutableMapping, Sequence
 from types import MethodType
+from importlib import import_module
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from threading import RLock
+from functools import lru_cache
+
+import json
+import operator
 
-import rich
-from copy import deepcopy
 from pathlib import PosixPath
 from os.path import join as path_join
 
 from sos_toolkit.meta import _global
 from sos_toolkit.meta._exception import RuntimeBreak
-from sos_toolkit.meta._model import ModelGet, ModelDict, ModelParams
-from sos_toolkit.meta._utils import valid_keys, is_idx, parse_idx, ipython_portal
+from sos_toolkit.meta._log import log_debug, log_error
+from sos_toolkit.meta._trace import span, traced
+from sos_toolkit.meta._model import ModelGet, ModelDict, ModelParams, PathTrie, condition_check, is_model
+from sos_toolkit.meta._utils import valid_keys, is_idx, parse_idx, compile_path, ipython_portal
 from sos_toolkit.meta._result import ResultRepo, ResultObject
 
+# keys are popped before their module registers them - other threads wait for the import
+_MANIFEST_LOCK = RLock()
+
 class MetaRepo(ModelDict):
     __OBJECT__: ClassVar[ModelGet] = ModelGet
+    __MANIFEST__ = None
 
     @classmethod
     def register(cls, namespace: Annotated[str, Field(description="Namespace for Repo")]
@@ -43,8 +54,104 @@ class MetaRepo(ModelDict):
         return create_model(f"{cls.__name__}_{namespace}", __base__=cls)()
 
 
+    def add_manifest(self,
+        entry: Annotated[Any, Field(description="ManifestEntry for a key that is not loaded yet")]
+    ):
+        """Add a pending key that is imported on first access"""
+        valid_keys(entry.key)
+
+        if self.__MANIFEST__ is None:
+            self.__MANIFEST__ = {}
+
+        self.__MANIFEST__[entry.key] = entry
+
+
+    def load_manifest(self,
+        key: Annotated[Optional[str], Field(description="Pending key to load - all if None")] = None
+    ):
+        """Import the modules for pending manifest keys"""
+        with _MANIFEST_LOCK:
+            if not self.__MANIFEST__:
+                return False
+
+            if key is None:
+                modules = sorted(set(entry.module for entry in self.__MANIFEST__.values()))
+
+            elif (entry := self.__MANIFEST__.get(key, None)) is not None:
+                modules = [entry.module]
+
+            else:
+                return False
+
+            for module in modules:
+                # remove every key the module provides before importing it
+                # - the module registers them itself while it is imported
+                for _key in [k for k, v in self.__MANIFEST__.items() if v.module == module]:
+                    self.__MANIFEST__.pop(_key)
+
+                try:
+                    import_module(module)
+
+                except Exception as exc:
+                    log_error(f"MANIFEST LOAD ERROR: {module} - {exc}")
+                    continue
+
+            return True
+
+
+    def __getattr__(self, name):
+        try:
+            return super().__getattr__(name)
+
+        except AttributeError:
+            if name.startswith("_"):
+                raise
+
+        # another thread may be importing the module - retry once it is done
+        self.load_manifest(name)
+        return super().__getattr__(name)
+
+
+    def keys(self):
+        loaded = list(super().keys())
+        return loaded + [k for k in (self.__MANIFEST__ or {}) if k not in loaded]
+
+
+    def values(self):
+        self.load_manifest()
+        return super().values()
+
+
+    def items(self):
+        self.load_manifest()
+        return super().items()
+
+
 class MetaRoot(ModelDict):
     __REPO_OBJECT__: ClassVar[MetaRepo] = MetaRepo
+    __MANIFEST__ = None
+
+    def add_manifest(self,
+        entries: Annotated[List, Field(description="List of ManifestEntry objects")]
+    ):
+        """Register ManifestEntry objects so their modules are only imported on first access"""
+        if self.__MANIFEST__ is None:
+            self.__MANIFEST__ = []
+
+        for entry in entries:
+            valid_keys(entry.namespace)
+
+            if (repo := self.get(entry.namespace, None)) is None:
+                repo = self.__REPO_OBJECT__.register(namespace=entry.namespace)
+                self.set(entry.namespace, repo)
+
+            repo.add_manifest(entry)
+            self.__MANIFEST__.append(entry)
+
+    def load_manifest(self):
+        """Import every pending manifest module"""
+        for repo in list(self.values()):
+            repo.load_manifest()
 
     def register(self,
         function: Annotated[Callable, Field(description="Target function")],
@@ -182,90 +289,373 @@ class MetaSchema(ModelDict):
 
 
 
+class ConditionPredicate:
+    """A MetaCondition compiled into a single path lookup and a comparison
+
+    Calling it never mutates the condition - keys lists the context paths it reads
+    """
+    __slots__ = ("keys", "_path", "_key", "_test", "_children", "_inverse")
+
+    def __init__(self, key, test, inverse=False, children=None):
+        self._key = key
+        self._path = None if key is None else compile_path(key)
+        self._test = test
+        self._children = children
+        self._inverse = inverse
+
+        if children is None:
+            self.keys = (key,)
+
+        else:
+            self.keys = tuple(dict.fromkeys(k for child in children for k in child.keys))
+
+
+    def value(self, context):
+        """The context value the condition compares - None if it does not exist"""
+        if is_model(context):
+            return context._get_path(self._path, None, True)
+
+        return context.get(self._key, None)
+
+
+    def __call__(self, context):
+        if self._children is not None:
+            return self._test(child(context) for child in self._children) is not self._inverse
+
+        return bool(self._test(self.value(context))) is not self._inverse
+
+
+def _number(value, valid):
+    """Compare numeric strings from yaml / env values as numbers"""
+    if isinstance(value, str) and isinstance(valid, (int, float)) and not isinstance(valid, bool):
+        try:
+            return float(value)
+
+        except ValueError:
+            pass
+
+    return value
+
+
+def _ordered(op, valid):
+    def test(value):
+        try:
+            return op(_number(value, valid), valid)
+
+        except TypeError:
+            # missing or incomparable values fail the condition
+            return False
+
+    return test
+
+
+def _range(valid):
+    if not isinstance(valid, list) or len(valid) != 2:
+        e = f"RANGE CONDITION REQUIRES [LOW, HIGH]: {valid}"
+        raise RuntimeError(e)
+
+    low, high = valid
+
+    def test(value):
+        if value is None:
+            # an open range still needs a value
+            return False
+
+        try:
+            value = _number(value, low if low is not None else high)
+            return (low is None or low <= value) and (high is None or value <= high)
+
+        except TypeError:
+            return False
+
+    return test
+
+
+# comparisons over the results of child conditions
+_COMBINATORS = {
+    "any":any,
+    "all":all,
+    "none":lambda results: not any(results),
+    }
+
+_ORDERED = {
+    "<":operator.lt,
+    ">":operator.gt,
+    "<=":operator.le,
+    ">=":operator.ge,
+    }
+
+
 class MetaCondition(ModelGet):
     label: Optional[str] = Field(default=None, description="Label for the Condition Object")
-    ctx_key: str = Field(description="Target")
+    ctx_key: Optional[str] = Field(default=None, description="Target - not used by any / all / none")
     #
     # TODO
     # - constrain list to bool / str
-    # - allow conditions to be different comparison
     #
-    valid: Optional[Union[bool, str, List]] = Field(default=None, description="Valid Values for Condition to be True")
-    comparison: Optional[Literal["in", "equal", "range", "=", "<", ">", ">=", "<="]] = Field(default="in", description="Comparison Type for Condition")
+    valid: Optional[Union[bool, int, float, str, List]] = Field(default=None, description="Valid Values for Condition to be True")
+    comparison: Optional[Literal["in", "equal", "range", "=", "<", ">", ">=", "<=", "any", "all", "none"]] = Field(default="in", description="Comparison Type for Condition")
+    conditions: List["MetaCondition"] = Field(default=[], description="Child Conditions for any / all / none")
     raise_exc: bool = Field(default=True, description="If raise on condition false")
     is_inverse: bool = Field(default=False, description="If return inverse result")
-    context_value: Optional[Any] = Field(default=None, description="Value Used for Resolve")
-    result: Optional[bool] = Field(default=None, description="Result of Resolve")
+    _predicate: Optional[ConditionPredicate] = PrivateAttr(default=None)
+
+    def content(self):
+        """The fields that decide the result - conditions with the same content share a predicate"""
+        return [self.ctx_key, self.comparison, self.valid, self.is_inverse, [c.content() for c in self.conditions]]
+
+
+    def compile(self):
+        """The predicate for this condition - conditions are read only once compiled"""
+        # read the private dict directly - pydantic private attr access is slow for a per check call
+        if (predicate := self.__pydantic_private__["_predicate"]) is not None:
+            return predicate
+
+        # identical conditions across runnables share one predicate => one condition memo entry
+        predicate = _shared_predicate(_Keyed(("content", json.dumps(self.content(), default=str)), self._build))
+
+        self._predicate = predicate
+        return predicate
 
-    def resolve(self, context, raise_exc: Optional[bool] = None):
-        if raise_exc is None:
-            raise_exc = self.raise_exc
 
+    def _build(self):
         match self.comparison:
-            case "in" | "equal":
+            case "in" | "equal" | "=":
+                # a list of valid values is a membership test - None in valid matches a missing key
                 if isinstance(self.valid, list):
-                    list_none = None in self.valid
+                    valid = self.valid
+                    test = lambda value: value in valid
 
                 else:
-                    list_none = False
+                    valid = self.valid
+                    test = lambda value: value == valid
 
-                if self.valid is None or list_none:
-                    if (_value := context.get(self.ctx_key, None)) is not None and context.has(self.ctx_key):
-                        if isinstance(self.valid, list) and _value is not None:
-                            self.context_value = _value
-                            if _value in self.valid:
-                                self.result = True
+            case "<" | ">" | "<=" | ">=":
+                if isinstance(self.valid, list) or self.valid is None:
+                    e = f"COMPARISON REQUIRES A SINGLE VALID VALUE: {self.comparison} - {self.valid}"
+                    raise RuntimeError(e)
 
-                            else:
-                                self.result = False
-                                #EXC
+                test = _ordered(_ORDERED[self.comparison], self.valid)
 
-                        else:
-                            self.context_value = _value
-                            self.result = False
-                            #EXC
+            case "range":
+                test = _range(self.valid)
 
-                    else:
-                        self.context_value = _value
-                        self.result = True
+            case "any" | "all" | "none":
+                children = [c.compile() for c in self.conditions]
+                return ConditionPredicate(None, _COMBINATORS[self.comparison], self.is_inverse, children)
 
-                else:
-                    _value = context.get(self.ctx_key, None)
-                    self.context_value = _value
-                    if isinstance(self.valid, list):
-                        if _value not in self.valid:
-                            self.result = False
-                            #EXC
+            case _:
+                e = f"COMPARISON NOT IMPLEMENTED FOR CONDITION: {self.comparison}"
+                raise RuntimeError(e)
 
-                        else:
-                            self.result = True
+        if self.ctx_key is None:
+            e = f"CONDITION REQUIRES A CTX_KEY: {self.label} - {self.comparison}"
+            raise RuntimeError(e)
 
-                    else:
-                        if _value != self.valid:
-                            self.result = False
-                            #EXC
+        return ConditionPredicate(self.ctx_key, test, self.is_inverse)
 
-                        else:
-                            self.result = True
 
-                e1 = self.is_inverse and self.result == True
-                e2 = not self.is_inverse and self.result == False
-                if raise_exc and (e1 or e2):
-                    e = f"CONDITION FAILED: {self} - {e1} - {e2}"
-                    raise ValueError(e)
+    def __eq__(self, other):
+        # compiled or not, conditions are equal by their fields
+        return isinstance(other, MetaCondition) and self.__dict__ == other.__dict__
 
-                elif e1:
-                    return False
 
-                elif self.is_inverse:
-                    return True
+    def __getstate__(self):
+        # the predicate is rebuilt on first use
+        state = super().__getstate__()
+        return {**state, "__pydantic_private__":{**(state["__pydantic_private__"] or {}), "_predicate":None}}
 
-                else:
-                    return self.result
 
-            case _:
-                e = f"COMPARISON NOT IMPLEMENTED FOR CONDITION: {self.comparison}"
-                raise RuntimeError(e)
+    def resolve(self, context, raise_exc: Optional[bool] = None):
+        if raise_exc is None:
+            raise_exc = self.raise_exc
+
+        if (result := self.compile()(context)) is False and raise_exc:
+            e = f"CONDITION FAILED: {self}"
+            raise ValueError(e)
+
+        return result
+
+
+class _Keyed:
+    """Hashed and compared by key alone - build makes the value on a cache miss"""
+    __slots__ = ("key", "build")
+
+    def __init__(self, key, build):
+        self.key = key
+        self.build = build
+
+
+    def __hash__(self):
+        return hash(self.key)
+
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+@lru_cache(maxsize=_global.PATH_CACHE_SIZE)
+def _shared_predicate(keyed):
+    """Compiled conditions by content / condition dicts by their dumped dict"""
+    return keyed.build()
+
+
+def condition_predicate(condition):
+    """Compiled predicate for a MetaCondition or a condition dict - dicts are compiled once per content"""
+    if isinstance(condition, MetaCondition):
+        return condition.compile()
+
+    key = json.dumps(condition, sort_keys=True, default=str)
+    return _shared_predicate(_Keyed(("dict", key), lambda: MetaCondition(**condition).compile()))
+
+
+def condition_resolve(condition, context, raise_exc=None):
+    """MetaCondition.resolve for a MetaCondition or a condition dict"""
+    predicate = condition_predicate(condition)
+
+    if raise_exc is None:
+        raise_exc = condition.raise_exc if isinstance(condition, MetaCondition) else condition.get("raise_exc", True)
+
+    if (result := predicate(context)) is False and raise_exc:
+        e = f"CONDITION FAILED: {condition}"
+        raise ValueError(e)
+
+    return result
+
+
+class PathLookup:
+    """A single precompiled source lookup - default replaces a None value unless allow_none"""
+    __slots__ = ("key", "path", "default", "has_default", "allow_none")
+
+    def __init__(self, key, default=None, has_default=False, allow_none=False):
+        self.key = key
+        self.default = default
+        self.has_default = has_default
+        self.allow_none = allow_none
+
+        try:
+            self.path = compile_path(key)
+
+        except Exception:
+            # not a valid path => let get raise / return the default
+            self.path = None
+
+
+    def value(self, value):
+        if value is None and self.has_default and not self.allow_none:
+            return self.default
+
+        return value
+
+
+    def __call__(self, source):
+        if self.path is not None and is_model(source):
+            return self.value(source._get_path(self.path, self.default, self.has_default))
+
+        elif self.has_default:
+            return self.value(source.get(self.key, self.default))
+
+        return self.value(source.get(self.key))
+
+
+    def _apply(self, fetched):
+        return self.value(next(fetched))
+
+
+class _Constant:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+    def __call__(self, source):
+        return self.value
+
+
+    def _apply(self, fetched):
+        return self.value
+
+
+class ResolvePlan:
+    """A MetaResolvable compiled into source lookups and a final combinator
+
+    Calling it never mutates the resolvable or its data
+    """
+    __slots__ = ("_steps", "_targets", "_combine")
+
+    def __init__(self, steps, targets=None, combine=None):
+        self._steps = steps
+        self._targets = targets
+        self._combine = combine
+
+
+    def lookups(self):
+        """Every PathLookup of the plan in the order it runs them"""
+        output = []
+        for step in self._steps:
+            if isinstance(step, PathLookup):
+                output.append(step)
+
+            elif isinstance(step, ResolvePlan):
+                output.extend(step.lookups())
+
+        return output
+
+
+    def __call__(self, source):
+        if self._combine is None:
+            return self._steps[0](source)
+
+        return self._combine(self._targets, [step(source) for step in self._steps])
+
+
+    def _apply(self, fetched):
+        """Run the plan on values already fetched for its lookups"""
+        if self._combine is None:
+            return self._steps[0]._apply(fetched)
+
+        return self._combine(self._targets, [step._apply(fetched) for step in self._steps])
+
+
+class MapPlan:
+    """A list of MetaResolvables compiled into one PathTrie over all their sources
+
+    The sources are fetched in one traversal and the results are written with one set_many
+    """
+    __slots__ = ("_plans", "_targets", "_trie", "parents")
+
+    def __init__(self, resolvables):
+        self._plans = [r.compile() for r in resolvables]
+        self._targets = [None if r.result is None else compile_path(r.result) for r in resolvables]
+
+        # the objects a dotted target writes into
+        self.parents = list(dict.fromkeys(t[:-1] for t in self._targets if t is not None and len(t) > 1))
+
+        lookups = [lookup for plan in self._plans for lookup in plan.lookups()]
+        if any(lookup.path is None for lookup in lookups):
+            self._trie = None
+
+        else:
+            self._trie = PathTrie([(lookup.path, lookup.default, lookup.has_default) for lookup in lookups])
+
+
+    def __call__(self, source, result=None):
+        if self._trie is None or not is_model(source):
+            values = [plan(source) for plan in self._plans]
+
+        else:
+            fetched = iter(source.get_many(self._trie))
+            values = [plan._apply(fetched) for plan in self._plans]
+
+        if result is not None:
+            result.set_many([(t, v) for t, v in zip(self._targets, values) if t is not None], overwrite=True)
+
+        return values
+
+
+def _objects(targets, values):
+    return dict(zip(targets, values))
 
 
 # TODO
@@ -282,54 +672,56 @@ class MetaResolvable(ModelGet):
     path_join: Optional[bool] = Field(default=False, description="If Path Join Objects")
     to_list: Optional[bool] = Field(default=False, description="If return list of values")
     allow_none: Optional[bool] = Field(default=False, description="If return None or Default")
+    _plan: Optional[ResolvePlan] = PrivateAttr(default=None)
+
+    def compile(self):
+        """The plan for this resolvable - resolvables are read only once compiled"""
+        # private attr access through pydantic is slow - this runs for every mapped param
+        if (plan := self.__pydantic_private__["_plan"]) is not None:
+            return plan
 
-    def __call__(self, source, result = None):
-        # handle source
         match self.data:
             case str():
-                if self.default:
-                    if (value := source.get(self.data, self.default)) is None and not self.allow_none:
-                        value = self.default
-
-                else:
-                    value = source.get(self.data)
+                plan = ResolvePlan([PathLookup(self.data, self.default, bool(self.default), self.allow_none)])
 
             case Sequence():
-                objects = {}
+                steps = []
+                targets = []
                 for (n, obj) in enumerate(self.data):
-                    # TODO
-                    # - test this
                     # allow recursive resolvables
                     if "label" in obj.keys():
-                        _target = obj.pop("result", str(n))
-                        value = MetaResolvable(**obj)(source)
+                        targets.append(obj.get("result", str(n)))
+                        nested = MetaResolvable(**{k:v for k, v in obj.items() if k != "result"}).compile()
+                        steps.append(nested)
+                        continue
 
-                    elif (_source := obj.get("source", None)) is None:
-                        _target = obj.get("target", str(n))
-                        value = obj.get("default")
+                    targets.append(obj.get("target", str(n)))
+                    if (_source := obj.get("source", None)) is None:
+                        steps.append(_Constant(obj.get("default")))
 
                     elif (_default := obj.get("default", None)) is not None:
-                        _target = obj.get("target", str(n))
-                        if (value := source.get(_source, default=_default)) is None and not self.allow_none:
-                            value = _default
+                        steps.append(PathLookup(_source, _default, True, self.allow_none))
 
                     else:
-                        _target = obj.get("target", str(n))
-                        value = source.get(_source)
+                        steps.append(PathLookup(_source))
 
-                    objects[_target] = value
+                # repeated targets keep the last value in the position of the first
+                unique = len(set(targets)) == len(targets)
 
                 if self.path_join:
-                    value = path_join(*objects.values())
+                    combine = (lambda t, v: path_join(*v)) if unique else (lambda t, v: path_join(*_objects(t, v).values()))
 
                 elif self.format_string is not None:
-                    value = self.format_string.format(**objects)
+                    format_string = self.format_string
+                    combine = lambda t, v: format_string.format(**_objects(t, v))
 
                 elif self.to_list:
-                    value = list(objects.values())
+                    combine = (lambda t, v: v) if unique else (lambda t, v: list(_objects(t, v).values()))
 
                 else:
-                    value = objects
+                    combine = _objects
+
+                plan = ResolvePlan(steps, targets, combine)
 
             case MutableMapping():
                 if (_source := self.data.get("source", None)) is None:
@@ -337,19 +729,36 @@ class MetaResolvable(ModelGet):
                         e = f"NO SOURCE OR DEFAULT PROVIDED - LABEL: {self.label}"
                         raise RuntimeError(e)
 
-                    value = _default
+                    plan = ResolvePlan([_Constant(_default)])
 
                 elif (_default := self.data.get("default", None)) is not None:
-                     if (value := source.get(_source, default=_default)) is None and not self.allow_none:
-                        value = _default
+                    plan = ResolvePlan([PathLookup(_source, _default, True, self.allow_none)])
 
                 else:
-                    value = source.get(_source)
+                    plan = ResolvePlan([PathLookup(_source)])
 
             case _:
-                e = f"INVALID SOURCE TYPE: {type(source)} - LABEL: {self.label}"
+                e = f"INVALID SOURCE TYPE: {type(self.data)} - LABEL: {self.label}"
                 raise RuntimeError(e)
 
+        self._plan = plan
+        return plan
+
+
+    def __eq__(self, other):
+        # compiled or not, resolvables are equal by their fields
+        return isinstance(other, MetaResolvable) and self.__dict__ == other.__dict__
+
+
+    def __getstate__(self):
+        # the plan is rebuilt on first use
+        state = super().__getstate__()
+        return {**state, "__pydantic_private__":{**(state["__pydantic_private__"] or {}), "_plan":None}}
+
+
+    def __call__(self, source, result = None):
+        value = self.compile()(source)
+
         # result
         if self.result is not None and result is not None:
             result.set(self.result, value, overwrite=True)
@@ -357,7 +766,6 @@ class MetaResolvable(ModelGet):
         return value
 
 
-
 #
 # TODO
 # - allow a condition to be a runnable object => result True / False
@@ -373,6 +781,8 @@ class MetaRunnable(ModelGet):
     context_map: Optional[List[MetaResolvable]] = Field(default=[], description="List of MetaResolvable Objects to map from Context to Params")
     result_map: Optional[List[MetaResolvable]] = Field(default=[], description="List of MetaResolvable Objects ot map from Result to Context")
     callbacks: Optional[List[Union["MetaRunnable", "MetaObject", "MetaConfig"]]] = Field(default=[], description="List of Callbacks")
+    depends_on: List[str] = Field(default=[], description="Sibling keys that must finish first in a parallel object")
+    _maps: Optional[tuple] = PrivateAttr(default=None)
 
     @field_validator("condition")
     @classmethod
@@ -401,20 +811,37 @@ class MetaRunnable(ModelGet):
             raise ValueError("CONDITION INVALID")
 
 
+    def compile_maps(self):
+        """(context_map, result_map) as MapPlans - the maps are read only once compiled"""
+        if (maps := self.__pydantic_private__["_maps"]) is None:
+            maps = self._maps = (MapPlan(self.context_map or []), MapPlan(self.result_map or []))
+
+        return maps
+
+
+    def __eq__(self, other):
+        # compiled or not, runnables are equal by their fields
+        return isinstance(other, MetaRunnable) and self.__dict__ == other.__dict__
+
+
+    def __getstate__(self):
+        # the maps are rebuilt on first use
+        state = super().__getstate__()
+        return {**state, "__pydantic_private__":{**(state["__pydantic_private__"] or {}), "_maps":None}}
+
+
     def check_enabled(self, __CTX__):
         if self.disabled:
             return False
 
         for cond in self.condition:
-            if not isinstance(cond, MetaCondition):
-                cond = MetaCondition(**cond)
-
-            if cond.resolve(context=__CTX__, raise_exc=False) is False:
+            if condition_check(condition_predicate(cond), __CTX__) is False:
                 return False
 
         return True
 
 
+    @traced("runnable", lambda self, __CTX__: (_label(self), {"tool":self.tool}))
     def __call__(self, __CTX__):
         #
         # TODO
@@ -422,17 +849,17 @@ class MetaRunnable(ModelGet):
         # - direct disable vs condition
         # - not easy to do since that gets run in check_enabled not here
         #
-        rich.print(f"METARUNNABLE.__CALL__ :::: {self.label}")
+        log_debug(lambda: f"METARUNNABLE.__CALL__ :::: {self.label}")
         result = None
         try:
             if not self.check_enabled(__CTX__=__CTX__):
-                rich.print(f"NOT RUNNING OBJECT - NOT ENABLED: {self.label}")
+                log_debug(lambda: f"NOT RUNNING OBJECT - NOT ENABLED: {self.label}")
                 return ResultObject(condition=self.condition)
 
             # initial run
             result = self._run(__CTX__)
-            callbacks = deepcopy(self.callbacks)
-            callbacks.reverse()
+            # callbacks are only read - the stack holds references
+            callbacks = list(reversed(self.callbacks))
             result = self._result(__CTX__, result)
 
             # callbacks
@@ -443,30 +870,28 @@ class MetaRunnable(ModelGet):
                     # TODO
                     # - metaobj labels
                     #
-                    rich.print(f"CALLBACK METAOBJ - {type(cb)}")
+                    log_debug(lambda: f"CALLBACK METAOBJ - {type(cb)}")
                     cb.__LABEL__ = f"CB::{self.__LABEL__}"
-                    result = cb(__CTX__)
+                    with span(f"CB::{_label(self)}", "callback"):
+                        result = cb(__CTX__)
 
                 else:
                     if not cb.check_enabled(__CTX__=self):
-                        rich.print(f"NOT RUNNING CALLBACK - NOT ENABLED: {cb}")
+                        log_debug(lambda: f"NOT RUNNING CALLBACK - NOT ENABLED: {cb}")
                         continue
 
                     else:
-                        rich.print(f"CALLBACK._RUN :::: {cb.label}")
+                        log_debug(lambda: f"CALLBACK._RUN :::: {cb.label}")
 
-                    result = cb._run(__CTX__)
-                    result = cb._result(__CTX__, result)
+                    with span(f"CB::{_label(cb)}", "callback", tool=cb.tool):
+                        result = cb._run(__CTX__, result)
+                        result = cb._result(__CTX__, result)
 
                 # add callback => callbacks
-                _cb = cb.get("callbacks", [])
-                _cb.reverse()
-                callbacks.extend(_cb)
+                callbacks.extend(reversed(cb.get("callbacks", [])))
 
                 # add result callbacks => callbacks
-                _cb = result.get("callbacks", [])
-                _cb.reverse()
-                callbacks.extend(_cb)
+                callbacks.extend(reversed(result.get("callbacks", [])))
 
             __CTX__.set("__RESULT__", None, True)
 
@@ -479,7 +904,7 @@ class MetaRunnable(ModelGet):
             #
             # if debug => breakpoint else raise / handle_exc
             #
-            rich.print({"RUN_ERROR":
+            log_error(lambda: {"RUN_ERROR":
                 {
                 "label":self.label,
                 "exc_type":type(exc),
@@ -492,8 +917,25 @@ class MetaRunnable(ModelGet):
             raise
 
 
-    def _run(self, __CTX__):
-        """Run this Object"""
+    def resolve_params(self, __CTX__):
+        """The params this Object would call its tool with"""
+        # per-invocation overlay
+        # - the shallow copy keeps the top level keys of the runnable template untouched
+        # - dotted context_map targets copy the objects they write into first
+        # - model_dump hands the tool fresh containers
+        params = self.params.model_copy()
+        context_map = self.compile_maps()[0]
+        if len(context_map.parents):
+            params.detach_paths(context_map.parents)
+
+        context_map(__CTX__, params)
+
+        return params
+
+
+    @traced("run", lambda self, __CTX__, result=None: ("run", {"tool":self.tool}))
+    def _run(self, __CTX__, result=None):
+        """Run this Object - result overrides __CTX__.__RESULT__ for callbacks"""
 
         ####
         # TODO - CIRCULAR_IMPORT
@@ -503,41 +945,39 @@ class MetaRunnable(ModelGet):
         #
         ###
 
-        tool = deepcopy(self.tool)
-        params = deepcopy(self.params)
-        context_map = deepcopy(self.context_map)
+        params = self.resolve_params(__CTX__)
         _tool = SOS_TOOL.get(self.tool)
 
-        for obj in context_map:
-            obj(__CTX__, params)
-
         if "__RESULT__" in _tool.sos_schema.keys():
-            if __CTX__.__RESULT__ is None:
-                e = f"TOOL EXPECTS A RESULTOBJECT BUT NONE PROVIDED: {tool}"
+            if result is None and (result := __CTX__.__RESULT__) is None:
+                e = f"TOOL EXPECTS A RESULTOBJECT BUT NONE PROVIDED: {self.tool}"
                 raise RuntimeError(e)
 
-            params.set("__RESULT__", __CTX__.__RESULT__, True)
+            params.set("__RESULT__", result, True)
 
         # call tool
+        # - call the bound method directly, __CTX__.__tool__ is per thread
         if "__CTX__" in _tool.sos_schema.keys():
             try:
-                setattr(__CTX__, "__tool__", MethodType(_tool, __CTX__))
-                result = __CTX__.__tool__(**params.dict())
+                method = MethodType(_tool, __CTX__)
+                setattr(__CTX__, "__tool__", method)
+                result = method(**params.model_dump())
 
             finally:
                 setattr(__CTX__, "__tool__", None)
 
         else:
-            result = _tool(**params.dict())
+            result = _tool(**params.model_dump())
 
         return result
 
 
+    @traced("result", lambda self, __CTX__, result: ("result", {"tool":self.tool}))
     def _result(self, __CTX__, result):
         """Parse a result object"""
-        tool = deepcopy(self.tool)
-        params = deepcopy(self.params)
-        result_map = deepcopy(self.result_map)
+        # the result gets its own copy - whatever reads it can not reach the template
+        tool = self.tool
+        params = self.params.model_copy(deep=True)
 
         if result is None:
             result = ResultObject(called_tool=tool, called_params=params, data=None)
@@ -560,9 +1000,7 @@ class MetaRunnable(ModelGet):
             result = ResultObject(called_tool=tool, called_params=params, data={"result":result})
 
         __CTX__.set("__RESULT__", result, True)
-
-        for obj in result_map:
-            obj(result.data, __CTX__)
+        self.compile_maps()[1](result.data, __CTX__)
 
         return result
 
@@ -590,7 +1028,10 @@ class MetaObject(ModelDict):
                     for key, obj in config.items():
                         # TODO::__TARGET__
                         # TODO::__LABEL__
-                        if key == "__TARGET__":
+                        if key in META_KEYS:
+                            _meta_key(result, key, obj)
+
+                        elif key == "__TARGET__":
                             result.set(key, obj)
 
                         else:
@@ -609,11 +1050,12 @@ class MetaObject(ModelDict):
         return result
 
 
+    @traced("object", lambda self, __CTX__: (_label(self), {}))
     def __call__(self, __CTX__):
         result = ResultRepo()
 
         if self.get("disabled", False):
-            rich.print(f"NOT RUNNING OBJECT - NOT ENABLED: {self.__LABEL__}")
+            log_debug(lambda: f"NOT RUNNING OBJECT - NOT ENABLED: {self.__LABEL__}")
 
         else:
             # TODO::__TARGET__
@@ -621,11 +1063,24 @@ class MetaObject(ModelDict):
                 raise NotImplementedError()
                 __CTX__.set("__TARGET__", target)
 
+            if self.get("__parallel__", False):
+                children = []
+                for key, obj in self.items():
+                    if key in META_KEYS:
+                        continue
+
+                    if isinstance(obj, MutableMapping) and not isinstance(obj, (MetaObject, MetaConfig)):
+                        obj = MetaRunnable(**obj)
+
+                    children.append((key, obj))
+
+                return run_graph(self, children, __CTX__)
+
             for key, obj in self.items():
-                if key == "disabled":
+                if key in META_KEYS:
                     continue
 
-                rich.print(f"METAOBJECT.__CALL__.{self.__LABEL__}.{key}")
+                log_debug(lambda: f"METAOBJECT.__CALL__.{self.__LABEL__}.{key}")
 
                 if isinstance(obj, (MetaRunnable, MetaObject, MetaConfig)):
                     _result = obj(__CTX__)
@@ -668,7 +1123,10 @@ class MetaConfig(ModelDict):
                 for key, obj in config.items():
                     # TODO::__TARGET__
                     # TODO::__LABEL__
-                    if key == "__TARGET__":
+                    if key in META_KEYS:
+                        _meta_key(result, key, obj)
+
+                    elif key == "__TARGET__":
                         result.set(key, obj)
 
                     else:
@@ -680,11 +1138,12 @@ class MetaConfig(ModelDict):
 
         return result
 
+    @traced("config", lambda self, __CTX__: (_label(self), {}))
     def __call__(self, __CTX__):
         result = ResultRepo()
 
         if self.get("disabled", False):
-            rich.print(f"NOT RUNNING OBJECT - NOT ENABLED: {self.__LABEL__}")
+            log_debug(lambda: f"NOT RUNNING OBJECT - NOT ENABLED: {self.__LABEL__}")
 
         else:
             # TODO::__CONDITION__
@@ -692,9 +1151,16 @@ class MetaConfig(ModelDict):
             if (target := self.get("__TARGET__", None)):
                 __CTX__.set("__TARGET__", target)
 
+            if self.get("__parallel__", False):
+                children = [(key, obj) for key, obj in self.items() if key not in META_KEYS]
+                return run_graph(self, children, __CTX__)
+
             for key, obj in self.items():
+                if key in META_KEYS:
+                    continue
+
                 if isinstance(obj, (MetaRunnable, MetaObject, MetaConfig)):
-                    rich.print(f"METACONFIG.__CALL__.{self.__LABEL__}.{key}")
+                    log_debug(lambda: f"METACONFIG.__CALL__.{self.__LABEL__}.{key}")
                     _result = obj(__CTX__)
                     result.set(key, _result)
 
@@ -709,4 +1175,117 @@ class MetaConfig(ModelDict):
         return result
 
 
+###
+#
+# keys of a MetaObject / MetaConfig that configure the object instead of naming a child
+# - dunder names => a child called parallel / depends_on is still a child
+META_KEYS = ["disabled", "__parallel__", "__depends_on__"]
+
+
+def _meta_key(obj, key, value):
+    """Set a META_KEY - dunder names go to the extras so dict() / the context file keep them"""
+    obj.__pydantic_extra__[key] = value
+
+
+def _label(obj):
+    """Span name of a runnable / object / config"""
+    return getattr(obj, "label", None) or getattr(obj, "__LABEL__", None) or getattr(obj, "tool", None) or type(obj).__name__
+
+
+def _dependencies(parent, children):
+    """Map each child key to the sibling keys it waits for"""
+    depends_on = parent.get("__depends_on__", None)
+    if not isinstance(depends_on, MutableMapping):
+        depends_on = {}
+
+    output = {}
+    for key, obj in children:
+        # runnables carry depends_on, objects a __depends_on__ key, the parent a mapping for interpolated children
+        deps = list(depends_on.get(key, []))
+        if isinstance(obj, (MetaRunnable, MetaObject, MetaConfig)):
+            own = obj.depends_on if isinstance(obj, MetaRunnable) else obj.get("__depends_on__", None)
+            if isinstance(own, Sequence) and not isinstance(own, str):
+                deps.extend(d for d in own if d not in deps)
+
+        for d in deps:
+            if d not in [k for k, _ in children]:
+                e = f"INVALID DEPENDENCY: {d} - {key} - {parent.__LABEL__}"
+                raise RuntimeError(e)
+
+        output[key] = deps
+
+    # reject cycles before anything runs
+    ready = [k for k, d in output.items() if not d]
+    done = set()
+    while ready:
+        done.add(ready.pop())
+        ready.extend(k for k, d in output.items() if k not in done and k not in ready and all(x in done for x in d))
+
+    if len(done) != len(output):
+        e = f"DEPENDENCY CYCLE: {[k for k in output if k not in done]} - {parent.__LABEL__}"
+        raise RuntimeError(e)
+
+    return output
+
+
+def _branch(obj, __CTX__, result):
+    """Run one child on a worker thread - it starts from the __RESULT__ of the thread that scheduled it"""
+    __CTX__.set("__RESULT__", result, True)
+    try:
+        return obj(__CTX__)
+
+    finally:
+        __CTX__.set("__RESULT__", None, True)
+
+
+def run_graph(parent, children, __CTX__):
+    """Run the children of a parallel MetaObject / MetaConfig as a dependency graph on a thread pool"""
+    for key, obj in children:
+        if not isinstance(obj, (MetaRunnable, MetaObject, MetaConfig)):
+            e = f"INVALID OBJ TYPE: {type(obj)} - {key} - {parent.__LABEL__}"
+            raise RuntimeError(e)
+
+    depends_on = _dependencies(parent, children)
+
+    parallel = parent.get("__parallel__")
+    workers = parallel if isinstance(parallel, int) and not isinstance(parallel, bool) else _global.PARALLEL_WORKERS
+    workers = max(1, workers)
+
+    pending = dict(children)
+    done = {}
+    stop = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while True:
+            # a RuntimeBreak stops scheduling - running branches still finish
+            # - only fill free workers so nothing sits queued behind a break
+            if not stop:
+                ready = [k for k in pending if all(d in done for d in depends_on[k])]
+                for key in ready[:workers - len(running)]:
+                    log_debug(lambda: f"PARALLEL.__CALL__.{parent.__LABEL__}.{key}")
+                    running[pool.submit(_branch, pending.pop(key), __CTX__, __CTX__.get("__RESULT__", None))] = key
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = running.pop(future)
+                done[key] = future.result()
+
+                if isinstance(done[key], RuntimeBreak):
+                    stop = True
+
+    # results keep the declared order
+    result = ResultRepo()
+    for key, _ in children:
+        if key in done:
+            result.set(key, done[key])
+
+    return result
+
+#
+###
+
+
 MetaRunnable.update_forward_refs()
@@ -2,11 +2,210 @@ from typing import Literal, Callable, ClassVar, Type, List, Optional, Union, Any
 from pydantic import BaseModel, Field, create_model, validate_call, field_validator
 from inspect import signature as inspect_signature
 from collections.abc import MutableMapping, Sequence
+from contextlib import contextmanager
+from threading import Lock
 
 import rich
 import omegaconf
 
-from sos_toolkit.meta._utils import valid_keys, is_idx, parse_idx
+from sos_toolkit.meta._utils import valid_keys, is_idx, parse_idx, compile_path
+
+_MISSING = object()
+
+# ModelGet types seen by is_model - pydantic's metaclass instancecheck is slow on the lookup path
+_MODEL_TYPES = set()
+
+###
+#
+# the condition memo of the active run - path versions are only kept while a run is active
+_MEMO = None
+_MEMO_LOCK = Lock()
+
+# dict => ModelDict conversions that write back into the parent - parallel branches share the context
+_CONVERT_LOCK = Lock()
+
+#
+###
+
+def is_model(obj):
+    """isinstance(obj, ModelGet) with the checked types cached"""
+    if (_type := type(obj)) in _MODEL_TYPES:
+        return True
+
+    if isinstance(obj, ModelGet):
+        _MODEL_TYPES.add(_type)
+        return True
+
+    return False
+
+
+def _versions_path(path):
+    """Compiled path => tuple of keys and list idx - "foo[0].bar" => ("foo", 0, "bar")"""
+    out = []
+    for segment, key, idx, valid in path:
+        out.append(key)
+        if idx is not None:
+            out.append(idx)
+
+    return tuple(out)
+
+
+class PathVersions:
+    """Write versions of the paths of one object
+
+    tree counts the writes at or below a path, node counts the writes that replace a path
+    roots holds the first keys of the paths conditions read - writes anywhere else are not counted
+    """
+    __slots__ = ("tree", "node", "roots")
+
+    def __init__(self):
+        self.tree = {}
+        self.node = {}
+        self.roots = set()
+
+
+    def bump(self, path):
+        tree = self.tree
+        for n in range(1, len(path) + 1):
+            key = path[:n]
+            tree[key] = tree.get(key, 0) + 1
+
+        self.node[path] = self.node.get(path, 0) + 1
+
+
+    def token(self, path):
+        """Changes when the value at path can have changed - a write at or below it, or one replacing a parent"""
+        node = self.node
+        return (self.tree.get(path, 0), *[node.get(path[:n], 0) for n in range(1, len(path))])
+
+
+class ConditionMemo:
+    """Results of conditions for a run keyed by condition identity and the versions of the paths it reads"""
+    __slots__ = ("depth", "versions", "results", "paths", "hits", "misses", "lock")
+
+    def __init__(self):
+        self.depth = 0
+        self.lock = Lock()
+        self.versions = {}
+        self.results = {}
+        self.paths = {}
+        self.hits = 0
+        self.misses = 0
+
+
+    def bump(self, obj, path):
+        # only objects a condition was checked against are tracked
+        if (versions := self.versions.get(id(obj), None)) is not None and path[0][1] in versions[1].roots:
+            # parallel branches write the same context - no count is lost
+            with self.lock:
+                versions[1].bump(_versions_path(path))
+
+
+    def _paths(self, keys):
+        if (paths := self.paths.get(keys, None)) is None:
+            paths = self.paths[keys] = tuple(_versions_path(compile_path(key)) for key in keys)
+
+        return paths
+
+
+    def check(self, predicate, context):
+        """predicate(context) - reused while none of predicate.keys were written through the context"""
+        keys = predicate.keys
+        if None in keys:
+            return predicate(context)
+
+        if (versions := self.versions.get(id(context), None)) is None:
+            # only ModelGet objects report their writes
+            if not is_model(context):
+                return predicate(context)
+
+            # keep a reference so the id is not reused during the run
+            versions = self.versions[id(context)] = (context, PathVersions())
+
+        # watch the paths before reading their versions so no write in between is missed
+        paths = self._paths(keys)
+        versions[1].roots.update(path[0] for path in paths)
+        token = tuple(versions[1].token(path) for path in paths)
+        memo_key = (id(predicate), id(context))
+
+        if (entry := self.results.get(memo_key, None)) is not None and entry[0] is predicate and entry[1] == token:
+            self.hits += 1
+            return entry[2]
+
+        # the token is taken before the call - a write during the call invalidates the entry
+        self.misses += 1
+        result = predicate(context)
+        self.results[memo_key] = (predicate, token, result)
+
+        return result
+
+
+@contextmanager
+def condition_memo():
+    """Activate the condition memo - nested runs share the memo of the outermost run"""
+    global _MEMO
+    with _MEMO_LOCK:
+        if _MEMO is None:
+            _MEMO = ConditionMemo()
+
+        memo = _MEMO
+        memo.depth += 1
+
+    try:
+        yield memo
+
+    finally:
+        with _MEMO_LOCK:
+            memo.depth -= 1
+            if memo.depth == 0:
+                _MEMO = None
+
+
+class PathTrie:
+    """Compiled paths merged on their shared prefixes - built once, walked by ModelGet.get_many
+
+    paths is a list of (compiled path, default, has_default)
+    a node is [children by segment, paths ending at the node, paths at or below the node]
+    """
+    __slots__ = ("paths", "root")
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.root = [{}, [], []]
+
+        for n, (path, default, has_default) in enumerate(paths):
+            node = self.root
+            node[2].append(n)
+            for segment in path:
+                if (child := node[0].get(segment, None)) is None:
+                    child = node[0][segment] = [{}, [], []]
+
+                node = child
+                node[2].append(n)
+
+            node[1].append(n)
+
+
+    @classmethod
+    def from_names(cls, names):
+        """names are dot notation strings or (name, default) pairs"""
+        paths = []
+        for name in names:
+            if isinstance(name, str):
+                paths.append((compile_path(name), None, False))
+
+            else:
+                paths.append((compile_path(name[0]), name[1], True))
+
+        return cls(paths)
+
+
+def condition_check(predicate, context):
+    """Evaluate a compiled condition - through the memo while a run is active"""
+    if (memo := _MEMO) is None:
+        return predicate(context)
+
+    return memo.check(predicate, context)
 
 
 class ModelGet(BaseModel):
@@ -117,68 +316,205 @@ class ModelGet(BaseModel):
 
         try:
             # will error if name is not a string
-            _name = name.split(".")
+            path = compile_path(name)
 
-            if len(_name) == 0:
-                # no name => shouldnt get here
-                raise RuntimeError()
+        except Exception:
+            if _default:
+                return default
 
-            elif len(_name) == 1:
-                # current level object
-                # check if the name includes a list index => [N]
-                if is_idx(_name[0]):
-                    # parse the name to get a list_idx [N]
-                    _obj, _idx = parse_idx(_name[0])
-                    return self._get(name=_obj).__getitem__(_idx)
+            else:
+                raise
 
-                elif _default:
-                    return self._get(name=_name[0], default=default)
+        return self._get_path(path, default, _default)
 
-                else:
-                    return self._get(name=_name[0])
 
-            else:
-                # lower level object
-                # get the current level object
-                # and generate the remainder
-                obj = self.get(_name[0])
-                rem = ".".join(_name[1:])
-
-                if isinstance(obj, omegaconf.DictConfig | dict):
-                    # make sure the obj is a ModelDict
-                    obj = ModelDict(**obj)
-                    self.set(_name[0], obj, True)
+    def _get_key(self, key, valid=True, default=None, has_default=False):
+        """Get a single key from this object"""
+        if not valid:
+            # not an identifier => use the _get dict fallback
+            if has_default:
+                return self._get(name=key, default=default)
+
+            return self._get(name=key)
+
+        # fields and extras are plain dicts - skip pydantic __getattr__ for the common case
+        # their values are never bound methods of self
+        if key in (fields := self.__dict__):
+            return fields[key]
 
-                if not callable(obj_get := getattr(obj, "get", None)):
-                    # shouldnt get here
-                    # but we want to know the type that brought us here
-                    e = f"INVALID OBJ FOR GET: {type(obj)} - {type(obj_get)}"
-                    raise RuntimeError(e)
+        if (extra := self.__pydantic_extra__) is not None and key in extra:
+            return extra[key]
 
-                if _default:
-                    return obj_get(name=rem, default=default)
+        if has_default:
+            result = getattr(self, key, default)
+
+        else:
+            result = getattr(self, key)
+
+        # not allowed to get self functions
+        if callable(result) and getattr(result, "__self__", None) is self:
+            e = f"SHADOWED CALLABLE - {key}"
+            raise ValueError(e)
+
+        return result
+
+
+    def _peek(self, name):
+        """getattr(self, name, None) - a missing name skips the AttributeError of pydantic __getattr__"""
+        if name in (fields := self.__dict__):
+            return fields[name]
+
+        if (extra := self.__pydantic_extra__) is not None and name in extra:
+            return extra[name]
+
+        if name.startswith("_") or hasattr(type(self), name):
+            # methods, class attrs and private attrs
+            return getattr(self, name, None)
+
+        return None
+
+
+    def _get_path(self, path, default=None, has_default=False):
+        """Get an object using a compiled path"""
+        obj = self
+        parent = None
+        for n, (segment, key, idx, valid) in enumerate(path):
+            try:
+                if type(obj) not in _MODEL_TYPES and not is_model(obj):
+                    if isinstance(obj, omegaconf.DictConfig | dict):
+                        # make sure the obj is a ModelDict
+                        obj = parent._convert_segment(path[n - 1])
+
+                    elif callable(obj_get := getattr(obj, "get", None)):
+                        # foreign object => let it handle the remainder
+                        rem = ".".join(p[0] for p in path[n:])
+                        if has_default:
+                            return obj_get(name=rem, default=default)
+
+                        return obj_get(name=rem)
+
+                    else:
+                        # but we want to know the type that brought us here
+                        e = f"INVALID OBJ FOR GET: {type(obj)} - {type(obj_get)}"
+                        raise RuntimeError(e)
+
+                parent = obj
+                if idx is not None:
+                    # list_idx => [N]
+                    obj = obj._get_key(key, valid).__getitem__(idx)
+
+                elif has_default and n == len(path) - 1:
+                    obj = obj._get_key(key, valid, default, True)
 
                 else:
-                    return obj_get(name=rem)
+                    obj = obj._get_key(key, valid)
 
-        except Exception as exc:
-            # TODO
-            # - this currently destroys all errors if a default was provided
-            # - need to change this to only catch the errors we want (what are those?)
-            # - or at least log them
-            #
-            if _default:
-                return default
+            except Exception as exc:
+                # TODO
+                # - this currently destroys all errors if a default was provided
+                # - need to change this to only catch the errors we want (what are those?)
+                # - or at least log them
+                #
+                if has_default:
+                    return default
+
+                else:
+                    raise
+
+        return obj
+
+
+    def get_many(self, paths):
+        """Get many objects in one traversal of their shared prefixes
+
+        paths is a PathTrie or a list of names / (name, default) pairs - returns the values in order
+        """
+        trie = paths if isinstance(paths, PathTrie) else PathTrie.from_names(paths)
+        output = [_MISSING] * len(trie.paths)
+        self._get_node(self, trie.root, trie.paths, output)
+
+        return output
+
+
+    def _get_node(self, root, node, paths, output):
+        """Walk one trie node - anything but a ModelGet chain falls back to root._get_path for the full path"""
+        for n in node[1]:
+            output[n] = self
+
+        for segment, child in node[0].items():
+            _segment, key, idx, valid = segment
+            try:
+                obj = self._get_key(key, valid)
+                if idx is not None:
+                    obj = obj.__getitem__(idx)
+
+            except Exception:
+                obj = _MISSING
+
+            if obj is not _MISSING and not len(child[0]):
+                for n in child[1]:
+                    output[n] = obj
+
+            elif obj is not _MISSING and (type(obj) in _MODEL_TYPES or is_model(obj)):
+                obj._get_node(root, child, paths, output)
 
             else:
-                raise
+                # missing, a dict to convert or a foreign object => the single path get handles it
+                for n in child[2]:
+                    path, default, has_default = paths[n]
+                    output[n] = root._get_path(path, default, has_default)
+
+
+    def map_many(self, pairs, result, overwrite=True):
+        """Get many sources from this object and set them on result - pairs of (source, target) names"""
+        pairs = list(pairs)
+        values = self.get_many([source for source, target in pairs])
+        result.set_many(zip([target for source, target in pairs], values), overwrite)
+
+        return values
+
+
+    def _set_segment(self, segment, value):
+        """Replace the object for a single compiled segment"""
+        _segment, key, idx, valid = segment
+
+        if idx is None:
+            return self._set_key(key, value, True)
+
+        self._get_key(key, valid).__setitem__(idx, value)
+
+
+    def _convert_segment(self, segment):
+        """Make the dict for a single compiled segment a ModelDict - a racing thread gets the same one"""
+        _segment, key, idx, valid = segment
+
+        with _CONVERT_LOCK:
+            obj = self._get_key(key, valid)
+            if idx is not None:
+                obj = obj[idx]
+
+            if not is_model(obj):
+                obj = ModelDict(**obj)
+                self._set_segment(segment, obj)
+
+        return obj
 
 
     def _set(self, name, value, overwrite=False, force=False):
+        result = self._set_key(name, value, overwrite, force)
+
+        # after the write => a condition checked in between is stored under the old version
+        if _MEMO is not None:
+            _MEMO.bump(self, ((name, name, None, True),))
+
+        return result
+
+
+    def _set_key(self, name, value, overwrite=False, force=False):
         valid_keys(name)
 
         # get the obj we are trying to set
-        obj = getattr(self, name, None)
+        obj = self._peek(name)
 
         # not allowed to set self functions
         if callable(obj) and getattr(obj, "__self__", None) == self:
@@ -199,87 +535,168 @@ class ModelGet(BaseModel):
 
 
     def set(self, name, value, overwrite=False):
-        _name = name.split(".")
+        path = compile_path(name)
+        result = self._set_path(path, value, overwrite)
 
-        if len(_name) == 0:
-            # no name provided
-            raise RuntimeError()
+        # after the write => a condition checked in between is stored under the old version
+        if _MEMO is not None:
+            _MEMO.bump(self, path)
+
+        return result
+
+
+    def _set_path(self, path, value, overwrite=False):
+        """Set an object using a compiled path"""
+        segment, key, idx, valid = path[0]
 
-        elif len(_name) == 1:
+        if len(path) == 1:
             # local name
             # check for list_idx
-            if is_idx(_name[0]):
+            if idx is not None:
                 # handle list object set
-                _obj, _idx = parse_idx(_name[0])
-                _obj = self.get(_obj, [])
-                _obj.__setitem__(_idx, value)
-                self._set(_name[0], value, overwrite)
+                return self._get_key(key, valid).__setitem__(idx, value)
 
-            return self._set(_name[0], value, overwrite)
+            return self._set_key(key, value, overwrite)
 
-        else:
-            # embeded object
-            # check for list_idx
-            if is_idx(_name[0]):
-                _obj, _idx = parse_idx(_name[0])
+        # embeded object
+        obj = self._set_child(path[0])
 
-                # check that the target obj name exists
-                if not self.has(_obj):
-                    # creating a new list in the obj
-                    _list = []
-                    self.set(_obj, _list, True)
+        # call set on the obj with the remainder
+        return obj._set_path(path[1:], value, overwrite)
 
-                else:
-                    # TODO
-                    # need to copy the preexisting list to make sure it updates
-                    # - how to avoid this copy
-                    _list = [*self.get(_obj)]
-                    self.set(_obj, _list, True)
+
+
+    def _set_child(self, segment):
+        """Get the object for an intermediate segment of a set - created or made a ModelDict if needed"""
+        # parallel branches create / convert the same intermediate objects
+        with _CONVERT_LOCK:
+            _segment, key, idx, valid = segment
+
+            # check for list_idx
+            if idx is not None:
+                _list = self._get_key(key, valid, _MISSING, True)
+
+                # TODO
+                # need to copy the preexisting list to make sure it updates
+                # - how to avoid this copy
+                _list = [] if _list is _MISSING else [*_list]
+                self._set_key(key, _list, True)
 
                 # make sure the list is long enough for what we are setting
                 # TODO => BUG
                 # - this won't handle list object types and instead just populates with a ModelDict
                 # - that could cause problems with using the objects latter on
                 # - should this just error?
-                while (len(_list) - 1) < _idx:
+                while (len(_list) - 1) < idx:
                     _list.append(ModelDict())
 
                 # get the object we want from the list
-                obj = _list[_idx]
+                obj = _list[idx]
                 if not isinstance(obj, ModelGet):
                     # TODO => BUG
                     # - this can't handle nested lists
                     # - possible but then we need to handle multiple idx as well [N1][N2]
                     # if the object isn't a ModelDict => make it one
                     obj = ModelDict(**obj)
-                    _list[_idx] = obj
-
-            elif not self.has(_name[0]):
-                # the object doesn't exist
-                # create a new one and set
-                obj = ModelDict()
-                self.set(_name[0], obj, True)
+                    _list[idx] = obj
 
             else:
-                # get the object
-                obj = self.get(_name[0], None)
+                obj = self._get_key(key, valid, None, True)
+
                 if obj is None:
-                    # shouldnt get here
-                    # object doesn't exist
+                    # the object doesn't exist
+                    # create a new one and set
                     obj = ModelDict()
-                    self.set(_name[0], obj, True)
+                    self._set_key(key, obj, True)
 
                 elif not isinstance(obj, ModelGet):
                     # TODO
                     # force the object to be a ModelDict
                     # - this will error on non-dict obj
                     obj = ModelDict(**obj)
-                    self.set(_name[0], obj, True)
+                    self._set_key(key, obj, True)
 
-            # generate the remainder name and call set on the obj with it
-            rem = ".".join(_name[1:])
+            return obj
 
-            return obj.set(rem, value, overwrite)
+
+    def _set_parent(self, path):
+        """The object that holds the last segment of path - intermediate objects are created as needed"""
+        obj = self
+        for segment in path[:-1]:
+            obj = obj._set_child(segment)
+
+        return obj
+
+
+    def detach_paths(self, paths):
+        """Copy the objects on the way to each compiled path so writes below them stay in this object
+
+        Objects that are missing or not containers are left for set to create. Every object is copied once
+        """
+        copied = set()
+        for path in paths:
+            obj = self
+            for n, (segment, key, idx, valid) in enumerate(path):
+                child = obj._get_key(key, valid, _MISSING, True)
+                if idx is not None:
+                    if not isinstance(child, list):
+                        break
+
+                    if path[:n + 1] not in copied:
+                        child = [*child]
+                        obj._set_key(key, child, True)
+
+                    if not -len(child) <= idx < len(child):
+                        break
+
+                    _list, child = child, child[idx]
+
+                if path[:n + 1] not in copied:
+                    if is_model(child):
+                        child = child.model_copy()
+
+                    elif isinstance(child, MutableMapping | omegaconf.DictConfig):
+                        child = ModelDict(**child)
+
+                    else:
+                        break
+
+                    copied.add(path[:n + 1])
+                    if idx is None:
+                        obj._set_key(key, child, True)
+
+                    else:
+                        _list[idx] = child
+
+                obj = child
+
+
+    def set_many(self, items, overwrite=False):
+        """Set many (name, value) pairs in one pass - the parent of each target is only resolved once
+
+        Names are dot notation strings or compiled paths. Later items win like repeated set calls
+        """
+        parents = {}
+        for name, value in items:
+            path = compile_path(name) if isinstance(name, str) else name
+
+            # a write replaces any cached parent below it
+            if len(parents):
+                for prefix in [p for p in parents if p[:len(path)] == path]:
+                    del parents[prefix]
+
+            if len(path) == 1:
+                self._set_path(path, value, overwrite)
+
+            else:
+                prefix = path[:-1]
+                if (obj := parents.get(prefix, None)) is None:
+                    obj = parents[prefix] = self._set_parent(path)
+
+                obj._set_path(path[-1:], value, overwrite)
+
+            if _MEMO is not None:
+                _MEMO.bump(self, path)
 
 
     def _remove(self, name):
@@ -290,43 +707,82 @@ class ModelGet(BaseModel):
 
             delattr(self, name)
 
+            if _MEMO is not None:
+                _MEMO.bump(self, ((name, name, None, True),))
+
 
     def remove(self, name):
-        _name = name.split(".")
+        path = compile_path(name)
+        result = self._remove_path(path)
 
-        if len(_name) == 0:
-            raise RuntimeError()
+        if _MEMO is not None:
+            _MEMO.bump(self, path)
 
-        elif len(_name) == 1:
-            return self._remove(_name[0])
+        return result
 
-        else:
-            obj = self.get(_name[0])
 
-            if not isinstance(obj, ModelGet):
-                e = f"INVALID REMOVE KEY - GET TYPE INVALID: {name} - {type(obj)}"
-                raise RuntimeError(e)
+    def _remove_path(self, path):
+        """Remove an object using a compiled path"""
+        if len(path) == 1:
+            return self._remove(path[0][0])
 
-            rem = ".".join(_name[1:])
+        obj = self._get_path(path[:1])
 
-            return obj.remove(rem)
+        if not isinstance(obj, ModelGet):
+            name = ".".join(p[0] for p in path)
+            e = f"INVALID REMOVE KEY - GET TYPE INVALID: {name} - {type(obj)}"
+            raise RuntimeError(e)
+
+        return obj._remove_path(path[1:])
 
 
     def has(self, name):
-        #
-        # TODO
-        # - make this lookup faster?
-        # - we don't need the entire get chain
-        # - we could just use the dot notation, but that won't handle lists
-        #
+        """Check if an object exists without raising"""
+        if not isinstance(name, str):
+            # coupled name/default => use the full get chain
+            try:
+                self.get(name)
+                return True
+
+            except:
+                return False
+
         try:
-            self.get(name)
+            path = compile_path(name)
+            obj = self
+            for segment, key, idx, valid in path:
+                if not isinstance(obj, ModelGet):
+                    if not isinstance(obj, MutableMapping | omegaconf.DictConfig) or key not in obj:
+                        return False
+
+                    obj = obj[key]
+
+                elif valid:
+                    # the lookup of get - fields and extras before attributes, a shadowed method raises
+                    if (obj := obj._get_key(key, valid, _MISSING, True)) is _MISSING:
+                        return False
+
+                else:
+                    # not an identifier => use the _get dict fallback
+                    try:
+                        obj = obj._get(name=key)
+
+                    except:
+                        return False
+
+                if idx is not None:
+                    if not isinstance(obj, Sequence) or not -len(obj) <= idx < len(obj):
+                        return False
+
+                    obj = obj[idx]
+
             return True
 
-        except:
+        except Exception:
             return False
 
 
+
     def print(self):
         rich.print(self)
 
@@ -0,0 +1,361 @@
+###
+#
+import re
+
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache
+
+from omegaconf import OmegaConf, DictConfig, ListConfig
+
+from sos_toolkit.meta import _global
+
+#
+###
+
+###
+#
+# ${a.b.c} references - anything else (resolvers, relative keys, nesting, escapes) is evaluated by OmegaConf
+_REFERENCE = re.compile(r"\$\{([A-Za-z0-9_\-]+(?:\.[A-Za-z0-9_\-]+)*)\}")
+# resolvers that only read their own plain arguments - any other resolver may read the config (oc.select, custom)
+_INDEPENDENT = re.compile(r"\$\{oc\.(?:env|decode):[^${}]*\}")
+_MISSING_VALUE = "???"
+_MISSING = object()
+
+
+class ResolveFallback(Exception):
+    """The config needs the complete OmegaConf.resolve"""
+
+
+@lru_cache(maxsize=_global.PATH_CACHE_SIZE)
+def parse_interpolation(expression):
+    """("ref", path) for a single reference, ("str", parts) for a string of references, None for anything else"""
+    if "\\${" in expression:
+        return None
+
+    parts = []
+    pos = 0
+    for match in _REFERENCE.finditer(expression):
+        parts.append(expression[pos:match.start()])
+        parts.append(tuple(match.group(1).split(".")))
+        pos = match.end()
+
+    parts.append(expression[pos:])
+
+    if "${" in "".join(p for p in parts if isinstance(p, str)):
+        return None
+
+    if len(parts) == 3 and parts[0] == "" and parts[2] == "":
+        return ("ref", parts[1])
+
+    return ("str", tuple(p for p in parts if p != ""))
+
+
+def _is_interpolation(value):
+    return isinstance(value, str) and "${" in value
+
+
+def _leaves(config, path=(), output=None):
+    """Flatten a plain container into {path:value} - empty containers are leaves"""
+    output = {} if output is None else output
+    match config:
+        case dict() if len(config):
+            for key, value in config.items():
+                _leaves(value, path + (key,), output)
+
+        case list() if len(config):
+            for n, value in enumerate(config):
+                _leaves(value, path + (n,), output)
+
+        case dict() | list():
+            # a copy => later writes into the config do not reach the graph
+            output[path] = type(config)()
+
+        case _:
+            output[path] = config
+
+    return output
+
+
+def _set_at(config, path, value):
+    obj = config
+    for key in path[:-1]:
+        obj = obj[key]
+
+    obj[path[-1]] = value
+
+
+class _State:
+    """The interpolation graph of one resolve - leaves, resolved values and the inputs of every interpolation"""
+    __slots__ = ("leaves", "values", "deps")
+
+    def __init__(self, leaves):
+        self.leaves = leaves
+        self.values = {}
+        self.deps = {}
+
+
+class ConfigResolver:
+    """Resolve the interpolations of a plain config container
+
+    The graph of the last config of each key is kept for the process. A later resolve of the same key only
+    recomputes the interpolations whose expression or inputs changed - recomputed lists them by dot path
+    """
+    def __init__(self, size=8):
+        self.size = size
+        self._states = OrderedDict()
+        self.recomputed = []
+        self.reused = 0
+
+
+    def clear(self):
+        self._states.clear()
+
+
+    def resolve(self, config, key=None, targets=None):
+        """Resolve config in place and return it - None if it needs the complete OmegaConf.resolve
+
+        targets limits the resolve to those dot path subtrees and the interpolations they read
+        """
+        previous = self._states.pop(key, None)
+        self.recomputed = []
+        self.reused = 0
+
+        try:
+            state = _Run(self, config, previous).run(targets)
+
+        except ResolveFallback:
+            return None
+
+        if targets is None:
+            # a partial graph can not tell what the skipped interpolations read
+            self._states[key] = state
+            while len(self._states) > self.size:
+                self._states.popitem(last=False)
+
+        return config
+
+
+class _Run:
+    """A single resolve of a container against the graph of the previous one"""
+
+    def __init__(self, resolver, config, previous):
+        self.resolver = resolver
+        self.config = config
+        self.previous = previous
+        self.state = _State(_leaves(config))
+
+        # interpolations by every prefix of their path
+        self.nodes = {}
+        for path, value in self.state.leaves.items():
+            if _is_interpolation(value):
+                for n in range(len(path) + 1):
+                    self.nodes.setdefault(path[:n], []).append(path)
+
+        self.changed = set()
+        self.changed_prefixes = set()
+        if previous is not None:
+            old, new = previous.leaves, self.state.leaves
+            for path in old.keys() | new.keys():
+                a, b = old.get(path, _MISSING), new.get(path, _MISSING)
+                if a is not b and (type(a) is not type(b) or a != b):
+                    self.changed.add(path)
+                    for n in range(len(path) + 1):
+                        self.changed_prefixes.add(path[:n])
+
+        self.clean = {}
+        self.stack = set()
+
+
+    def run(self, targets=None):
+        if targets is None:
+            pending = self.nodes.get((), [])
+
+        else:
+            pending = []
+            for target in targets:
+                pending.extend(self.nodes.get(self._normalize(tuple(target.split("."))), []))
+
+        for path in pending:
+            self.evaluate(path)
+
+        return self.state
+
+
+    def _normalize(self, path):
+        """Dot path segments => container keys - list idx as int"""
+        obj = self.config
+        output = []
+        for segment in path:
+            if isinstance(obj, list):
+                try:
+                    segment = int(segment)
+                    obj = obj[segment]
+
+                except (ValueError, IndexError):
+                    raise ResolveFallback()
+
+            elif isinstance(obj, dict) and segment in obj:
+                obj = obj[segment]
+
+            else:
+                return tuple(output) + (segment,)
+
+            output.append(segment)
+
+        return tuple(output)
+
+
+    def _raw_changed(self, path):
+        """A change at or below path, or one replacing a parent of it"""
+        if path in self.changed_prefixes:
+            return True
+
+        return any(path[:n] in self.changed for n in range(len(path)))
+
+
+    def _is_clean(self, path):
+        """An interpolation whose expression and inputs are the same as in the previous resolve"""
+        if (clean := self.clean.get(path, None)) is not None:
+            return clean
+
+        previous = self.previous
+        if previous is None or path not in previous.values or path in self.changed or path in self.stack:
+            clean = False
+
+        else:
+            self.stack.add(path)
+            clean = all(
+                (self._is_clean(dep) and dep in self.nodes) if kind == "node" else not self._raw_changed(dep)
+                for kind, dep in previous.deps[path])
+            self.stack.discard(path)
+
+        self.clean[path] = clean
+        return clean
+
+
+    def evaluate(self, path):
+        """Resolve the interpolation at path and write it into the config"""
+        state = self.state
+        if path in state.values:
+            return state.values[path]
+
+        if path in self.stack:
+            # circular interpolation => let OmegaConf raise its error
+            raise ResolveFallback()
+
+        if self._is_clean(path):
+            value = self.previous.values[path]
+            deps = self.previous.deps[path]
+            self.resolver.reused += 1
+
+        else:
+            self.stack.add(path)
+            deps = []
+            value = self._compute(state.leaves[path], deps)
+            self.stack.discard(path)
+            self.resolver.recomputed.append(".".join(str(p) for p in path))
+
+        # the stored value is private to the graph - the config gets its own copy
+        state.values[path] = value
+        state.deps[path] = deps
+        _set_at(self.config, path, deepcopy(value) if isinstance(value, (dict, list)) else value)
+
+        return value
+
+
+    def _compute(self, expression, deps):
+        match parse_interpolation(expression):
+            case ("ref", ref):
+                value = self._select(ref, deps)
+                return deepcopy(value) if isinstance(value, (dict, list)) else value
+
+            case ("str", parts):
+                return "".join(p if isinstance(p, str) else str(self._select(p, deps)) for p in parts)
+
+            case _:
+                return self._complex(expression, deps)
+
+
+    def _complex(self, expression, deps):
+        """oc.env / oc.decode without references - always recomputed, anything else needs the whole config"""
+        if "${" in _INDEPENDENT.sub("", expression):
+            raise ResolveFallback()
+
+        try:
+            value = OmegaConf.create({"value":expression})["value"]
+
+        except Exception:
+            raise ResolveFallback()
+
+        if isinstance(value, (dict, list, DictConfig, ListConfig)):
+            # a decoded container => let OmegaConf raise its error
+            raise ResolveFallback()
+
+        # never clean => an input that can not change a leaf of the config
+        deps.append(("node", ("__volatile__",)))
+        return value
+
+
+    def _select(self, ref, deps):
+        """The resolved value a reference points to - records the inputs it read"""
+        obj = self.config
+        walked = ()
+        through = False
+        for segment in ref:
+            if isinstance(obj, dict) and segment in obj:
+                key = segment
+
+            elif isinstance(obj, list):
+                try:
+                    key = int(segment)
+                    obj[key]
+
+                except (ValueError, IndexError):
+                    raise ResolveFallback()
+
+            else:
+                raise ResolveFallback()
+
+            walked = walked + (key,)
+            obj = obj[key]
+
+            if not through and walked in self.nodes and walked in self.state.leaves:
+                # another interpolation => its inputs cover everything below it
+                obj = self.evaluate(walked)
+                deps.append(("node", walked))
+                through = True
+
+        if not through:
+            deps.append(("raw", walked))
+
+            if isinstance(obj, (dict, list)):
+                # a container is referenced resolved
+                for path in self.nodes.get(walked, []):
+                    self.evaluate(path)
+                    deps.append(("node", path))
+
+                obj = self._at(walked)
+
+        if isinstance(obj, str) and obj == _MISSING_VALUE:
+            raise ResolveFallback()
+
+        return obj
+
+
+    def _at(self, path):
+        obj = self.config
+        for key in path:
+            obj = obj[key]
+
+        return obj
+
+#
+###
+
+###
+#
+SOS_RESOLVER = ConfigResolver()
+
+#
+###
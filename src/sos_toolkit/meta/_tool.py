@@ -1,9 +1,10 @@
 from typing import Optional, Dict, List, Union, Callable, Annotated
 from pydantic import BaseModel, Field
-import rich
 from pathlib import Path
 from inspect import getfile
 
+from sos_toolkit.meta._log import log_error
+from sos_toolkit.meta._trace import traced
 from sos_toolkit.meta._meta import MetaRepo, MetaRoot, MetaSchema, ModelGet, ModelDict
 from sos_toolkit.meta._utils import valid_keys
 
@@ -14,6 +15,7 @@ class ToolObject(ModelGet):
     meta: Dict = Field(default={}, description="Tool MetaData")
     function: Callable = Field(default=None, description="Tool Function")
 
+    @traced("tool", lambda self, *args, **kwargs: (self.key, {"module":self.function.__module__}))
     def __call__(self, *args, **kwargs):
         return self.function(*args, **kwargs)
 
@@ -80,7 +82,7 @@ def sos_tool(function):
 
     except Exception as exc:
         e = f"SOS_TOOL ERROR: {file} - {key} - {exc.__str__()}"
-        rich.print(e)
+        log_error(e)
 
     finally:
         return function
\ No newline at end of file
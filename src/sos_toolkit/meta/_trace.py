@@ -0,0 +1,181 @@
+###
+#
+import json
+
+from collections import defaultdict
+from functools import wraps
+from os import getpid
+from threading import Lock, local, get_ident, current_thread
+from time import perf_counter_ns
+
+from sos_toolkit.meta._exception import RuntimeBreak
+
+#
+###
+
+###
+#
+# spans are only recorded between trace_start and trace_stop
+_STATE = {"enabled":False, "origin":0}
+_EVENTS = []
+_FOLDED = defaultdict(int)
+_THREADS = {}
+_LOCK = Lock()
+_LOCAL = local()
+
+#
+###
+
+###
+#
+def _stack():
+    if (stack := getattr(_LOCAL, "stack", None)) is None:
+        stack = _LOCAL.stack = []
+
+    return stack
+
+
+def _tid():
+    ident = get_ident()
+    if (tid := _THREADS.get(ident, None)) is None:
+        with _LOCK:
+            tid = _THREADS.setdefault(ident, (len(_THREADS) + 1, current_thread().name))
+
+    return tid[0]
+
+
+def _outcome(exc_type):
+    if exc_type is None:
+        return "ok"
+
+    if issubclass(exc_type, RuntimeBreak):
+        return "break"
+
+    return f"error:{exc_type.__name__}"
+
+
+class span:
+    """Record a timed span while tracing - a no-op otherwise
+
+    Set outcome on the span to override the one taken from the exception
+    """
+    __slots__ = ("name", "cat", "args", "outcome", "start")
+
+    def __init__(self, name, cat, **args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.outcome = None
+        self.start = None
+
+
+    def __enter__(self):
+        if _STATE["enabled"]:
+            _stack().append(str(self.name))
+            self.start = perf_counter_ns()
+
+        return self
+
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.start is None:
+            return False
+
+        end = perf_counter_ns()
+        stack = _stack()
+        path = ";".join(stack)
+        stack.pop()
+
+        event = {
+            "name":str(self.name),
+            "cat":self.cat,
+            "ph":"X",
+            "ts":(self.start - _STATE["origin"]) / 1000,
+            "dur":(end - self.start) / 1000,
+            "pid":getpid(),
+            "tid":_tid(),
+            "args":{**self.args, "outcome":self.outcome or _outcome(exc_type)},
+            }
+
+        with _LOCK:
+            _EVENTS.append(event)
+            # folded stacks count self time - children are subtracted from their parent
+            _FOLDED[path] += end - self.start
+            if len(stack):
+                _FOLDED[";".join(stack)] -= end - self.start
+
+        return False
+
+
+def traced(cat, describe):
+    """Decorate a function to run inside a span - describe(*args, **kwargs) returns (name, args)
+
+    describe is only called while tracing, so an untraced call costs one dict lookup
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _STATE["enabled"]:
+                return function(*args, **kwargs)
+
+            name, span_args = describe(*args, **kwargs)
+            with span(name, cat, **span_args) as s:
+                result = function(*args, **kwargs)
+
+                # runnables return a RuntimeBreak instead of raising it
+                if isinstance(result, RuntimeBreak):
+                    s.outcome = "break"
+
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def trace_enabled():
+    return _STATE["enabled"]
+
+
+def trace_start():
+    """Drop recorded spans and start recording"""
+    with _LOCK:
+        _EVENTS.clear()
+        _FOLDED.clear()
+        _THREADS.clear()
+        _STATE["origin"] = perf_counter_ns()
+        _STATE["enabled"] = True
+
+
+def trace_stop():
+    """Stop recording and return the recorded spans"""
+    _STATE["enabled"] = False
+    return list(_EVENTS)
+
+
+def trace_export(target):
+    """Write the recorded spans as Chrome trace-event JSON, or as folded stacks for flamegraph tools if target ends with .folded"""
+    with _LOCK:
+        events = list(_EVENTS)
+        folded = dict(_FOLDED)
+        threads = dict(_THREADS)
+
+    if str(target).endswith(".folded"):
+        with open(target, "w") as f:
+            for path, ns in folded.items():
+                if ns > 0:
+                    f.write(f"{path} {ns // 1000}\n")
+
+        return target
+
+    pid = getpid()
+    meta = [{"name":"process_name", "ph":"M", "pid":pid, "tid":0, "args":{"name":"sos-toolkit"}}]
+    meta.extend({"name":"thread_name", "ph":"M", "pid":pid, "tid":tid, "args":{"name":name}} for tid, name in threads.values())
+
+    with open(target, "w") as f:
+        json.dump({"traceEvents":meta + sorted(events, key=lambda e: e["ts"]), "displayTimeUnit":"ms"}, f, default=str)
+
+    return target
+
+#
+###
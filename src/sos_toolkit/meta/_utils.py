@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 
 import rich
 import os
+from functools import lru_cache
+
+from sos_toolkit.meta import _global
 
 #
 ###
@@ -118,6 +121,21 @@ def parse_idx(x):
     _idx = int(_idx.rstrip("]"))
     return _obj, _idx
 
+@lru_cache(maxsize=_global.PATH_CACHE_SIZE)
+def compile_path(x):
+    """Parse a dot notation key once into a tuple of (segment, key, idx, valid) ops"""
+    output = []
+    for segment in x.split("."):
+        if is_idx(segment):
+            key, idx = parse_idx(segment)
+
+        else:
+            key, idx = segment, None
+
+        output.append((segment, key, idx, key.isidentifier()))
+
+    return tuple(output)
+
 
 
 #
@@ -144,9 +162,10 @@ def sos_call(func):
 # debug console
 # __import__("sos_toolkit").ipython_portal()
 #
-from IPython.terminal.embed import InteractiveShellEmbed
-
 def ipython_portal(enter_msg=None, exit_msg=None):
+    # IPython takes longer to import than the rest of sos-toolkit - only pay for it when a console opens
+    from IPython.terminal.embed import InteractiveShellEmbed
+
     _enter = "\n".join([
         "*SOS*SOS*SOS*SOS*SOS*SOS*SOS*SOS*SOS*SOS*",
         "*SOS*                               *SOS*",
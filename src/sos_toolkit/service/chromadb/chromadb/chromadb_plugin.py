@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Any, Union, List
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool
+from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, log_info
 
-import rich
 
 
 @sos_tool
@@ -10,6 +9,6 @@ def debug(
 ):
     """Test Plugin for Service Installations"""
 
-    rich.print({"chromadb.debug":True})
+    log_info(lambda: {"chromadb.debug":True})
 
     return True
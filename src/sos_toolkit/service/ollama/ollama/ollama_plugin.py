@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Any, Union, List
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool
+from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, log_info
 
-import rich
 import tqdm
 import ollama
 
@@ -16,7 +15,7 @@ def debug(
 ):
     """Test Plugin for Service Installations"""
 
-    rich.print({"ollama.debug":True})
+    log_info(lambda: {"ollama.debug":True})
 
     return True
 
@@ -26,7 +25,7 @@ def download_models(
     client_kwargs: Annotated[Optional[dict], Field(description="Kwargs for the Ollama Client")] = {}
 ):
     """Download an Ollama Model to local_data"""
-    rich.print({"ollama.download_model":
+    log_info(lambda: {"ollama.download_model":
             {
             "target":target,
             "client_kwargs":client_kwargs
@@ -42,7 +41,7 @@ def download_models(
     models = [z["name"] for z in models]
     for _target in target:
         if _target not in models:
-            rich.print(f"OLLAMA PULLING TARGET: {_target}")
+            log_info(f"OLLAMA PULLING TARGET: {_target}")
 
             current_digest, bars = "", {}
             for progress in ollama.pull(_target, stream=True):
@@ -63,7 +62,7 @@ def download_models(
               current_digest = digest
 
         else:
-            rich.print(f"OLLAMA TARGET EXISTS: {_target}")
+            log_info(f"OLLAMA TARGET EXISTS: {_target}")
 
     return True
 
@@ -76,7 +75,7 @@ def ollama_api(
 ):
     """Generate an Ollama API Call"""
 
-    rich.print({"ollama.ollama_api":
+    log_info(lambda: {"ollama.ollama_api":
             {
             "action":action,
             "action_kwargs":action_kwargs,
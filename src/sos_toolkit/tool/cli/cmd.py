@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Any, List, Dict
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool
+from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, log_info
 
-import rich
 
 import plumbum
 
@@ -13,7 +12,7 @@ def cmd_popen(
     kwargs: Annotated[Optional[Dict[str,str]], Field(description="Dict of kwargs for the Popen Constructor")] = {}
 ):
     """Run the target CMD with the provided args"""
-    rich.print({"cli.cmd_popen":
+    log_info(lambda: {"cli.cmd_popen":
             {"cmd":cmd,
              "args":args,
              "kwargs":kwargs
@@ -25,6 +24,6 @@ def cmd_popen(
     accumulator = []
     for line in _cmd.popen(args=tuple(args), **kwargs):
         accumulator.append(line)
-        rich.print(line)
+        log_info(line)
 
     return {"output":accumulator}
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Any, Dict, List, Union, Literal
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, MetaCondition
+from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, MetaCondition, condition_resolve, log_info
 
-import rich
 
 @sos_tool
 def ctx_parse(
@@ -10,7 +9,7 @@ def ctx_parse(
     targets: Annotated[Dict[str,Union[str, List, Dict]], Field(description="Key-Value Pairs to map From Context To Result")],
 ):
     """Build a dictionary from key-value pairs parsed form SOSContext"""
-    rich.print({"context.ctx_parse":
+    log_info(lambda: {"context.ctx_parse":
             {"targets":targets
              }
         })
@@ -29,7 +28,7 @@ def ctx_format(
     ctx_targets: Annotated[Dict[str, Union[str, List, Dict]], Field(description="Key-Value Pairs to extract from Context")] = {},
 ):
     """Build a F-String output by passing Key-Value Pair Input Values and Key-Value Pair SOSContext Targets"""
-    rich.print({"context.ctx_format":
+    log_info(lambda: {"context.ctx_format":
             {"format_string":format_string,
              "input_values":input_values,
              "ctx_targets":ctx_targets
@@ -46,7 +45,7 @@ def ctx_resolve(
     __CTX__: Annotated[SOSContext, Field(description="SOSContext Object")]
 ):
     """Resolve variables using an OmegaConf dict and update the SOSContext with the resolved config"""
-    rich.print({"context.ctx_resolve":True})
+    log_info(lambda: {"context.ctx_resolve":True})
     raise NotImplementedError()
     #
     # TODO
@@ -75,24 +74,14 @@ def ctx_flag(
     return_list: Annotated[bool, Field(description="Return a list of Condition Resolve Results")] = False,
 ):
     """Evaluate Condition Objects"""
-    rich.print({"context.ctx_flag":
+    log_info(lambda: {"context.ctx_flag":
             {"condition":condition,
              "raise_exc":raise_exc,
              "return_list":return_list
              }
         })
-    result = []
-    if raise_exc is not None:
-        for cond in condition:
-            if not isinstance(cond, MetaCondition):
-                cond = MetaCondition(**cond)
-            result.append(cond.resolve(context=__CTX__, raise_exc=raise_exc))
-
-    else:
-        for cond in condition:
-            if not isinstance(cond, MetaCondition):
-                cond = MetaCondition(**cond)
-            result.append(cond.resolve(context=__CTX__))
+    # each condition is compiled once - raise_exc None uses the condition's own
+    result = [condition_resolve(cond, __CTX__, raise_exc) for cond in condition]
 
     if return_list:
         return result
@@ -109,7 +98,7 @@ def ctx_set(
     overwrite: Annotated[bool, Field(description="If overwrite key")] = False,
 ):
     """Set an Object in an SOSContext.namespace"""
-    rich.print({"context.ctx_set":
+    log_info(lambda: {"context.ctx_set":
             {
             "obj":obj,
             "ctx_key":ctx_key,
@@ -128,7 +117,7 @@ def ctx_remove(
     ctx_key: Annotated[str, Field(description="Dot Notation Key of the Object in the SOSContext.namespace")],
 ):
     """Remove an object from an SOSContext.namespace"""
-    rich.print({"context.ctx_remove":
+    log_info(lambda: {"context.ctx_remove":
             {
             "ctx_key":ctx_key,
             }
@@ -148,7 +137,7 @@ def ctx_has(
     qualifier: Annotated[Literal["any", "all", "none"], Field(description="Qualifier used")] = "all"
 ):
     """Returns True if target is a child object of parent"""
-    rich.print({"context.ctx_has":
+    log_info(lambda: {"context.ctx_has":
             {
             "parent":parent,
             "target":target,
@@ -194,7 +183,7 @@ def ctx_get(
     target: Annotated[str, Field(description="Target Object")]
 ):
     """Get an Object in an SOSContext"""
-    rich.print({"context.ctx_get":
+    log_info(lambda: {"context.ctx_get":
             {
             "target":target
             }
@@ -7,12 +7,14 @@ from sos_toolkit.meta import (
     MetaObject,
     MetaConfig,
     MetaCondition,
+    condition_predicate,
+    condition_check,
     RuntimeBreak,
     ResultRepo,
-    _global
+    _global,
+    log_info
     )
 
-import rich
 from omegaconf import OmegaConf
 from os import environ
 
@@ -27,7 +29,7 @@ def runtime_object(
 ):
     """Run a target object from a context"""
 
-    rich.print({"context.runtime_object":
+    log_info(lambda: {"context.runtime_object":
             {
             "target":target,
             "context":context,
@@ -66,7 +68,7 @@ def runtime_nested(
     params: Annotated[dict, Field(description="Paramaters for the Action")] = {},
 ):
     """Run a target object from the provided context"""
-    rich.print({"context.runtime_nested":
+    log_info(lambda: {"context.runtime_nested":
             {
             "target":target,
             "params":params,
@@ -83,7 +85,7 @@ def runtime_breakpoint(
     label: Annotated[str, Field(description="Label for the breakpoint")],
 ):
     """Create a Breakpoint"""
-    rich.print({"context.runtime_breakpoint":
+    log_info(lambda: {"context.runtime_breakpoint":
             {
             "label":label
              }
@@ -101,7 +103,7 @@ def runtime_exception(
     exc_kind: Annotated[Optional[Literal["not_implemented", "runtime", "value", "type", "break"]], Field(description="Exception Kind to Create Exception")] = None,
 ):
     """Raise An Exception"""
-    rich.print({"context.runtime_exception":
+    log_info(lambda: {"context.runtime_exception":
             {
             "exc":exc,
             "exc_data":exc_data,
@@ -145,7 +147,7 @@ def runtime_match(
     """Run an Action By Matching Value to Map"""
 
     # only works for string based matches => no support for resolveable / conditions
-    rich.print({"context.runtime_match":
+    log_info(lambda: {"context.runtime_match":
             {
             "match_value":match_value
             }
@@ -184,7 +186,7 @@ def runtime_local(
 ):
     """Write a value to an sos-local.yaml file"""
 
-    rich.print({"context.runtime_local":
+    log_info(lambda: {"context.runtime_local":
             {
             "obj":obj,
             "file":file
@@ -224,7 +226,7 @@ def runtime_break(
 ):
     """If all conditions pass break out of current running action"""
 
-    rich.print({"context.runtime_break":
+    log_info(lambda: {"context.runtime_break":
             {
             "info_pass":info_pass,
             "info_break":info_break
@@ -235,10 +237,7 @@ def runtime_break(
 
     if len(resolve):
         for _res in resolve:
-            if not isinstance(_res, MetaCondition):
-                _res = MetaCondition(**_res)
-
-            _resolve.append(_res.resolve(__CTX__, raise_exc=False))
+            _resolve.append(condition_check(condition_predicate(_res), __CTX__))
 
         match qualifier:
             case "any":
@@ -256,7 +255,7 @@ def runtime_break(
 
         if _qualifier:
             if info_break:
-                rich.print(f"RUNTIME_BREAK - BREAK - {info_break}")
+                log_info(f"RUNTIME_BREAK - BREAK - {info_break}")
 
             raise RuntimeBreak(info_break, data=_resolve)
 
@@ -267,7 +266,7 @@ def runtime_break(
 
             else:
                 if info_pass:
-                    rich.print(f"RUNTIME_BREAK - PASS - {info_pass}")
+                    log_info(f"RUNTIME_BREAK - PASS - {info_pass}")
 
     else:
         raise RuntimeBreak(info_break, data=_resolve)
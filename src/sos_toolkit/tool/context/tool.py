@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Any, Dict, Literal, Callable
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, ToolRepo, ToolObject
+from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, ToolRepo, ToolObject, log_debug, log_info
 
-import rich
 
 from os import listdir
 from os.path import isdir, isfile, basename, abspath, dirname, join
@@ -16,7 +15,7 @@ def tool_remove(
     key: Annotated[str, Field(description="Key for the tool")]
 ):
     """Remove a Tool"""
-    rich.print({"context.tool_remove":
+    log_info(lambda: {"context.tool_remove":
             {
             "namespace":namespace,
             "key":key
@@ -66,7 +65,7 @@ def tool_function(
 ):
     """Register a Tool from a Function"""
 
-    rich.print({"context.tool_function":
+    log_info(lambda: {"context.tool_function":
             {
             "namespace":namespace,
             "key":key,
@@ -116,7 +115,7 @@ def tool_file(
     # - maybe just patch the tool loader before loading the file?
     # - how can we make the file use a different version of sos_tool
     #
-    rich.print({"context.tool_file":
+    log_info(lambda: {"context.tool_file":
             {
             "namespace":namespace,
             "file":file,
@@ -131,7 +130,7 @@ def tool_module(
     overwrite: Annotated[Optional[bool], Field(description="If overwrite preexisting tool")] = False
 ):
     """Register tools from a module"""
-    rich.print({"context.tool_module":
+    log_info(lambda: {"context.tool_module":
             {
             "target": target,
             "overwrite":overwrite,
@@ -144,7 +143,7 @@ def tool_module(
     # get file list
     file_list = [join(target, f) for f in listdir(target) if basename(f).endswith(".py") and not basename(f).startswith("_")]
 
-    rich.print(file_list)
+    log_debug(file_list)
 
     output = []
     for module in file_list:
@@ -154,7 +153,7 @@ def tool_module(
         _module = module_file.name[:-3]
         module_name = f"{namespace}.{_module}"
 
-        rich.print(module_file)
+        log_debug(module_file)
         spec = importlib.util.spec_from_file_location(module_name, module_file)
         module = importlib.util.module_from_spec(spec)
         sys.modules[module_name] = module
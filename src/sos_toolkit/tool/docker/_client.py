@@ -1,5 +1,38 @@
 import python_on_whales as POW
 
+from collections import OrderedDict
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import monotonic, time
+
+from sos_toolkit.meta import _global
+
+###
+#
+# clients are cheap to build but tools ask for one per call
+# - pool them by config so the probe and inventory caches can be shared
+#
+_CLIENT_POOL = OrderedDict()
+_PROBE = {}
+_INVENTORY = {}
+_GENERATION = {}
+_LOCK = Lock()
+
+INVENTORY_KINDS = ["image", "volume", "network", "container"]
+
+# client kwargs that change per call - not part of the pool / probe / inventory key
+VOLATILE_KEYS = ["compose_env_file"]
+
+#
+###
+
+###
+#
+def _client_key(kwargs):
+    return repr(sorted((k, str(v)) for k, v in kwargs.items() if k not in VOLATILE_KEYS))
+
+
 def get_client(**kwargs):
     #
     # TODO
@@ -8,7 +41,191 @@ def get_client(**kwargs):
     # - download client if we need it
     # - check docker_socket
     # - permissions / registry identities / whatever
-    # - do we have compose / buildx
     # - could be handled by the sandbox container?
 
-    return POW.DockerClient(**kwargs)
\ No newline at end of file
+    key = _client_key(kwargs)
+    volatile = {k:kwargs.pop(k) for k in VOLATILE_KEYS if k in kwargs}
+    with _LOCK:
+        if (client := _CLIENT_POOL.get(key, None)) is None:
+            client = POW.DockerClient(**kwargs)
+            _CLIENT_POOL[key] = client
+
+            # one client per compose project - keep the pool bounded
+            while len(_CLIENT_POOL) > _global.DOCKER_POOL_SIZE:
+                _CLIENT_POOL.popitem(last=False)
+
+        else:
+            _CLIENT_POOL.move_to_end(key)
+
+    if volatile:
+        # a per-call client on top of the pooled config - the pooled one is shared between threads
+        client = POW.DockerClient(client_config=replace(client.client_config, **volatile))
+
+    return client
+
+
+def probe(**kwargs):
+    """Check once per client config which docker components are available and their versions
+
+    False means the component is missing, None that the probe could not tell
+    """
+    key = _client_key(kwargs)
+    if (result := _PROBE.get(key, None)) is not None:
+        return result
+
+    client = get_client(**kwargs)
+    result = {"docker":None, "compose":None, "buildx":None}
+
+    try:
+        result["docker"] = client.version().client.version
+
+    except Exception:
+        pass
+
+    for component in ["compose", "buildx"]:
+        try:
+            if getattr(client, component).is_installed():
+                result[component] = getattr(client, component).version()
+
+            else:
+                result[component] = False
+
+        except Exception:
+            pass
+
+    _PROBE[key] = result
+    return result
+
+#
+###
+
+###
+#
+_DOCKER_HUB = ["docker.io", "index.docker.io", "registry-1.docker.io"]
+
+
+def image_reference(target):
+    """The form docker lists an image reference in - docker.io/library/x => x:latest, repo:tag@digest => repo@digest"""
+    if target.startswith("sha256:"):
+        return target
+
+    name, _, digest = target.partition("@")
+
+    registry, _, rest = name.partition("/")
+    if rest and registry in _DOCKER_HUB:
+        name = rest
+
+    name = name.removeprefix("library/")
+
+    tagged = ":" in name.rpartition("/")[2]
+    if digest:
+        # repo_digests carry no tag
+        return f"{name.rpartition(':')[0] if tagged else name}@{digest}"
+
+    return name if tagged else f"{name}:latest"
+
+
+def _names(kind, obj):
+    match kind:
+        case "image":
+            # tags and digests in the form image_reference gives a target
+            names = [obj.id]
+            names.extend(image_reference(tag) for tag in obj.repo_tags)
+            names.extend(image_reference(digest) for digest in obj.repo_digests)
+
+            return names
+
+        case "volume" | "network" | "container":
+            return [obj.name, obj.id]
+
+        case _:
+            e = f"INVALID INVENTORY KIND: {kind}"
+            raise RuntimeError(e)
+
+
+def inventory(kind, client_config={}, ttl=None):
+    """Names of the images / volumes / networks / containers, cached for a short ttl"""
+    ttl = _global.DOCKER_INVENTORY_TTL if ttl is None else ttl
+    key = (kind, _client_key(client_config))
+
+    if (cached := _INVENTORY.get(key, None)) is not None and monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    client = get_client(**client_config)
+    match kind:
+        case "image":
+            objects = client.image.list()
+
+        case "volume":
+            objects = client.volume.list()
+
+        case "network":
+            objects = client.network.list()
+
+        case "container":
+            objects = client.container.list(all=True)
+
+        case _:
+            e = f"INVALID INVENTORY KIND: {kind}"
+            raise RuntimeError(e)
+
+    names = set()
+    for obj in objects:
+        names.update(_names(kind, obj))
+
+    _INVENTORY[key] = (monotonic(), names)
+    return names
+
+
+def invalidate(*kinds):
+    """Drop cached inventories after a tool changes them - no kinds drops all"""
+    kinds = kinds or INVENTORY_KINDS
+    with _LOCK:
+        for key in [k for k in _INVENTORY if k[0] in kinds]:
+            _INVENTORY.pop(key, None)
+
+        # snapshots taken before this are stale for these kinds
+        for kind in kinds:
+            _GENERATION[kind] = _GENERATION.get(kind, 0) + 1
+
+
+def snapshot(client_config={}, kinds=None):
+    """Gather the inventories concurrently into one plain snapshot, keyed by the pooled client it was taken with"""
+    kinds = kinds or INVENTORY_KINDS
+    generation = {kind:_GENERATION.get(kind, 0) for kind in kinds}
+
+    with ThreadPoolExecutor(max_workers=len(kinds)) as pool:
+        names = dict(zip(kinds, pool.map(lambda kind: inventory(kind, client_config, ttl=0), kinds)))
+
+    result = {kind:sorted(names[kind]) for kind in kinds}
+    result["generation"] = generation
+    result["timestamp"] = time()
+    result["client"] = _client_key(client_config)
+
+    return result
+
+
+def _snapshot_valid(kind, snapshot, client_config):
+    """If the snapshot holds the kind, was taken with the same pooled client and nothing of the kind changed since"""
+    if not snapshot or kind not in snapshot:
+        return False
+
+    # a snapshot of another daemon says nothing about this one
+    if snapshot.get("client") != _client_key(client_config):
+        return False
+
+    return snapshot.get("generation", {}).get(kind) == _GENERATION.get(kind, 0)
+
+
+def exists(kind, target, snapshot=None, client_config={}):
+    """Answer from a snapshot of the same client while nothing of the kind changed since, otherwise from the inventory"""
+    if kind == "image":
+        target = image_reference(target)
+
+    if _snapshot_valid(kind, snapshot, client_config):
+        return target in snapshot[kind]
+
+    return target in inventory(kind, client_config)
+
+#
+###
\ No newline at end of file
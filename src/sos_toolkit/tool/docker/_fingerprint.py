@@ -0,0 +1,214 @@
+import hashlib
+import json
+import re
+import stat
+
+from functools import lru_cache
+from os import walk, lstat, readlink
+from os.path import join as path_join
+from os.path import exists as path_exists
+from os.path import relpath, abspath, normpath
+from threading import Lock
+
+from sos_toolkit.meta._cache import cache_key, cache_load, cache_save
+
+###
+#
+# the image label and context namespace key a build fingerprint is stored under
+FINGERPRINT_LABEL = "sos.fingerprint"
+FINGERPRINT_NAMESPACE = "namespace.build_fingerprint"
+
+_LOCK = Lock()
+
+#
+###
+
+###
+#
+def _ignore_patterns(context_dir):
+    """Read .dockerignore into (negate, pattern) pairs"""
+    target = path_join(context_dir, ".dockerignore")
+    if not path_exists(target):
+        return []
+
+    patterns = []
+    with open(target, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:].strip()
+
+            if not line:
+                continue
+
+            # docker cleans the pattern - ./ and trailing / go, a leading / is the context root
+            line = normpath(line).lstrip("/")
+            if line in ("", "."):
+                continue
+
+            patterns.append((negate, line))
+
+    return patterns
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern):
+    """A .dockerignore pattern as a regex - go filepath.Match per segment and ** for any depth"""
+    output = "^"
+    n = 0
+    while n < len(pattern):
+        ch = pattern[n]
+        n += 1
+        if ch == "*":
+            if pattern[n:n + 1] == "*":
+                n += 1
+                # **/ is ** - it eats the /
+                if pattern[n:n + 1] == "/":
+                    n += 1
+
+                # ** at the end matches everything, anywhere else any number of directories
+                output += ".*" if n == len(pattern) else "(.*/)?"
+
+            else:
+                output += "[^/]*"
+
+        elif ch == "?":
+            output += "[^/]"
+
+        elif ch == "\\" and n < len(pattern):
+            output += re.escape(pattern[n])
+            n += 1
+
+        elif ch == "[":
+            # a character class - up to the closing ], ^ negates it
+            end = pattern.find("]", n)
+            if end == -1:
+                output += re.escape(ch)
+
+            else:
+                output += "[" + pattern[n:end] + "]"
+                n = end + 1
+
+        else:
+            output += re.escape(ch)
+
+    return re.compile(output + "$")
+
+
+def _match(path, pattern):
+    return _compile(pattern).match(path) is not None
+
+
+def _ignored(path, patterns):
+    """Docker semantics - the last matching pattern wins and a matched directory covers its contents"""
+    parts = path.split("/")
+    parents = ["/".join(parts[:n]) for n in range(1, len(parts) + 1)]
+
+    result = False
+    for negate, pattern in patterns:
+        if any(_match(p, pattern) for p in parents):
+            result = not negate
+
+    return result
+
+
+def _digest(target):
+    h = hashlib.sha256()
+    with open(target, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def tree_digest(context_dir):
+    """Hash the build context - files whose size and mtime did not change are not read again"""
+    context_dir = abspath(context_dir)
+    patterns = _ignore_patterns(context_dir)
+    negations = any(negate for negate, _ in patterns)
+
+    key = cache_key(values={"context_dir":context_dir})
+    known = cache_load("fingerprint", key, default={})
+
+    files = {}
+    for root, dirs, names in walk(context_dir):
+        _root = relpath(root, context_dir)
+        _root = "" if _root == "." else f"{_root}/"
+
+        # an ignored directory can only be skipped when nothing re-includes its contents
+        if not negations:
+            dirs[:] = [d for d in dirs if not _ignored(f"{_root}{d}", patterns)]
+
+        # a link to a directory is hashed as a link - walking it could repeat or loop
+        links = [d for d in dirs if stat.S_ISLNK(lstat(path_join(root, d)).st_mode)]
+        dirs[:] = sorted(d for d in dirs if d not in links)
+
+        for name in sorted(names + links):
+            path = f"{_root}{name}"
+            if _ignored(path, patterns):
+                continue
+
+            target = path_join(root, name)
+            s = lstat(target)
+            if stat.S_ISLNK(s.st_mode):
+                # docker sends the link itself - a dangling one is fine
+                entry = (s.st_size, s.st_mtime_ns, "link:" + readlink(target))
+
+            elif not stat.S_ISREG(s.st_mode):
+                # sockets, fifos and devices have no content to hash
+                continue
+
+            elif (entry := known.get(path, None)) is None or tuple(entry[:2]) != (s.st_size, s.st_mtime_ns):
+                entry = (s.st_size, s.st_mtime_ns, _digest(target))
+
+            files[path] = entry
+
+    if files != known:
+        cache_save("fingerprint", key, files)
+
+    h = hashlib.sha256()
+    for path in sorted(files.keys()):
+        h.update(path.encode())
+        h.update(files[path][2].encode())
+
+    return h.hexdigest()
+
+
+def build_fingerprint(context_dir, build_file, values={}):
+    """Fingerprint a build over its context tree, its build file and the values that change the output"""
+    h = hashlib.sha256()
+    h.update(tree_digest(context_dir).encode())
+    h.update(_digest(build_file).encode())
+    h.update(json.dumps(values, sort_keys=True, default=str).encode())
+
+    return h.hexdigest()
+
+
+def fingerprint_name(*values):
+    """Context namespace key for a build"""
+    return "fp_" + hashlib.sha256(json.dumps(values, default=str).encode()).hexdigest()[:16]
+
+
+def fingerprint_get(__CTX__, name):
+    if __CTX__ is None:
+        return None
+
+    return (__CTX__.get(FINGERPRINT_NAMESPACE, None) or {}).get(name, None)
+
+
+def fingerprint_set(__CTX__, name, fingerprint):
+    if __CTX__ is None:
+        return
+
+    # concurrent builds share the namespace entry
+    with _LOCK:
+        record = dict((__CTX__.get(FINGERPRINT_NAMESPACE, None) or {}).items())
+        record[name] = fingerprint
+        __CTX__.set(FINGERPRINT_NAMESPACE, record, True)
+
+#
+###
@@ -1,20 +1,26 @@
 from typing import Union, Optional, Annotated, Literal, List, Dict
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global, log_info, log_warning
+from sos_toolkit.meta._cache import cache_key, cache_load, cache_save
 import rich
+from rich.markup import escape
 
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, time
 from requests import get as requests_get
+import re
 from os.path import exists as path_exists
 from os.path import join as path_join
 
 
-from ._client import get_client
+from ._client import get_client, invalidate, probe, exists
+from ._fingerprint import FINGERPRINT_LABEL, build_fingerprint, fingerprint_name, fingerprint_get, fingerprint_set
 
 #
 # TODO
 # - if cache bust fails on no network but image exists => use preexisting image
-# - how to do that for bake?
+# - done for buildx_build - how to do that for bake?
 # - need to check all the targets? is that even possible?
 # - would need to parse the hcl file probably
 # - or maybe use the buildx.print to get the image tags?
@@ -28,12 +34,14 @@ from ._client import get_client
 def _cache_bust(
     kind: Annotated[Literal["gitea"], Field(description="Kind of Remote")],
     target: Annotated[str, Field(description="Remote Target")],
-    verify_ssl: Annotated[bool, Field(description="If verify SSL certificate for remote request")] = True
+    verify_ssl: Annotated[bool, Field(description="If verify SSL certificate for remote request")] = True,
+    timeout: Annotated[Optional[float], Field(description="Seconds to wait for the remote")] = None,
 ):
 
     match kind:
         case "gitea":
-            r = requests_get(target, verify=verify_ssl)
+            r = requests_get(target, verify=verify_ssl, timeout=timeout or _global.CACHE_BUST_TIMEOUT)
+            r.raise_for_status()
             result = r.json()[0]["sha"]
 
         case "github":
@@ -47,6 +55,130 @@ def _cache_bust(
 
     return result
 
+
+def _cache_bust_lookup(target):
+    """Resolve one cache bust - a fresh disk entry, then the remote, then the last known sha
+
+    the last known sha is state for offline builds, not a cache - it is kept with SOS_CACHE=0
+    """
+    key = cache_key(values={"kind":target.get("kind"), "target":target.get("target")})
+    cached = cache_load("cache_bust", key)
+
+    if cached is not None and time() - cached[0] < _global.CACHE_BUST_TTL:
+        return cached[1]
+
+    try:
+        result = _cache_bust(**target)
+        cache_save("cache_bust", key, (time(), result))
+        cache_save("cache_bust_known", key, result, force=True)
+        return result
+
+    except Exception as exc:
+        known = cache_load("cache_bust_known", key, cached[1] if cached is not None else None, force=True)
+        if known is not None:
+            log_warning(f"CACHE BUST OFFLINE - USING LAST KNOWN: {target.get('target')} - {exc}")
+            return known
+
+        log_warning(f"CACHE BUST FAILED: {target.get('target')} - {exc}")
+        return None
+
+
+def _cache_bust_resolve(cache_bust):
+    """Resolve every cache bust concurrently - None for the ones that could not be resolved"""
+    if not len(cache_bust):
+        return {}
+
+    keys = list(cache_bust.keys())
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        values = pool.map(_cache_bust_lookup, [cache_bust[k] for k in keys])
+
+    return {f"CACHE_BUST_{key}".upper():value for key, value in zip(keys, values)}
+
+
+# build kwargs that only change how a build is shown - every other kwarg is part of the fingerprint
+_PRESENTATION_KWARGS = ["progress", "stream_logs"]
+
+
+def _labelled_images(docker, fingerprint):
+    """The local images that carry a fingerprint label - bake tags are only known from the bake file"""
+    try:
+        return docker.image.list(filters={"label":f"{FINGERPRINT_LABEL}={fingerprint}"})
+
+    except Exception as exc:
+        log_warning(f"FINGERPRINT IMAGE LOOKUP FAILED: {fingerprint} - {exc}")
+        return []
+
+
+def _image_fingerprint(docker, tags, client_config={}):
+    """The fingerprint label shared by every tag - None if a tag is missing or they differ"""
+    labels = set()
+    for tag in tags:
+        if not exists("image", tag, client_config=client_config):
+            return None
+
+        labels.add((docker.image.inspect(tag).config.labels or {}).get(FINGERPRINT_LABEL, None))
+
+    return labels.pop() if len(labels) == 1 else None
+
+
+_STEP = re.compile(r"^#(\d+) (.*)$")
+_DONE = re.compile(r"^DONE (\d+(?:\.\d+)?)s$")
+
+def _build_events(lines):
+    """Parse plain buildkit progress lines into step events as they arrive"""
+    names = {}
+    for line in lines:
+        line = line.rstrip("\n")
+        if (m := _STEP.match(line)) is None:
+            yield {"step":None, "name":None, "status":"log", "seconds":None, "line":line}
+            continue
+
+        step, rest = m.groups()
+        if (d := _DONE.match(rest)) is not None:
+            status, seconds = "done", float(d.group(1))
+
+        elif rest == "CACHED":
+            status, seconds = "cached", None
+
+        elif rest.startswith("ERROR"):
+            status, seconds = "error", None
+
+        elif step not in names:
+            names[step] = rest
+            status, seconds = "start", None
+
+        else:
+            status, seconds = "log", None
+
+        yield {"step":step, "name":names.get(step), "status":status, "seconds":seconds, "line":line}
+
+
+def _build_stream(lines, slowest=10):
+    """Print a build as it streams and collect per-step timing and cache hits"""
+    start = monotonic()
+    steps = {}
+    for event in _build_events(lines):
+        log_info(lambda: escape(event["line"]))
+
+        if event["step"] is None or event["status"] in ["log"]:
+            continue
+
+        step = steps.setdefault(event["step"], {"name":event["name"], "status":"start", "seconds":None})
+        if event["status"] != "start":
+            step["status"] = event["status"]
+            step["seconds"] = event["seconds"]
+
+    timed = sorted([s for s in steps.values() if s["seconds"] is not None], key=lambda s: s["seconds"], reverse=True)
+
+    return {
+            "seconds":round(monotonic() - start, 3),
+            "steps":len(steps),
+            "cached":len([s for s in steps.values() if s["status"] == "cached"]),
+            "built":len([s for s in steps.values() if s["status"] == "done"]),
+            "slowest":timed[:slowest],
+            "step_list":list(steps.values()),
+            }
+
 @sos_tool
 def buildx_bake(
     __CTX__: Annotated[Optional[SOSContext], Field(description="SOSContext Object")],
@@ -59,11 +191,13 @@ def buildx_bake(
     variables: Annotated[Optional[Dict], Field(description="Variables to pass to the build")] = {},
     cache_bust: Annotated[Optional[Dict], Field(description="Key-Value pairs to use for Cache Bust")] = {},
     client_config: Annotated[Optional[Dict], Field(description="The Docker Client Config dict")] = {},
-    print_bakex: Annotated[Optional[bool], Field(description="If print bakex build before running")] = True
+    print_bakex: Annotated[Optional[bool], Field(description="If print the resolved bake plan")] = True,
+    stream: Annotated[bool, Field(description="If stream the build log and record per-step timing")] = False,
+    fingerprint: Annotated[bool, Field(description="If skip the build when its fingerprint is unchanged and its images exist - false always builds")] = True,
 ):
     """Use Docker Buildx bake to build containers"""
 
-    rich.print({"docker.buildx_bake":
+    log_info(lambda: {"docker.buildx_bake":
             {
                 "bake_file":bake_file,
                 "bake_target":bake_target,
@@ -72,13 +206,19 @@ def buildx_bake(
                 "variables":variables,
                 "cache_bust":cache_bust,
                 "client_config":client_config,
-                "print_bakex":print_bakex
+                "print_bakex":print_bakex,
+                "stream":stream,
+                "fingerprint":fingerprint
             }
         })
 
     variables = deepcopy(variables)
     docker = get_client(**client_config)
 
+    if probe(**client_config)["buildx"] is False:
+        e = f"DOCKER BUILDX NOT INSTALLED"
+        raise RuntimeError(e)
+
     if not path_exists(context_dir):
         e = f"CONTEXT_DIR NOT FOUND: {context_dir}"
         raise RuntimeError(e)
@@ -100,25 +240,53 @@ def buildx_bake(
     # for c in additional_context:
     # validate(c)
 
-    bust = {}
-    for key, target in cache_bust.items():
-        bust[f"CACHE_BUST_{key}".upper()] = _cache_bust(**target)
+    bust = _cache_bust_resolve(cache_bust)
+    if (missing := [k for k, v in bust.items() if v is None]):
+        e = f"CACHE BUST UNRESOLVED: {missing}"
+        raise RuntimeError(e)
 
     variables.update(bust)
 
+    # bake tags are only known from the bake file - compare against the context record
+    _fingerprint = build_fingerprint(context_dir, bake_file, {"variables":variables, "bake_target":bake_target})
+    _fingerprint_name = fingerprint_name("bake", context_dir, bake_file, bake_target, namespace)
+
+    # the record alone is not enough - the images may have been removed since
+    if fingerprint and fingerprint_get(__CTX__, _fingerprint_name) == _fingerprint and len(_labelled_images(docker, _fingerprint)):
+        log_info(f"BUILD UNCHANGED - SKIPPING: {bake_target} - {_fingerprint}")
+        return {
+                "bake_file":bake_file,
+                "bake_target":bake_target,
+                "namespace":namespace,
+                "context_dir":context_dir,
+                "variables":variables,
+                "cache_bust":cache_bust,
+                "client_config":client_config,
+                "build_stats":None,
+                "fingerprint":_fingerprint,
+                "skipped":"fingerprint",
+                }
+
     buildx_args = {}
     buildx_args["files"] = [bake_file]
     buildx_args["targets"] = [bake_target]
     buildx_args["variables"] = variables
+    buildx_args["set"] = {f"*.labels.{FINGERPRINT_LABEL}":_fingerprint}
 
-    rich.print({"docker.buildx_bake.buildx_args":buildx_args})
-
-    if print_bakex:
-        rich.print({"docker.buildx_bake.print_bakex":docker.buildx.bake(print=True, **buildx_args)})
+    log_info(lambda: {"docker.buildx_bake.buildx_args":buildx_args})
 
+    # a blocking bake returns the plan it resolved - no separate --print run
+    plan = None
+    build_stats = None
     try:
-        docker.buildx.bake(**buildx_args)
+        if stream:
+            build_stats = _build_stream(docker.buildx.bake(stream_logs=True, progress="plain", **buildx_args))
+
+        else:
+            plan = docker.buildx.bake(**buildx_args)
+
         success = True
+        invalidate("image")
 
     except Exception as exc:
         e = f"DOCKER BAKEX EXC - {exc}"
@@ -127,10 +295,10 @@ def buildx_bake(
     if not success:
         raise RuntimeError(e)
 
-    #
-    # TODO
-    # - streaming response
-    #
+    fingerprint_set(__CTX__, _fingerprint_name, _fingerprint)
+
+    if print_bakex and plan is not None:
+        log_info(lambda: {"docker.buildx_bake.print_bakex":plan})
 
     return {
             "bake_file":bake_file,
@@ -140,6 +308,8 @@ def buildx_bake(
             "variables":variables,
             "cache_bust":cache_bust,
             "client_config":client_config,
+            "build_stats":build_stats,
+            "fingerprint":_fingerprint,
             }
 
 @sos_tool
@@ -155,10 +325,12 @@ def buildx_build(
     client_config: Annotated[Optional[Dict], Field(description="Docker Client config dict")] = {},
     build_kwargs: Annotated[Optional[Dict], Field(description="Additional kwargs to pass to the build")] = {},
     cache_bust: Annotated[Optional[Dict], Field(description="Key-Value pairs to use for Cache Bust")] = {},
+    stream: Annotated[bool, Field(description="If stream the build log and record per-step timing")] = False,
+    fingerprint: Annotated[bool, Field(description="If skip the build when every tag carries its fingerprint - false always builds")] = True,
 ):
     """Build an image from a docker file"""
 
-    rich.print({"docker.buildx_build":
+    log_info(lambda: {"docker.buildx_build":
             {
             "docker_file":docker_file,
             "context_dir":context_dir,
@@ -169,12 +341,19 @@ def buildx_build(
             "client_config":client_config,
             "build_kwargs":build_kwargs,
             "cache_bust":cache_bust,
+            "stream":stream,
+            "fingerprint":fingerprint,
             }
         })
 
     variables = deepcopy(build_args)
+    build_kwargs = deepcopy(build_kwargs)
     docker = get_client(**client_config)
 
+    if probe(**client_config)["buildx"] is False:
+        e = f"DOCKER BUILDX NOT INSTALLED"
+        raise RuntimeError(e)
+
     if not path_exists(context_dir):
         e = f"CONTEXT_DIR NOT FOUND: {context_dir}"
         raise RuntimeError(e)
@@ -188,13 +367,26 @@ def buildx_build(
     variables["VERSION"] = version or "0.0.0" if __CTX__ is None else __CTX__.meta.system_version
     variables["PLATFORM"] = platform or __CTX__.meta.platform
 
-    bust = {}
-    for key, target in cache_bust.items():
-        bust[f"CACHE_BUST_{key}".upper()] = _cache_bust(**target)
+    _tags = tags if isinstance(tags, list) else [tags]
 
-    variables.update(bust)
+    bust = _cache_bust_resolve(cache_bust)
+    if (missing := [k for k, v in bust.items() if v is None]):
+        # offline without a known sha - an existing image is better than no build
+        if all(exists("image", t, client_config=client_config) for t in _tags):
+            log_warning(f"CACHE BUST UNRESOLVED - USING EXISTING IMAGE: {_tags}")
+            return {
+                    "docker_file":docker_file,
+                    "context_dir":context_dir,
+                    "tags":tags,
+                    "build_kwargs":build_kwargs,
+                    "build_stats":None,
+                    "skipped":"cache_bust",
+                    }
+
+        e = f"CACHE BUST UNRESOLVED: {missing}"
+        raise RuntimeError(e)
 
-    _tags = tags if isinstance(tags, list) else [tags]
+    variables.update(bust)
 
     build_kwargs["context_path"] = context_dir
     build_kwargs["file"] = _docker_file
@@ -205,13 +397,46 @@ def buildx_build(
 
     build_kwargs["build_args"] = variables
 
-    rich.print({"docker.buildx_build.build_kwargs":build_kwargs})
+    # the label on the image is authoritative - a changed source rebuilds an existing tag
+    # every kwarg that changes the image - platforms, pull, secrets, labels... - is an input
+    _kwargs = {k:v for k, v in build_kwargs.items() if k not in ["context_path", "file", "tags", "build_args", "target", *_PRESENTATION_KWARGS]}
+    _fingerprint = build_fingerprint(context_dir, _docker_file, {"build_args":variables, "target":build_kwargs.get("target", None), "build_kwargs":_kwargs})
+    _fingerprint_name = fingerprint_name("build", context_dir, _docker_file, _tags)
+
+    if fingerprint and _image_fingerprint(docker, _tags, client_config) == _fingerprint:
+        log_info(f"BUILD UNCHANGED - SKIPPING: {_tags} - {_fingerprint}")
+        fingerprint_set(__CTX__, _fingerprint_name, _fingerprint)
+        return {
+                "docker_file":docker_file,
+                "context_dir":context_dir,
+                "tags":tags,
+                "build_kwargs":build_kwargs,
+                "build_stats":None,
+                "fingerprint":_fingerprint,
+                "skipped":"fingerprint",
+                }
+
+    build_kwargs["labels"] = {**build_kwargs.get("labels", {}), FINGERPRINT_LABEL:_fingerprint}
 
-    result = docker.build(**build_kwargs)
+    log_info(lambda: {"docker.buildx_build.build_kwargs":build_kwargs})
+
+    build_stats = None
+    if stream:
+        build_kwargs["stream_logs"] = True
+        build_kwargs.setdefault("progress", "plain")
+        build_stats = _build_stream(docker.build(**build_kwargs))
+
+    else:
+        result = docker.build(**build_kwargs)
+
+    invalidate("image")
+    fingerprint_set(__CTX__, _fingerprint_name, _fingerprint)
 
     return {
             "docker_file":docker_file,
             "context_dir":context_dir,
             "tags":tags,
-            "build_kwargs":build_kwargs
+            "build_kwargs":build_kwargs,
+            "build_stats":build_stats,
+            "fingerprint":_fingerprint,
             }
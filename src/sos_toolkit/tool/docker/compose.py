@@ -1,11 +1,10 @@
 from typing import Optional, Annotated, Literal, Union, List, Dict
 from collections.abc import MutableMapping
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_debug, log_info
 import tempfile
-import rich
 
-from ._client import get_client
+from ._client import get_client, invalidate, probe
 
 @sos_tool
 def compose_up(
@@ -17,7 +16,7 @@ def compose_up(
 ):
     """Start a Docker Compose project"""
 
-    rich.print({"docker.compose_up":
+    log_info(lambda: {"docker.compose_up":
             {
             "file":file,
             "profile":profile,
@@ -25,6 +24,10 @@ def compose_up(
             }
         })
 
+    if probe()["compose"] is False:
+        e = f"DOCKER COMPOSE NOT INSTALLED"
+        raise RuntimeError(e)
+
     docker_args = {}
     docker_args["compose_files"] = [file]
     docker_args["compose_project_name"] = project_name
@@ -33,8 +36,7 @@ def compose_up(
         docker_args["compose_profiles"] = [profile]
 
     with tempfile.NamedTemporaryFile() as env_file:
-        rich.print(f"COMPOSE_ENV:")
-        rich.print(env_map)
+        log_debug(lambda: {"COMPOSE_ENV":env_map})
         with open(env_file.name, "w") as f:
             for key, value in env_map.items():
                 f.write(f"{key}={value}\n")
@@ -49,6 +51,7 @@ def compose_up(
         compose_args["no_build"] = True
 
         docker.compose.up(**compose_args)
+        invalidate()
 
     return {
             "file":file,
@@ -63,7 +66,7 @@ def compose_down(
     profile: Annotated[Optional[str], Field(description="The profile to use from the compose file")] = None
 ):
     """Stop a Docker Compose Project"""
-    rich.print({"docker.compose_down":
+    log_info(lambda: {"docker.compose_down":
             {
             "project_name":project_name,
             "profile":profile,
@@ -86,5 +89,6 @@ def compose_down(
     #kwargs = ["services", "remove_orphans", "remove_images", "timeout", "volumes", "quiet"]
 
     docker.compose.down(**compose_args)
+    invalidate()
 
     return True
\ No newline at end of file
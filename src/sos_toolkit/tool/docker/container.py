@@ -1,9 +1,8 @@
 from typing import Optional, Annotated, Literal, Dict
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_info
 
-from ._client import get_client
+from ._client import get_client, invalidate, exists
 
 # TODO
 # - unpack run_kwargs for annotation
@@ -13,7 +12,7 @@ def container_run(
     run_kwargs: Annotated[dict, Field(description="Additional Kwargs for Run")] = {}
 ):
     """Run a Container"""
-    rich.print({"docker.container_run":
+    log_info(lambda: {"docker.container_run":
             {
             "image":image,
             "run_kwargs":run_kwargs
@@ -21,6 +20,7 @@ def container_run(
         })
 
     container = get_client().run(image=image, **run_kwargs)
+    invalidate("container")
 
     return {"container":container}
 
@@ -30,7 +30,7 @@ def container_stop(
     stop_kwargs: Annotated[dict, Field(description="Additional Kwargs for Stop")] = {}
 ):
     """Stop a Container"""
-    rich.print({"docker.container_stop":
+    log_info(lambda: {"docker.container_stop":
             {
             "name":name,
             "stop_kwargs":stop_kwargs
@@ -38,9 +38,26 @@ def container_stop(
         })
 
     get_client().container.stop(name, **stop_kwargs)
+    invalidate("container")
 
     return True
 
+@sos_tool
+def container_exists(
+    name: Annotated[str, Field(description="Container Name to Check")],
+    client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {},
+    snapshot: Annotated[Optional[Dict], Field(description="Inventory snapshot from docker.inventory_snapshot")] = None,
+):
+    """Check if a container with the name exists"""
+    log_info(lambda: {"docker.container_exists":
+            {
+            "name":name,
+            "client_config":client_config,
+            }
+        })
+
+    return {"result":exists("container", name, snapshot, client_config)}
+
 @sos_tool
 def container_running(
     name: Annotated[str, Field(description="Container Name to Check")]
@@ -1,9 +1,8 @@
-from typing import Union, Optional, Annotated, Literal, List
+from typing import Union, Optional, Annotated, Literal, List, Dict
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global, log_info
 
-from ._client import get_client
+from ._client import get_client, invalidate, exists
 import python_on_whales as POW
 
 @sos_tool
@@ -15,7 +14,7 @@ def image_load(
 ):
     """Load a Docker Image from a Target"""
 
-    rich.print({"docker.image_load":
+    log_info(lambda: {"docker.image_load":
             {
             "source":source,
             "target":target,
@@ -57,6 +56,8 @@ def image_load(
             e = f"INVALID IMAGE SOURCE: {source}"
             raise RuntimeError(e)
 
+    invalidate("image")
+
     return {
             "source":source,
             "target":target,
@@ -66,17 +67,28 @@ def image_load(
 @sos_tool
 def image_exists(
     target: Annotated[str, Field(description="Tag for the Target Image")],
-    client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {}
+    client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {},
+    snapshot: Annotated[Optional[Dict], Field(description="Inventory snapshot from docker.inventory_snapshot")] = None,
 ):
     """Check if an image exists"""
-    rich.print({"docker.image_exists":
+    log_info(lambda: {"docker.image_exists":
             {
             "target":target,
             "client_config":client_config,
             }
         })
 
-    return {"result":get_client(**client_config).image.exists(target)}
+    if exists("image", target, snapshot, client_config):
+        result = True
+
+    elif all(c in "0123456789abcdef" for c in target.removeprefix("sha256:")):
+        # short ids and digests are not in the inventory - ask docker
+        result = get_client(**client_config).image.exists(target)
+
+    else:
+        result = False
+
+    return {"result":result}
 
 @sos_tool
 def image_delete(
@@ -87,7 +99,7 @@ def image_delete(
     client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {}
 ):
     """Remove an Image"""
-    rich.print({"docker.image_delete":
+    log_info(lambda: {"docker.image_delete":
             {
             "target":target,
             "force":force,
@@ -99,11 +111,12 @@ def image_delete(
 
     try:
         if _global.ALLOW_DELETE:
-            rich.print(f"DELETE IMAGE: {target}")
+            log_info(f"DELETE IMAGE: {target}")
             get_client(**client_config).image.remove(target, force=force, prune=prune)
+            invalidate("image")
 
         else:
-            rich.print(f"TEST IMAGE DELETE: {target}")
+            log_info(f"TEST IMAGE DELETE: {target}")
 
     except POW.exceptions.NoSuchImage:
         if ignore_missing:
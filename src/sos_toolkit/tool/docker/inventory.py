@@ -0,0 +1,27 @@
+from typing import Optional, Annotated, Literal, List, Dict
+from pydantic import Field
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_info
+
+from ._client import snapshot, INVENTORY_KINDS
+
+@sos_tool
+def inventory_snapshot(
+    __CTX__: Annotated[Optional[SOSContext], Field(description="SOSContext Object")],
+    kinds: Annotated[List[Literal["image", "volume", "network", "container"]], Field(description="The inventories to gather")] = INVENTORY_KINDS,
+    client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {},
+):
+    """Gather the docker images, volumes, networks and containers into a snapshot for the existence tools"""
+    log_info(lambda: {"docker.inventory_snapshot":
+            {
+            "kinds":kinds,
+            "client_config":client_config,
+            }
+        })
+
+    result = snapshot(client_config=client_config, kinds=kinds)
+
+    # runtime only - the snapshot is not saved with the context
+    if __CTX__ is not None:
+        __CTX__.set("__INVENTORY__", result, True)
+
+    return {"result":result}
@@ -1,9 +1,8 @@
 from typing import Optional, Annotated, Literal, Dict
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_info
 
-from ._client import get_client
+from ._client import get_client, inventory, invalidate, exists
 
 # TODO
 # - unpack run_kwargs for annotation
@@ -14,7 +13,7 @@ def network_create(
     exists_error: Annotated[bool, Field(description="If Network Exists Error")] = False
 ):
     """Create a Docker Network"""
-    rich.print({"docker.network_create":
+    log_info(lambda: {"docker.network_create":
             {
             "name":name,
             "kwargs":kwargs,
@@ -24,7 +23,7 @@ def network_create(
 
     client = get_client()
 
-    _name = name in [z.name for z in client.network.list()]
+    _name = name in inventory("network")
 
     if exists_error is True and _name:
         e = f"NETWORK EXISTS ERROR: {name}"
@@ -35,7 +34,8 @@ def network_create(
 
     else:
         kwargs.pop("name", None)
-        result = get_client().network.create(name=name, **kwargs)
+        result = client.network.create(name=name, **kwargs)
+        invalidate("network")
 
     return {"result":result}
 
@@ -46,7 +46,7 @@ def network_remove(
     not_exists_error: Annotated[bool, Field(description="If Network Does not Exist Error")] = False
 ):
     """Remove a Docker Network"""
-    rich.print({"docker.network_create":
+    log_info(lambda: {"docker.network_create":
             {
             "name":name,
             "kwargs":kwargs,
@@ -56,9 +56,10 @@ def network_remove(
 
     client = get_client()
 
-    _name = name in [z.name for z in client.network.list()]
+    _name = name in inventory("network")
     if not_exists_error is True and not _name:
         e = f"NETWORK DOES NOT EXIST: {name}"
+        raise RuntimeError(e)
 
     elif not _name:
         result = None
@@ -68,6 +69,7 @@ def network_remove(
         #n = client.network.inspect(name, **kwargs)
         n = client.network.inspect(name)
         result = client.network.remove(n)
+        invalidate("network")
 
     return {"result":result}
 
@@ -76,10 +78,10 @@ def network_exists(
     name: Annotated[str, Field(description="Name of Network")],
     kwargs: Annotated[dict, Field(description="Additional Kwargs")] = {},
     not_exists_error: Annotated[bool, Field(description="If network does not exist error")] = False,
-
+    snapshot: Annotated[Optional[Dict], Field(description="Inventory snapshot from docker.inventory_snapshot")] = None,
 ):
     """Check if a docker network exists"""
-    rich.print({"docker.network_exists":
+    log_info(lambda: {"docker.network_exists":
             {
             "name":name,
             "kwargs":kwargs,
@@ -87,9 +89,7 @@ def network_exists(
             }
         })
 
-    client = get_client()
-
-    _exists = name in [z.name for z in client.network.list()]
+    _exists = exists("network", name, snapshot)
 
     if not _exists and not_exists_error:
         e = f"DOCKER NETWORK DOES NOT EXIST: {name}"
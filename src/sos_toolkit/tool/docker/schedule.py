@@ -0,0 +1,147 @@
+from typing import Optional, Annotated, List
+from pydantic import Field
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, MetaRunnable, log_info, log_error
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from time import monotonic
+
+# the params that decide what a build produces
+BUILD_TOOLS = {
+    "docker.buildx_build":["context_dir", "docker_file", "tags", "build_args", "build_target", "version", "platform", "build_kwargs", "cache_bust"],
+    "docker.buildx_bake":["context_dir", "bake_file", "bake_target", "namespace", "variables", "version", "platform", "cache_bust"],
+    }
+
+def _available_memory():
+    """Available memory in GB, None where it can not be read"""
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024 / 1024
+
+    except OSError:
+        pass
+
+    return None
+
+
+def _build_key(tool, params):
+    """Builds with the same inputs produce the same image - run them once"""
+    values = []
+    for key in BUILD_TOOLS[tool]:
+        value = params.get(key)
+        if key == "tags" and isinstance(value, str):
+            value = [value]
+
+        if isinstance(value, dict):
+            value = sorted(value.items())
+
+        elif isinstance(value, list):
+            value = sorted(value)
+
+        values.append(value)
+
+    return tool, repr(values)
+
+
+def _build(__CTX__, builds):
+    """Run a build and then its duplicates as actions - conditions, result_map and callbacks included
+
+    the duplicates find the image built and skip it in the tool, __CTX__.__RESULT__ is per worker thread
+    """
+    report = {}
+    first = builds[0][0]
+    for target, runnable in builds:
+        start = monotonic()
+        if first in report and report[first]["status"] == "failed":
+            report[target] = {"status":"failed", "seconds":0.0, "error":f"DUPLICATE OF FAILED BUILD: {first}"}
+            continue
+
+        try:
+            runnable(__CTX__)
+            status = {"status":"built"} if target == first else {"status":"duplicate", "of":first}
+
+        except Exception as exc:
+            log_error(f"BUILD_SCHEDULE - failed: {target} - {exc}")
+            status = {"status":"failed", "error":str(exc)}
+
+        report[target] = {**status, "seconds":round(monotonic() - start, 3)}
+
+    return report
+
+
+@sos_tool
+def build_schedule(
+    __CTX__: Annotated[SOSContext, Field(description="SOSContext Object")],
+    targets: Annotated[Optional[List[str]], Field(description="Context keys of the build actions - default every service's action_key")] = None,
+    action_key: Annotated[str, Field(description="The build action of each service")] = "action.setup.build",
+    concurrency: Annotated[int, Field(description="Maximum number of builds running at once")] = 2,
+    min_memory: Annotated[float, Field(description="Available memory in GB needed to start another build")] = 2.0,
+    raise_exc: Annotated[bool, Field(description="If raise an exception when any build fails")] = False,
+):
+    """Run the pending docker builds of a system concurrently, once per distinct build"""
+    log_info(lambda: {"docker.build_schedule":
+            {
+            "targets":targets,
+            "action_key":action_key,
+            "concurrency":concurrency,
+            "min_memory":min_memory,
+            "raise_exc":raise_exc,
+            }
+        })
+
+    if targets is None:
+        targets = [f"service.{key}.{action_key}" for key in __CTX__.service.keys()]
+        targets = [t for t in targets if __CTX__.has(t)]
+
+    #
+    # PLAN
+    # - skip disabled builds, duplicates run after the build they share
+    # - existing images are skipped by the build tools so result_map and callbacks still run
+    #
+    report = {}
+    builds = {}
+    for target in targets:
+        runnable = __CTX__.get(target)
+        if not isinstance(runnable, MetaRunnable) or runnable.tool not in BUILD_TOOLS:
+            e = f"NOT A BUILD ACTION: {target}"
+            raise RuntimeError(e)
+
+        if not runnable.check_enabled(__CTX__):
+            report[target] = {"status":"disabled"}
+            continue
+
+        params = runnable.resolve_params(__CTX__).model_dump()
+        builds.setdefault(_build_key(runnable.tool, params), []).append((target, runnable))
+
+    #
+    # RUN
+    # - only start another build while memory allows, but never stall with nothing running
+    #
+    pending = list(builds.values())
+    running = {}
+    concurrency = max(1, concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while len(pending) or len(running):
+            while len(pending) and len(running) < concurrency:
+                memory = _available_memory()
+                if len(running) and memory is not None and memory < min_memory:
+                    log_info(f"BUILD_SCHEDULE - WAITING FOR MEMORY: {memory:.1f}GB")
+                    break
+
+                build = pending.pop(0)
+                log_info(f"BUILD_SCHEDULE - start: {[target for target, _ in build]}")
+                running[pool.submit(_build, __CTX__, build)] = build
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                running.pop(future)
+                report.update(future.result())
+
+    report = {target:report[target] for target in targets if target in report}
+    failed = [k for k, v in report.items() if v["status"] == "failed"]
+    if raise_exc and len(failed):
+        e = f"BUILD_SCHEDULE FAILED: {failed}"
+        raise RuntimeError(e)
+
+    return {"result":report, "failed":failed}
@@ -1,25 +1,25 @@
-from typing import Union, Optional, Annotated, Literal, List
+from typing import Union, Optional, Annotated, Literal, List, Dict
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global, log_info
 
-from ._client import get_client
+from ._client import get_client, inventory, invalidate, exists
 import python_on_whales as POW
 
 @sos_tool
 def volume_exists(
     target: Annotated[str, Field(description="Name of the Volume")],
-    client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {}
+    client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {},
+    snapshot: Annotated[Optional[Dict], Field(description="Inventory snapshot from docker.inventory_snapshot")] = None,
 ):
     """Check if a volume exists"""
-    rich.print({"docker.volume_exists":
+    log_info(lambda: {"docker.volume_exists":
             {
             "target":target,
             "client_config":client_config,
             }
         })
 
-    return {"result":get_client(**client_config).volume.exists(target)}
+    return {"result":exists("volume", target, snapshot, client_config)}
 
 @sos_tool
 def volume_create(
@@ -29,7 +29,7 @@ def volume_create(
     client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {},
 ):
     """Create a volume"""
-    rich.print({"docker.volume_create":
+    log_info(lambda: {"docker.volume_create":
             {
             "target":target,
             "client_config":client_config,
@@ -38,9 +38,10 @@ def volume_create(
 
     c = get_client(**client_config)
 
-    if not c.volume.exists(target):
+    if target not in inventory("volume", client_config):
         volume_kwargs["volume_name"] = target
         c.volume.create(**volume_kwargs)
+        invalidate("volume")
 
     elif ignore_exists:
         pass
@@ -58,7 +59,7 @@ def volume_delete(
     client_config: Annotated[dict, Field(description="The Docker Client Config dict")] = {}
 ):
     """Delete a Colume"""
-    rich.print({"docker.volume_delete":
+    log_info(lambda: {"docker.volume_delete":
             {
             "target":target,
             "ignore_missing":ignore_missing,
@@ -69,10 +70,11 @@ def volume_delete(
     c = get_client(**client_config)
 
     if _global.ALLOW_DELETE:
-        rich.print(f"DELETE VOLUME: {target}")
+        log_info(f"DELETE VOLUME: {target}")
 
-        if c.volume.exists(target):
+        if target in inventory("volume", client_config):
             c.volume.remove(target)
+            invalidate("volume")
 
         elif ignore_missing:
             pass
@@ -82,7 +84,7 @@ def volume_delete(
             raise RuntimeError(e)
 
     else:
-        rich.print(f"TEST VOLUME DELETE: {target}")
+        log_info(f"TEST VOLUME DELETE: {target}")
 
 
     return {"result":True}
@@ -1,7 +1,6 @@
 from typing import Optional, Annotated
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, _global, log_info
 
 from os import makedirs, listdir
 from os.path import exists as path_exists
@@ -12,7 +11,7 @@ from shutil import rmtree
 @sos_tool
 def directory_exists(target: Annotated[str, Field(description="Target Directory to Check")]):
     """Check if a Directory Exists"""
-    rich.print({"filesystem.directory_exists":
+    log_info(lambda: {"filesystem.directory_exists":
             {"target":target
             }
         })
@@ -24,7 +23,7 @@ def directory_delete(
     ignore_errors: Annotated[bool, Field(description="If ignore errors on delete")] = False,
 ):
     """Delete a Target Directory"""
-    rich.print({"filesystem.directory_delete":
+    log_info(lambda: {"filesystem.directory_delete":
             {"target":target,
              "ignore_errors":ignore_errors,
             }
@@ -32,11 +31,11 @@ def directory_delete(
 
     if path_exists(target) and path_isdir(target):
         if _global.ALLOW_DELETE:
-            rich.print(f"DELETE DIRECTORY: {target}")
+            log_info(f"DELETE DIRECTORY: {target}")
             rmtree(target, ignore_errors)
 
         else:
-            rich.print(f"TEST DELETE DIRECTORY: {target}")
+            log_info(f"TEST DELETE DIRECTORY: {target}")
 
     else:
         if ignore_errors:
@@ -55,7 +54,7 @@ def directory_create(
     exist_ok: Annotated[bool, Field(description="If already exists error")] = False
 ):
     """Create a Target Directory"""
-    rich.print({"filesystem.directory_create":
+    log_info(lambda: {"filesystem.directory_create":
             {"target":target,
              "mode":mode,
              "exist_ok":exist_ok
@@ -75,7 +74,7 @@ def directory_list(
     target: Annotated[str, Field(description="Target Directory to List")] = None
 ):
     """Return a list of a directory contents"""
-    rich.print({"filesystem.directory_list":
+    log_info(lambda: {"filesystem.directory_list":
             {"target":target
             }
         })
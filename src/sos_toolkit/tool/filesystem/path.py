@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, List, Union
 from pydantic import Field
 from collections.abc import MutableMapping
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_info
 
 from os import makedirs, listdir
 from os.path import join as _path_join
@@ -18,7 +17,7 @@ def path_join(
 ):
 
     """Join Path Segments"""
-    rich.print({"filesystem.path_join":
+    log_info(lambda: {"filesystem.path_join":
             {"target":target
             }
         })
@@ -42,7 +41,7 @@ def path_exists(
 ):
     """Test if Target Path Exists"""
 
-    rich.print({"filesystem.path_exists":
+    log_info(lambda: {"filesystem.path_exists":
         {
         "target":target,
         "raise_exc":raise_exc
@@ -0,0 +1,65 @@
+import git
+import hashlib
+
+from os import makedirs, utime
+from os.path import join as path_join
+from os.path import exists as path_exists
+from os.path import getmtime
+from threading import Lock
+from time import time
+from urllib.parse import urlparse
+
+from sos_toolkit.meta import _global, log_warning
+
+###
+#
+# one lock per mirror so concurrent pulls of a remote update it once
+_LOCKS = {}
+_LOCK = Lock()
+
+#
+###
+
+###
+#
+def mirror_path(remote_target):
+    """Bare mirror location for a remote - readable name plus a hash of the full url"""
+    name = urlparse(remote_target).path.rstrip("/").split("/")[-1].removesuffix(".git") or "repo"
+    digest = hashlib.sha256(remote_target.encode()).hexdigest()[:16]
+
+    return path_join(_global.GIT_MIRROR_DIR, f"{name}-{digest}.git")
+
+
+def mirror_update(remote_target, ttl=None):
+    """Create or refresh the bare mirror of a remote - a mirror fetched within ttl seconds is used as is"""
+    ttl = _global.GIT_MIRROR_TTL if ttl is None else ttl
+    target = mirror_path(remote_target)
+    stamp = path_join(target, "FETCH_STAMP")
+
+    with _LOCK:
+        lock = _LOCKS.setdefault(target, Lock())
+
+    with lock:
+        if not path_exists(target):
+            makedirs(_global.GIT_MIRROR_DIR, exist_ok=True)
+            git.Repo.clone_from(remote_target, target, mirror=True)
+
+        elif not path_exists(stamp) or time() - getmtime(stamp) >= ttl:
+            try:
+                git.Repo(target).git.remote("update", "--prune")
+
+            except git.GitCommandError as exc:
+                # offline - a stale mirror is better than no clone
+                log_warning(f"[red]::GIT_ERROR::[/red] MIRROR UPDATE FAILED - USING CACHED MIRROR: {remote_target} - {exc}")
+                return target
+
+        else:
+            return target
+
+        with open(stamp, "a"):
+            utime(stamp)
+
+    return target
+
+#
+###
@@ -0,0 +1,192 @@
+import git
+import rich.markup
+
+from concurrent.futures import ThreadPoolExecutor
+from os import stat
+from os.path import join as path_join
+from os.path import realpath, expanduser
+from threading import Lock
+from time import monotonic
+
+from sos_toolkit.meta import _global
+
+###
+#
+# last status per repo - valid while HEAD and the index are unchanged and for a short ttl
+_STATUS = {}
+_LOCK = Lock()
+
+#
+###
+
+###
+#
+def fetch_remotes(repo):
+    """Fetch every remote of a repo"""
+    for remote in repo.remotes:
+        remote.fetch()
+
+
+def _index_key(repo):
+    """HEAD plus the index stat - commits, adds, checkouts and pulls all change one of them"""
+    try:
+        head = repo.head.object.hexsha
+
+    except ValueError:
+        # no commits yet
+        head = None
+
+    try:
+        s = stat(path_join(repo.git_dir, "index"))
+        return head, s.st_mtime_ns, s.st_size
+
+    except FileNotFoundError:
+        return head, None, None
+
+
+def _status_key(working_dir):
+    """The cache key of a working dir - the same for the repo and the path a tool was given"""
+    return realpath(expanduser(working_dir))
+
+
+def repo_dirty(repo, ttl=None):
+    """(dirty, cached) - one git status instead of a staged and an unstaged diff
+
+    git status uses core.fsmonitor when the repo configures it, so a cache miss
+    on a monitored tree only looks at the changed paths
+    """
+    ttl = _global.GIT_STATUS_TTL if ttl is None else ttl
+    key = _index_key(repo)
+    working_dir = _status_key(repo.working_dir)
+
+    if (cached := _STATUS.get(working_dir, None)) is not None and cached[0] == key and monotonic() - cached[1] < ttl:
+        return cached[2], True
+
+    dirty = repo.git.status("--porcelain", "--untracked-files=no") != ""
+
+    # status may refresh the index stat cache - key on the index it left behind
+    with _LOCK:
+        _STATUS[working_dir] = (_index_key(repo), monotonic(), dirty)
+
+    return dirty, False
+
+
+def status_invalidate(working_dir=None):
+    """Drop the cached status after a tool changes the working tree - no working_dir drops all
+
+    Never raises - a working_dir that is not a repo has nothing cached
+    """
+    with _LOCK:
+        if working_dir is None:
+            _STATUS.clear()
+
+        else:
+            _STATUS.pop(_status_key(working_dir), None)
+
+
+def repo_state(working_dir, fetch=True):
+    """Dirty / detached / ahead / behind state of a repo
+
+    Without fetch the branch is compared against the already fetched remote refs
+    """
+    start = monotonic()
+    state = {
+        "working_dir":working_dir,
+        "branch":None,
+        "head":None,
+        "upstream":None,
+        "dirty":None,
+        "detached":None,
+        "ahead":None,
+        "behind":None,
+        "fetched":False,
+        "cached":None,
+        "fsmonitor":None,
+        "status_seconds":None,
+        "error":None,
+        }
+
+    try:
+        repo = git.Repo(working_dir)
+
+        if fetch:
+            fetch_remotes(repo)
+            state["fetched"] = True
+
+        status_start = monotonic()
+        state["dirty"], state["cached"] = repo_dirty(repo)
+        state["status_seconds"] = round(monotonic() - status_start, 4)
+        state["fsmonitor"] = repo.config_reader().get_value("core", "fsmonitor", False) not in [False, "false", ""]
+        state["head"] = repo.head.object.hexsha
+        state["detached"] = repo.head.is_detached
+
+        if not state["detached"]:
+            branch = repo.active_branch
+            state["branch"] = branch.name
+
+            # the tracking branch, else the same name on origin
+            upstream = branch.tracking_branch()
+            if upstream is None and "origin" in repo.remotes and branch.name in repo.remotes.origin.refs:
+                upstream = repo.remotes.origin.refs[branch.name]
+
+            if upstream is not None and upstream.is_valid():
+                state["upstream"] = upstream.name
+                ahead, behind = repo.git.rev_list("--left-right", "--count", f"HEAD...{upstream.name}").split()
+                state["ahead"] = int(ahead)
+                state["behind"] = int(behind)
+
+    except Exception as exc:
+        state["error"] = f"{type(exc).__name__}: {exc}"
+
+    state["seconds"] = round(monotonic() - start, 3)
+    return state
+
+
+def repo_states(working_dirs, fetch=True, workers=None):
+    """repo_state for many repos - fetches are network bound so they run in a bounded pool"""
+    workers = max(1, min(workers or _global.PARALLEL_WORKERS, len(working_dirs) or 1))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda working_dir: repo_state(working_dir, fetch), working_dirs))
+
+
+def state_line(state):
+    """One rich markup line for a repo state"""
+    line = ["REPO"]
+
+    if state["error"] is not None:
+        line.append("[bold red]|ERROR|[/bold red]")
+
+    elif state["dirty"]:
+        line.append("[bold red]|DIRTY|[/bold red]")
+
+    else:
+        line.append("[bold green]|CLEAN|[/bold green]")
+
+    if state["error"] is not None:
+        pass
+
+    elif state["detached"]:
+        line.append("[bold yellow]|DETACHED|[/bold yellow]")
+
+    elif state["behind"]:
+        line.append("[bold red]|DESYNC|[/bold red]")
+
+    elif state["ahead"]:
+        line.append("[bold yellow]|AHEAD|[/bold yellow]")
+
+    elif state["upstream"] is None:
+        line.append("[bold yellow]|NO UPSTREAM|[/bold yellow]")
+
+    else:
+        line.append("[bold green]|SYNCED|[/bold green]")
+
+    line.append(state["working_dir"])
+
+    if state["error"] is not None:
+        line.append(f"- {rich.markup.escape(state['error'])}")
+
+    return " ".join(line)
+
+#
+###
@@ -0,0 +1,81 @@
+from typing import Optional, Annotated, List
+from pydantic import Field
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_info, log_error
+import rich.rule
+
+from time import monotonic
+
+from ._state import repo_states, state_line
+
+def _report(states, seconds):
+    failed = [s["working_dir"] for s in states if s["error"] is not None]
+
+    return {
+        "result":{s["working_dir"]:s for s in states},
+        "dirty":[s["working_dir"] for s in states if s["dirty"]],
+        "behind":[s["working_dir"] for s in states if s["behind"]],
+        "detached":[s["working_dir"] for s in states if s["detached"]],
+        "failed":failed,
+        "seconds":seconds,
+        }
+
+
+@sos_tool
+def repos_status_batch(
+    working_dirs: Annotated[List[str], Field(description="The working directories of the Repos")],
+    fetch: Annotated[bool, Field(description="If fetch the remotes first - otherwise compare against the already fetched refs")] = True,
+    workers: Annotated[Optional[int], Field(description="Maximum number of repos fetched at once - default SOS_PARALLEL_WORKERS")] = None,
+    raise_exc: Annotated[bool, Field(description="If raise an exception when any repo fails")] = False,
+):
+    """Get the Status of many Git Repos, fetching them concurrently"""
+    log_info(lambda: {"git.repos_status_batch":
+            {"working_dirs":working_dirs,
+             "fetch":fetch,
+             "workers":workers,
+             "raise_exc":raise_exc
+             }
+        })
+
+    start = monotonic()
+    states = repo_states(working_dirs, fetch, workers)
+    report = _report(states, round(monotonic() - start, 3))
+
+    log_info(rich.rule.Rule())
+    for state in states:
+        log_info(lambda: state_line(state))
+    log_info(rich.rule.Rule())
+
+    if raise_exc and len(report["failed"]):
+        e = f"GIT STATUS FAILED: {report['failed']}"
+        raise RuntimeError(e)
+
+    return report
+
+
+@sos_tool
+def repos_fetch_batch(
+    working_dirs: Annotated[List[str], Field(description="The working directories of the Repos")],
+    workers: Annotated[Optional[int], Field(description="Maximum number of repos fetched at once - default SOS_PARALLEL_WORKERS")] = None,
+    raise_exc: Annotated[bool, Field(description="If raise an exception when any repo fails")] = True,
+):
+    """Fetch updates for many Git Repos concurrently"""
+    log_info(lambda: {"git.repos_fetch_batch":
+            {"working_dirs":working_dirs,
+             "workers":workers,
+             "raise_exc":raise_exc
+             }
+        })
+
+    start = monotonic()
+    states = repo_states(working_dirs, True, workers)
+    report = _report(states, round(monotonic() - start, 3))
+
+    for state in states:
+        if state["error"] is not None:
+            log_error(lambda: f"[red]::GIT_ERROR::[/red] {state_line(state)}")
+
+    if raise_exc and len(report["failed"]):
+        e = f"GIT FETCH FAILED: {report['failed']}"
+        raise RuntimeError(e)
+
+    return report
@@ -1,30 +1,82 @@
 from typing import Optional, Annotated
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool
-import rich
+from sos_toolkit.meta import SOSContext, SOS_TOOL, sos_tool, log_info, log_warning, log_error
 import rich.rule
 
 import git
 
+from ._state import repo_state, fetch_remotes, state_line, status_invalidate
+from ._mirror import mirror_update
+
+def _clone(remote_target, local_target, remote_branch, depth, single_branch, clone_filter, reference, dissociate, mirror):
+    if mirror:
+        # a local clone hardlinks the mirror objects - then point origin back at the remote
+        repo = git.Repo.clone_from(mirror_update(remote_target), local_target)
+        repo.remotes.origin.set_url(remote_target)
+        return repo
+
+    options = {}
+    if depth:
+        options["depth"] = depth
+
+    if single_branch:
+        options["single_branch"] = True
+
+    # shallow and single branch clones only carry one branch - make it the requested one
+    if remote_branch and (depth or single_branch):
+        options["branch"] = remote_branch
+
+    if clone_filter:
+        options["filter"] = clone_filter
+
+    if reference:
+        options["reference_if_able"] = reference
+
+        if dissociate:
+            options["dissociate"] = True
+
+    return git.Repo.clone_from(remote_target, local_target, **options)
+
+
 @sos_tool
 def repo_clone(
     remote_target: Annotated[str, Field(description="The remote git repo")],
     local_target: Annotated[str, Field(description="The local folder to clone into")],
-    remote_branch: Annotated[Optional[str], Field(description="The branch to checkout after clone")] = None
+    remote_branch: Annotated[Optional[str], Field(description="The branch to checkout after clone")] = None,
+    depth: Annotated[Optional[int], Field(description="Shallow clone with this many commits of history")] = None,
+    single_branch: Annotated[bool, Field(description="Only clone the history of remote_branch")] = False,
+    clone_filter: Annotated[Optional[str], Field(description="Partial clone filter - blob:none for blobless, tree:0 for treeless")] = None,
+    reference: Annotated[Optional[str], Field(description="Local repo whose objects are borrowed instead of downloaded - ignored if missing")] = None,
+    dissociate: Annotated[bool, Field(description="Copy the borrowed reference objects so the clone does not depend on the reference")] = False,
+    mirror: Annotated[bool, Field(description="Clone from a local mirror of the remote kept in SOS_GIT_MIRROR_DIR - not with depth, single_branch, clone_filter or reference")] = False,
 ):
     """Clone a Remote Git Repo to a Local Folder"""
-    rich.print({"git.repo_clone":
+    log_info(lambda: {"git.repo_clone":
             {"remote_target":remote_target,
              "local_target":local_target,
-             "remote_branch":remote_branch
+             "remote_branch":remote_branch,
+             "depth":depth,
+             "single_branch":single_branch,
+             "clone_filter":clone_filter,
+             "reference":reference,
+             "dissociate":dissociate,
+             "mirror":mirror
              }
         })
 
+    # a mirror clone is a local clone of the whole mirror - git ignores depth for it and the rest does not apply
+    if mirror:
+        options = {"depth":depth, "single_branch":single_branch, "clone_filter":clone_filter, "reference":reference}
+        if (unsupported := [k for k, v in options.items() if v]):
+            e = f"MIRROR CLONE DOES NOT SUPPORT: {unsupported}"
+            raise RuntimeError(e)
+
+    cloned = False
     try:
         repo = git.Repo(local_target)
 
         if repo.is_dirty():
-            rich.print(f"[bold red]REPO DIRTY - NOT OVERWRITING:[/bold red] - {remote_target} - {local_target}")
+            log_warning(f"[bold red]REPO DIRTY - NOT OVERWRITING:[/bold red] - {remote_target} - {local_target}")
             return {
                     "remote_target":remote_target,
                     "local_target":local_target,
@@ -34,13 +86,16 @@ def repo_clone(
 
     except git.NoSuchPathError:
         SOS_TOOL.get("filesystem.directory_create")(target=local_target)
-        repo = git.Repo.clone_from(remote_target, local_target)
+        repo = _clone(remote_target, local_target, remote_branch, depth, single_branch, clone_filter, reference, dissociate, mirror)
+        cloned = True
 
     except git.InvalidGitRepositoryError:
-        repo = git.Repo.clone_from(remote_target, local_target)
+        repo = _clone(remote_target, local_target, remote_branch, depth, single_branch, clone_filter, reference, dissociate, mirror)
+        cloned = True
 
-    #repo.git.pull()
-    repo.git.fetch()
+    # a fresh clone is already up to date
+    if not cloned:
+        repo.git.fetch()
 
     if remote_branch:
         repo.git.checkout(remote_branch)
@@ -54,55 +109,26 @@ def repo_clone(
 
 @sos_tool
 def repo_status(
-    working_dir: Annotated[str, Field(description="The working directory for the Repo")]
+    working_dir: Annotated[str, Field(description="The working directory for the Repo")],
+    fetch: Annotated[bool, Field(description="If fetch the remotes first - otherwise compare against the already fetched refs")] = True,
 ):
     """Get the Status of a Git Repo"""
-    rich.print({"git.repo_status":
-            {"working_dir":working_dir
+    log_info(lambda: {"git.repo_status":
+            {"working_dir":working_dir,
+             "fetch":fetch
              }
         })
 
-    repo = git.Repo(working_dir)
-    is_dirty = repo.is_dirty()
-
-    cur_hash = repo.head.object.hexsha
-    origin = repo.remotes.origin
-    origin.fetch()
-
-    try:
-        new_hash = origin.refs[repo.active_branch.name].object.hexsha
-        is_behind = cur_hash != new_hash
-        is_head = False
-
-    except:
-        # TODO
-        # - this should only catch the detatched head error not all errors
-        is_behind = False
-        is_head = True
-
-    state = ["REPO"]
-
-    rich.print(rich.rule.Rule())
-    if is_dirty:
-        state.append("[bold red]|DIRTY|[/bold red]")
-
-    else:
-        state.append("[bold green]|CLEAN|[/bold green]")
-
-    if is_head:
-        state.append("[bold yellow]|DETACHED|[/bold yellow]")
-
-    elif is_behind:
-        state.append("[bold red]|DESYNC|[/bold red]")
+    state = repo_state(working_dir, fetch)
+    if state["error"] is not None:
+        e = f"GIT STATUS FAILED: {working_dir} - {state['error']}"
+        raise RuntimeError(e)
 
-    else:
-        state.append("[bold green]|SYNCED|[/bold green]")
-
-    state.append(working_dir)
-    rich.print(" ".join(state))
-    rich.print(rich.rule.Rule())
+    log_info(rich.rule.Rule())
+    log_info(lambda: state_line(state))
+    log_info(rich.rule.Rule())
 
-    return True
+    return state
 
 @sos_tool
 def repo_commit(
@@ -111,43 +137,39 @@ def repo_commit(
     message: Annotated[Optional[str], Field(description="The message to include with the commit")] = None,
 ):
     """Commit the working_dir repo to the remote"""
-    rich.print({"git.repo_commit":
+    log_info(lambda: {"git.repo_commit":
             {"working_dir":working_dir
              }
         })
 
-    repo = git.Repo(working_dir)
-
-    is_dirty = repo.is_dirty()
+    # never commit from a cached status
+    status_invalidate(working_dir)
 
-    cur_hash = repo.head.object.hexsha
-    origin = repo.remotes.origin
-    origin.fetch()
+    state = repo_state(working_dir)
+    if state["error"] is not None:
+        e = f"GIT STATUS FAILED: {working_dir} - {state['error']}"
+        raise RuntimeError(e)
 
-    try:
-        new_hash = origin.refs[repo.active_branch.name].object.hexsha
-        is_behind = cur_hash != new_hash
-        is_head = False
+    repo = git.Repo(working_dir)
 
-    except:
-        # TODO
-        # - this should only catch the detatched head error not all errors
-        is_behind = False
-        is_head = True
+    is_dirty = state["dirty"]
+    is_behind = bool(state["behind"])
+    is_head = state["detached"]
+    committed = False
 
-    rich.print(rich.rule.Rule())
+    log_info(rich.rule.Rule())
     if is_head:
-        rich.print(f"[bold red]REPO IS DETATCHED:[/bold red] {working_dir}")
-        rich.print(f"[bold red]NEEDS TO BE MANUALLY FIXED[/bold red]")
+        log_warning(f"[bold red]REPO IS DETATCHED:[/bold red] {working_dir}")
+        log_warning(f"[bold red]NEEDS TO BE MANUALLY FIXED[/bold red]")
 
     elif is_behind:
-        rich.print(f"[bold red]REPO OUT OF SYNC:[/bold red] {working_dir}")
-        rich.print(f"[bold red]NEEDS TO BE MANUALLY FIXED[/bold red]")
+        log_warning(f"[bold red]REPO OUT OF SYNC:[/bold red] {working_dir}")
+        log_warning(f"[bold red]NEEDS TO BE MANUALLY FIXED[/bold red]")
 
     elif is_dirty:
-        rich.print(f"[bold red]COMMIT FROM:[/bold red] {working_dir}")
+        log_info(f"[bold red]COMMIT FROM:[/bold red] {working_dir}")
         repo.git.add(all=True)
-        rich.print(repo.git.status())
+        log_info(lambda: repo.git.status())
 
         if message is None and __CTX__.meta.input_method == "CLI":
             message = input("Commit Message: ")
@@ -162,13 +184,14 @@ def repo_commit(
         #
         repo.git.commit("-m", message)
         repo.git.push()
+        committed = True
 
     else:
-        rich.print(f"[bold green]REPO CLEAN:[/bold green] {working_dir}")
-    rich.print(rich.rule.Rule())
+        log_info(f"[bold green]REPO CLEAN:[/bold green] {working_dir}")
+    log_info(rich.rule.Rule())
 
 
-    return True
+    return {**state, "committed":committed}
 
 
 @sos_tool
@@ -179,7 +202,7 @@ def repo_fetch(
     """Fetch updates for a target repo"""
 
     try:
-        git.Repo(working_dir).fetch()
+        fetch_remotes(git.Repo(working_dir))
 
     except Exception as exc:
         if raise_exc:
@@ -187,7 +210,7 @@ def repo_fetch(
 
         else:
             e = f"[red]::GIT_ERROR::[/red] RUNTIME EXCEPTION: {exc}"
-            rich.print(e)
+            log_error(e)
 
     return True
 
@@ -199,7 +222,9 @@ def repo_pull(
     """Pull updates for a target repo"""
 
     try:
-        git.Repo(working_dir).pull()
+        # Repo has no pull - pull the tracking branch through the git command
+        git.Repo(working_dir).git.pull()
+        status_invalidate(working_dir)
 
     except Exception as exc:
         if raise_exc:
@@ -207,7 +232,7 @@ def repo_pull(
 
         else:
             e = f"[red]::GIT_ERROR::[/red] RUNTIME EXCEPTION: {exc}"
-            rich.print(e)
+            log_error(e)
 
     return True
 
@@ -221,6 +246,7 @@ def repo_checkout(
 
     try:
         git.Repo(working_dir).checkout(target)
+        status_invalidate(working_dir)
 
     except Exception as exc:
         if raise_exc:
@@ -228,6 +254,6 @@ def repo_checkout(
 
         else:
             e = f"[red]::GIT_ERROR::[/red] RUNTIME EXCEPTION: {exc}"
-            rich.print(e)
+            log_error(e)
 
     return True
@@ -1,8 +1,7 @@
 from typing import Optional, Annotated, Any
 from pydantic import Field
-from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool
+from sos_toolkit.meta import SOSContext, SOS_TOOL, ResultObject, sos_tool, log_info, log_print
 
-import rich
 import rich.rule
 
 @sos_tool
@@ -11,15 +10,15 @@ def print_result(
     horizontal_rule: Annotated[bool, Field(description="If wrap the output in horizontal rules")] = False
 ):
     """Print a ResultObject to the terminal"""
-    rich.print({"terminal.print_result":True})
+    log_info(lambda: {"terminal.print_result":True})
 
     if horizontal_rule:
-        rich.print(rich.rule.Rule())
+        log_print(rich.rule.Rule())
 
-    __RESULT__.print()
+    log_print(__RESULT__)
 
     if horizontal_rule:
-        rich.print(rich.rule.Rule())
+        log_print(rich.rule.Rule())
 
     return True
 
@@ -30,12 +29,12 @@ def print_object(
 ):
     """Print any object to the terminal"""
     if horizontal_rule:
-        rich.print(rich.rule.Rule())
+        log_print(rich.rule.Rule())
 
-    rich.print({"terminal.print_object":obj})
+    log_print({"terminal.print_object":obj})
 
     if horizontal_rule:
-        rich.print(rich.rule.Rule())
+        log_print(rich.rule.Rule())
 
     return True
 
@@ -46,23 +45,23 @@ def print_context(
     horizontal_rule: Annotated[bool, Field(description="If wrap the output in horizontal rules")] = False
 ):
     """Print the current context to the terminal"""
-    rich.print({"terminal.print_context":
+    log_info(lambda: {"terminal.print_context":
             {
             "ctx_target":ctx_target
             }
         })
 
     if horizontal_rule:
-        rich.print(rich.rule.Rule())
+        log_print(rich.rule.Rule())
 
     if ctx_target is not None:
-        rich.print(__CTX__.get(ctx_target, None))
+        log_print(__CTX__.get(ctx_target, None))
 
     else:
-        __CTX__.print()
+        log_print(__CTX__)
 
     if horizontal_rule:
-        rich.print(rich.rule.Rule())
+        log_print(rich.rule.Rule())
 
     return True
 
@@ -71,5 +70,5 @@ def print_callback(
     horizontal_rule: Annotated[bool, Field(description="If wrap the output in horizontal rules")] = False
 ):
     """Create a Callback to Print the SOSContext"""
-    rich.print({"terminal.print_callback":True})
+    log_info(lambda: {"terminal.print_callback":True})
     return ResultObject(callbacks=[{"tool":"terminal.print_context", "params":{"horizontal_rule":horizontal_rule}}])
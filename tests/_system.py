@@ -0,0 +1,215 @@
+from contextlib import contextmanager
+from os import makedirs
+from os.path import join as path_join
+
+from omegaconf import OmegaConf
+
+from sos_toolkit.meta import _context
+
+###
+#
+# (services, namespace depth, action chain length)
+SIZES = {
+    "small":(4, 2, 2),
+    "medium":(16, 4, 6),
+    "large":(48, 8, 12),
+    }
+
+#
+###
+
+###
+#
+def _tree(key, level, depth):
+    """Namespace levels with a value and an interpolated reference at every level"""
+    node = {"value":f"v{level}", "ref":f"${{service.{key}.namespace.image_tag}}"}
+    if level < depth:
+        node[f"l{level}"] = _tree(key, level + 1, depth)
+
+    return node
+
+
+def leaf_path(key, depth):
+    """Dot path of the deepest namespace value of a service"""
+    return ".".join([f"service.{key}.namespace.tree"] + [f"l{n}" for n in range(depth)] + ["value"])
+
+
+def env_map(key, depth):
+    """A 12 entry env map resolvable of a service - the shape of the compose env maps of the services"""
+    ns = f"service.{key}.namespace"
+    data = [
+        {"target":"SYSTEM_NAME", "source":f"service.{key}.meta.system_name"},
+        {"target":"SYSTEM_VERSION", "source":f"service.{key}.meta.system_version"},
+        {"target":"PLATFORM", "source":f"service.{key}.meta.platform"},
+        {"target":"IMAGE_TAG", "source":f"{ns}.image_tag"},
+        {"target":"PROJECT_NAME", "source":f"{ns}.project_name"},
+        {"target":"ENABLED", "source":f"{ns}.enabled"},
+        {"target":"EXISTS", "source":f"{ns}.exists"},
+        {"target":"LAST_BUILD", "source":f"{ns}.last_build", "default":"none"},
+        {"target":"TREE_VALUE", "source":f"{ns}.tree.value"},
+        {"target":"TREE_LEAF", "source":leaf_path(key, depth)},
+        {"target":"TREE_MISSING", "source":f"{ns}.tree.missing", "default":"missing"},
+        {"target":"RESTART", "default":"unless-stopped"},
+        ]
+
+    return {"label":"generate env_map", "result":"env_map", "data":data}
+
+
+def mapped_runnable(key, depth):
+    """A runnable with the mapping counts of the service compose actions - 6 context_map and 6 result_map entries"""
+    ns = f"service.{key}.namespace"
+    return {
+        "label":f"{key} mapped",
+        "tool":"tests.compose_up",
+        "context_map":[
+            {"label":"get project", "result":"project_name", "data":f"{ns}.project_name"},
+            {"label":"get image tag", "result":"image_tag", "data":f"{ns}.image_tag"},
+            {"label":"get system name", "result":"system_name", "data":f"service.{key}.meta.system_name"},
+            {"label":"get leaf", "result":"leaf", "data":leaf_path(key, depth)},
+            {"label":"get build", "result":"last_build", "data":{"source":f"{ns}.last_build", "default":"none"}},
+            env_map(key, depth),
+            ],
+        "result_map":[
+            {"label":f"set {target}", "result":f"{ns}.compose.{target}", "data":"result"}
+            for target in ["project", "status", "started", "network", "volume", "health"]
+            ],
+        }
+
+
+def compose_runnable(key, depth, env, callbacks):
+    """A compose up runnable with an env map of env entries in its params and a chain of callbacks
+
+    The generated env map is mapped into the params env map, so every call writes below a template object
+    """
+    ns = f"service.{key}.namespace"
+    runnable = lambda label: {
+        "label":label,
+        "tool":"tests.compose_up",
+        "params":{"env_map":{f"VARIABLE_{n}":f"value_{n}" for n in range(env)}},
+        "context_map":[
+            {"label":"get project", "result":"project_name", "data":f"{ns}.project_name"},
+            {**env_map(key, depth), "result":"env_map.GENERATED"},
+            ],
+        "result_map":[{"label":"set status", "result":f"{ns}.compose.status", "data":"result"}],
+        }
+
+    return {**runnable(f"{key} compose"), "callbacks":[runnable(f"{key} callback {n}") for n in range(callbacks)]}
+
+
+def _step(key, n, depth):
+    ns = f"service.{key}.namespace"
+    step = {
+        "label":f"{key} step {n}",
+        "condition":[{"label":"if enabled", "ctx_key":f"{ns}.enabled", "valid":True, "comparison":"equal", "raise_exc":False}],
+        }
+
+    if n == 0:
+        step["tool"] = "tests.image_exists"
+        step["context_map"] = [
+            {"label":"get image tag", "result":"target", "data":f"{ns}.image_tag"},
+            ]
+        step["result_map"] = [
+            {"label":"set image exists", "result":f"{ns}.exists", "data":"result"},
+            ]
+
+    else:
+        step["tool"] = "tests.buildx_build"
+        step["params"] = {"docker_file":"Dockerfile", "build_args":{"STEP":str(n)}}
+        step["context_map"] = [
+            {"label":"get image tag", "result":"tag", "data":f"{ns}.image_tag"},
+            {"label":"build context_dir", "result":"context_dir", "path_join":True, "data":[
+                {"source":f"service.{key}.meta.system_path", "target":"system_dir"},
+                {"source":leaf_path(key, depth), "target":"leaf"},
+                ]},
+            ]
+        step["result_map"] = [
+            {"label":"set last build", "result":f"{ns}.last_build", "data":"result"},
+            ]
+
+    return step
+
+
+def service_config(key, depth, chain):
+    """sos-service.yaml of a synthetic service"""
+    ns = f"service.{key}.namespace"
+    setup = {f"step_{n}":_step(key, n, depth) for n in range(chain)}
+    setup[f"step_{chain - 1}"]["callbacks"] = [{
+        "label":f"{key} status",
+        "tool":"tests.repo_status",
+        "context_map":[{"label":"get working_dir", "result":"working_dir", "data":f"service.{key}.meta.system_path"}],
+        }]
+
+    return {
+        "meta":{
+            "sos_version":"v0.0.1",
+            "system_name":f"sos-{key}",
+            "system_version":"v0.0.1",
+            "system_internal":f"service/{key}",
+            "platform":"default",
+            },
+        "namespace":{
+            "image_tag":f"${{service.{key}.meta.system_name}}/${{service.{key}.meta.platform}}:${{service.{key}.meta.system_version}}",
+            "project_name":f"${{service.{key}.meta.system_name}}",
+            "enabled":True,
+            "exists":False,
+            "last_build":None,
+            "tree":_tree(key, 0, depth),
+            },
+        "action":{
+            "setup":setup,
+            "up":{
+                "compose":{
+                    "label":f"{key} up",
+                    "tool":"tests.compose_up",
+                    "context_map":[{"label":"get project", "result":"project_name", "data":f"{ns}.project_name"}],
+                    },
+                },
+            },
+        }
+
+
+def synthetic_system(root, services, depth, chain):
+    """Write a system of synthetic services under root - returns (system_file, service_path, service keys)"""
+    service_path = path_join(root, "service")
+    keys = [f"bench_{n}" for n in range(services)]
+
+    for key in keys:
+        platform = path_join(service_path, key, "platform", "default")
+        makedirs(platform, exist_ok=True)
+        OmegaConf.save(OmegaConf.create(service_config(key, depth, chain)), path_join(platform, "sos-service.yaml"))
+
+    system = {
+        "meta":{
+            "sos_version":"v0.0.2",
+            "system_name":"sos-bench",
+            "system_version":"v0.0.1",
+            "system_internal":"internal",
+            },
+        "namespace":{"tree":_tree(keys[0], 0, depth)} if len(keys) else {},
+        "service":{key:True for key in keys},
+        "action":{
+            "sos_setup":{key:f"${{service.{key}.action.setup}}" for key in keys},
+            "sos_up":{key:f"${{service.{key}.action.up}}" for key in keys},
+            },
+        }
+
+    system_file = path_join(root, "sos-system.yaml")
+    OmegaConf.save(OmegaConf.create(system), system_file)
+
+    return system_file, service_path, keys
+
+
+@contextmanager
+def service_path(path):
+    """Discover services from path instead of the installed services"""
+    _path = _context.SERVICE_PATH
+    _context.SERVICE_PATH = path
+
+    try:
+        yield path
+
+    finally:
+        _context.SERVICE_PATH = _path
+
+#
+###
@@ -0,0 +1,57 @@
+from typing import Optional, Annotated, List
+from pydantic import Field
+from sos_toolkit.meta import sos_tool
+
+###
+#
+# in-process stand-ins for the docker and git tools - registered as tests.*
+# the inventory is per process so repeated runs see the images they built
+_IMAGES = set()
+
+#
+###
+
+@sos_tool
+def image_exists(
+    target: Annotated[str, Field(description="The image tag to check for")],
+    snapshot: Annotated[Optional[dict], Field(description="Stand-in for the docker inventory snapshot")] = None,
+):
+    """Stand-in for docker.image_exists"""
+    return {"result":target in _IMAGES}
+
+
+@sos_tool
+def buildx_build(
+    tag: Annotated[str, Field(description="The image tag to build")],
+    context_dir: Annotated[str, Field(description="The build context directory")],
+    docker_file: Annotated[str, Field(description="The Dockerfile name")] = "Dockerfile",
+    build_args: Annotated[dict, Field(description="The build args")] = {},
+):
+    """Stand-in for docker.buildx_build"""
+    _IMAGES.add(tag)
+
+    return {"result":tag, "context_dir":context_dir, "docker_file":docker_file}
+
+
+@sos_tool
+def repo_status(
+    working_dir: Annotated[str, Field(description="The working directory of the Repo")],
+    fetch: Annotated[bool, Field(description="If fetch the remotes first")] = False,
+):
+    """Stand-in for git.repo_status"""
+    return {"result":{"working_dir":working_dir, "dirty":False, "behind":0, "fetched":fetch}}
+
+
+@sos_tool
+def compose_up(
+    project_name: Annotated[str, Field(description="The compose project name")],
+    services: Annotated[List[str], Field(description="The services to start")] = [],
+    env_map: Annotated[dict, Field(description="The compose env map")] = {},
+):
+    """Stand-in for docker.compose_up"""
+    return {"result":project_name, "services":services}
+
+
+def images_clear():
+    """Forget the stand-in images"""
+    _IMAGES.clear()
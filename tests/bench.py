@@ -0,0 +1,285 @@
+###
+#
+# Benchmark suite for the meta engine and the context lifecycle
+#
+# (sos)$ python tests/bench.py --size small --size medium --history sos-bench.jsonl
+#
+from typing import Annotated, List, Optional
+import json
+import platform
+import statistics
+import tempfile
+import tracemalloc
+
+from copy import deepcopy
+from os.path import join as path_join
+from time import perf_counter, perf_counter_ns, time
+
+import git
+import rich
+import rich.table
+import typer
+
+import sos_toolkit
+from sos_toolkit.meta import _global, SOSContext, MetaCondition, MetaResolvable, MetaRunnable, ModelParams, log_config
+from sos_toolkit.root import TOOLKIT_PATH
+
+import _tool
+from _system import SIZES, synthetic_system, service_path, leaf_path, env_map, mapped_runnable, compose_runnable
+
+#
+###
+
+###
+#
+def measure(function, setup=None, min_time=0.5, min_samples=5, max_samples=2000):
+    """Time single calls of function until min_time has passed - setup() returns the args and is not timed"""
+    function(*(setup() if setup else ()))
+
+    samples = []
+    start = perf_counter()
+    while len(samples) < max_samples and (len(samples) < min_samples or perf_counter() - start < min_time):
+        args = setup() if setup else ()
+        t = perf_counter_ns()
+        function(*args)
+        samples.append(perf_counter_ns() - t)
+
+    ms = [s / 1e6 for s in samples]
+    return {
+        "n":len(ms),
+        "min":min(ms),
+        "median":statistics.median(ms),
+        "mean":statistics.fmean(ms),
+        "stdev":statistics.stdev(ms) if len(ms) > 1 else 0.0,
+        }
+
+
+def measure_alloc(function, setup=None, min_samples=20):
+    """KiB allocated at the peak of single calls of function - setup() returns the args and is not measured"""
+    function(*(setup() if setup else ()))
+
+    samples = []
+    tracemalloc.start()
+    try:
+        while len(samples) < min_samples:
+            args = setup() if setup else ()
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function(*args)
+            samples.append((tracemalloc.get_traced_memory()[1] - current) / 1024)
+
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "n":len(samples),
+        "min":min(samples),
+        "median":statistics.median(samples),
+        "mean":statistics.fmean(samples),
+        "stdev":statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+
+
+def cases(root, services, depth, chain):
+    """(name, function, setup) for every benchmark of one synthetic system size"""
+    system_file, _, keys = synthetic_system(root, services, depth, chain)
+    generate = lambda use_cache: SOSContext.generate(
+        system_file=system_file,
+        local_file=False,
+        user_file=False,
+        root_file=False,
+        meta_config={"context_file":False},
+        use_cache=use_cache)
+
+    ctx = generate(False)
+    config = ctx.dict()
+    key = keys[0]
+    leaf = leaf_path(key, depth)
+    step = config["service"][key]["action"]["setup"][f"step_{min(1, chain - 1)}"]
+
+    resolvable = MetaResolvable(**step["context_map"][-1])
+    resolvable_map = MetaResolvable(**env_map(key, depth))
+    runnable = MetaRunnable(**mapped_runnable(key, depth))
+    compose = MetaRunnable(**compose_runnable(key, depth, env=64, callbacks=4))
+    condition = MetaCondition(**step["condition"][0])
+
+    # unrelated names - a binary companion of yaml_file would be loaded in its place
+    yaml_file = path_join(root, "sos-context.yaml")
+    binary_file = path_join(root, f"sos-binary{_global.CONTEXT_BINARY_SUFFIX}")
+    ctx.file_save(context_file=yaml_file, file_format="yaml", run_hooks=False)
+    ctx.file_save(context_file=binary_file, file_format="binary", run_hooks=False)
+
+    return [
+        ("generate", lambda: generate(False), None),
+        ("generate.cached", lambda: generate(True), None),
+        ("from_config", SOSContext.from_config, lambda: (deepcopy(config),)),
+        ("file_save.yaml", lambda: ctx.file_save(context_file=yaml_file, file_format="yaml", run_hooks=False), None),
+        ("file_save.binary", lambda: ctx.file_save(context_file=binary_file, file_format="binary", run_hooks=False), None),
+        ("file_load.yaml", lambda: SOSContext.file_load(context_file=yaml_file, run_hooks=False), None),
+        ("file_load.binary", lambda: SOSContext.file_load(context_file=binary_file, run_hooks=False), None),
+        ("model.get", lambda: ctx.get(leaf), None),
+        ("model.has", lambda: (ctx.has(leaf), ctx.has(f"{leaf}.missing")), None),
+        ("model.set", lambda: ctx.set(leaf, "bench", overwrite=True), None),
+        ("resolvable", lambda: resolvable(ctx, ModelParams()), None),
+        ("resolvable.map", lambda: resolvable_map(ctx, ModelParams()), None),
+        ("runnable.params", lambda: runnable.resolve_params(ctx), None),
+        ("runnable.result", lambda: runnable._result(ctx, {"result":"bench"}), None),
+        ("condition", lambda: condition.resolve(ctx, raise_exc=False), None),
+        ("run.setup", lambda: ctx.run("action.sos_setup"), None),
+        ("run.up", lambda: ctx.run("action.sos_up"), None),
+        ("alloc.runnable", lambda: compose(ctx), None),
+        ("alloc.runnable.params", lambda: compose.resolve_params(ctx), None),
+        ("alloc.run.setup", lambda: ctx.run("action.sos_setup"), None),
+        ]
+
+
+def run_suite(sizes, select=None, min_time=0.5):
+    """Run the benchmarks for each size - {"size:case":stats}"""
+    results = {}
+
+    for size in sizes:
+        services, depth, chain = SIZES[size]
+
+        with tempfile.TemporaryDirectory(prefix="sos-bench-") as root:
+            _cache_dir = _global.CACHE_DIR
+            _global.CACHE_DIR = path_join(root, "cache")
+
+            try:
+                with service_path(path_join(root, "service")):
+                    _tool.images_clear()
+
+                    for name, function, setup in cases(root, services, depth, chain):
+                        if select and not any(s in name for s in select):
+                            continue
+
+                        if name.startswith("alloc."):
+                            results[f"{size}:{name}"] = measure_alloc(function, setup)
+
+                        else:
+                            results[f"{size}:{name}"] = measure(function, setup, min_time=min_time)
+
+            finally:
+                _global.CACHE_DIR = _cache_dir
+
+    return results
+
+
+def history_load(history_file):
+    """The last record of a history file - None if there is none"""
+    try:
+        with open(history_file, "r") as f:
+            lines = [line for line in f.read().splitlines() if line.strip()]
+
+    except FileNotFoundError:
+        return None
+
+    return json.loads(lines[-1]) if len(lines) else None
+
+
+def history_save(history_file, results):
+    """Append a run to a JSON-lines history file"""
+    try:
+        commit = git.Repo(TOOLKIT_PATH).head.object.hexsha
+
+    except Exception:
+        commit = None
+
+    record = {
+        "time":time(),
+        "sos_version":sos_toolkit.__version__,
+        "commit":commit,
+        "python":platform.python_version(),
+        "machine":platform.machine(),
+        "results":results,
+        }
+
+    with open(history_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+    return record
+
+
+def compare(previous, results, threshold=0.1):
+    """Median ratio of every benchmark against a previous record - a ratio over 1 + threshold is a regression"""
+    output = {}
+    for key, stats in results.items():
+        if (_stats := previous.get("results", {}).get(key, None)) is None or _stats["median"] <= 0:
+            continue
+
+        ratio = stats["median"] / _stats["median"]
+        output[key] = {"previous":_stats["median"], "ratio":ratio, "regression":ratio > 1 + threshold}
+
+    return output
+
+#
+###
+
+###
+#
+bench_app = typer.Typer(pretty_exceptions_enable=False)
+
+@bench_app.command()
+def bench(
+    size: Annotated[Optional[List[str]], typer.Option(help=f"System sizes to run - {list(SIZES.keys())} [default: small, medium]", show_default=False)] = None,
+    case: Annotated[Optional[List[str]], typer.Option(help="Only run benchmarks whose name contains one of these", show_default=False)] = None,
+    min_time: Annotated[float, typer.Option(help="Seconds spent sampling each benchmark")] = 0.5,
+    history: Annotated[Optional[str], typer.Option(help="JSON-lines history file - compare against its last run, then append this run", show_default=False)] = None,
+    save: Annotated[bool, typer.Option(help="If append this run to the history file")] = True,
+    threshold: Annotated[float, typer.Option(help="Median slowdown ratio over 1 that counts as a regression")] = 0.1,
+    fail: Annotated[bool, typer.Option(help="Exit with an error on any regression")] = False,
+):
+    """Benchmark the meta engine and the context lifecycle on synthetic systems"""
+    sizes = size or ["small", "medium"]
+    for s in sizes:
+        if s not in SIZES:
+            e = f"INVALID BENCH SIZE: {s} - valid: {list(SIZES.keys())}"
+            raise RuntimeError(e)
+
+    # parameter dumps would dominate the timings
+    log_config(quiet=True)
+
+    results = run_suite(sizes, select=case, min_time=min_time)
+
+    previous = history_load(history) if history else None
+    compared = compare(previous, results, threshold) if previous else {}
+
+    # allocation benchmarks are KiB at the peak of a call instead of ms
+    for title, alloc in [("ms per call", False), ("KiB peak allocation per call", True)]:
+        keys = [key for key in results if key.split(":", 1)[1].startswith("alloc.") is alloc]
+        if not len(keys):
+            continue
+
+        table = rich.table.Table(title=f"SOS-TOOLKIT BENCH - {title}")
+        for column in ["benchmark", "n", "min", "median", "mean", "stdev", "previous", "ratio"]:
+            table.add_column(column, justify="left" if column == "benchmark" else "right", no_wrap=column == "benchmark")
+
+        for key in keys:
+            stats = results[key]
+            row = [key, str(stats["n"])] + [f"{stats[k]:.4f}" for k in ["min", "median", "mean", "stdev"]]
+
+            if (c := compared.get(key, None)) is not None:
+                color = "red" if c["regression"] else "green" if c["ratio"] < 1 - threshold else "white"
+                row += [f"{c['previous']:.4f}", f"[{color}]{c['ratio']:.2f}x[/{color}]"]
+
+            else:
+                row += ["", ""]
+
+            table.add_row(*row)
+
+        rich.print(table)
+
+    if history and save:
+        history_save(history, results)
+
+    regressions = [key for key, c in compared.items() if c["regression"]]
+    if len(regressions):
+        rich.print(f"[red]REGRESSIONS[/red] over {threshold:.0%}: {regressions}")
+
+        if fail:
+            raise typer.Exit(code=1)
+
+#
+###
+
+if __name__ == "__main__":
+    bench_app()
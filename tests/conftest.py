@@ -0,0 +1,54 @@
+import pytest
+
+from sos_toolkit.meta import GLOBAL, SOSContext, log_config
+from _system import synthetic_system, service_path
+
+
+@pytest.fixture(autouse=True)
+def quiet_cache(tmp_path, monkeypatch):
+    """Quiet logs and a cache per test"""
+    log_config(quiet=True)
+    monkeypatch.setattr(GLOBAL, "CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def system(tmp_path):
+    """A small synthetic system - (system_file, service keys)"""
+    system_file, path, keys = synthetic_system(str(tmp_path), 2, 2, 2)
+    with service_path(path):
+        yield system_file, keys
+
+
+@pytest.fixture
+def context(system):
+    system_file, keys = system
+    return SOSContext.generate(
+        system_file=system_file,
+        local_file=False,
+        user_file=False,
+        root_file=False,
+        meta_config={"context_file":False},
+        use_cache=False)
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    """A local bare repo with one commit on main - (remote path, a working clone of it)"""
+    import git
+
+    for key in ["GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"]:
+        monkeypatch.setenv(key, "sos")
+
+    for key in ["GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"]:
+        monkeypatch.setenv(key, "sos@localhost")
+
+    remote = tmp_path / "remote.git"
+    git.Repo.init(remote, bare=True, initial_branch="main")
+
+    seed = git.Repo.clone_from(str(remote), tmp_path / "seed")
+    (tmp_path / "seed" / "README.md").write_text("seed\n")
+    seed.git.add(all=True)
+    seed.git.commit("-m", "seed")
+    seed.git.push("origin", "HEAD:main")
+
+    return str(remote), seed
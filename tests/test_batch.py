@@ -0,0 +1,149 @@
+from copy import deepcopy
+
+import pytest
+
+from sos_toolkit.meta import SOSContext, ModelDict, MetaResolvable, MapPlan
+
+
+class _Foreign:
+    """Not a ModelGet - it answers the rest of the path itself"""
+    def get(self, name, default=None):
+        return {"x.y":"foreign"}.get(name, default)
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"}, namespace={
+        "a":{"b":{"c":1}, "d":[{"e":2}, 3]},
+        "model":ModelDict(f=ModelDict(g=4)),
+        "none":None,
+        "foreign":_Foreign(),
+        })
+
+
+def _sequential(context, names):
+    output = []
+    for name in names:
+        output.append(context.get(name) if isinstance(name, str) else context.get(*name))
+
+    return output
+
+
+def _dump(value):
+    return value.model_dump() if hasattr(value, "model_dump") else value
+
+
+@pytest.mark.parametrize("names", [
+    # overlapping prefixes in one batch
+    ["namespace.a", "namespace.a.b", "namespace.a.b.c", "namespace.a.d[0].e", "namespace.a.d[1]"],
+    ["namespace.a.b.c", "namespace.a.b", "namespace.a"],
+    ["namespace.model.f.g", "namespace.model", "namespace.model.f"],
+    # missing intermediate keys with defaults
+    [("namespace.missing.x", "dflt"), ("namespace.a.missing.x", None), ("namespace.a.d[5]", 0), "namespace.a.b.c"],
+    [("namespace.none.x", "dflt"), "namespace.none"],
+    # the per-key fallback - dicts to convert and foreign objects
+    ["namespace.foreign.x.y", ("namespace.foreign.z", "dflt"), "namespace.a.b.c"],
+    ])
+def test_get_many_matches_get(names):
+    batched = [_dump(v) for v in _context().get_many(names)]
+    assert batched == [_dump(v) for v in _sequential(_context(), names)]
+
+
+@pytest.mark.parametrize("name", ["namespace.missing.x", "namespace.a.missing", "namespace.a.d[5]"])
+def test_get_many_missing_without_default_raises(name):
+    with pytest.raises(Exception):
+        _context().get(name)
+
+    with pytest.raises(Exception):
+        _context().get_many(["namespace.a.b.c", name])
+
+
+@pytest.mark.parametrize("items", [
+    # overlapping targets - later items win like repeated set calls
+    [("namespace.a", {"b":{"c":10}}), ("namespace.a.b.c", 11), ("namespace.a.x", 12)],
+    [("namespace.a.b.c", 10), ("namespace.a.b", {"z":1}), ("namespace.a.b.y", 2)],
+    [("namespace.a.b.c", 10), ("namespace.a", {"q":1}), ("namespace.a.b", 2)],
+    # missing intermediate keys are created
+    [("namespace.new.x.y", 1), ("namespace.new.x.z", 2), ("namespace.new.w", 3)],
+    [("namespace.a.d[0].e", 5), ("namespace.a.d[1]", 6)],
+    ])
+def test_set_many_matches_set(items):
+    batched = _context()
+    batched.set_many(deepcopy(items), True)
+
+    sequential = _context()
+    for name, value in deepcopy(items):
+        sequential.set(name, value, True)
+
+    assert batched.namespace.model_dump(exclude={"foreign"}) == sequential.namespace.model_dump(exclude={"foreign"})
+
+
+def test_set_many_without_overwrite():
+    context = _context()
+    context.set_many([("namespace.new.x", 1), ("namespace.a.b.y", 2)], False)
+    assert context.get("namespace.new.x") == 1
+    assert context.get("namespace.a.b.y") == 2
+
+    for name in ["namespace.a.b.c", "namespace.new.x"]:
+        with pytest.raises(ValueError):
+            context.set(name, 3)
+
+        with pytest.raises(ValueError):
+            context.set_many([(name, 3)], False)
+
+    # like repeated set calls the items before an existing key are written
+    with pytest.raises(ValueError):
+        context.set_many([("namespace.other", 1), ("namespace.new.x", 3)], False)
+
+    assert context.get("namespace.other") == 1
+    assert context.get("namespace.new.x") == 1
+    assert context.get("namespace.a.b.c") == 1
+
+
+def _resolvables():
+    return [MetaResolvable(**r) for r in [
+        {"result":"a", "data":"namespace.a.b.c"},
+        {"result":"b", "data":"namespace.a.b"},
+        {"result":"c.d", "data":"namespace.missing.x", "default":"dflt"},
+        {"result":"c.e", "data":[{"target":"x", "source":"namespace.a.d[0].e"}, {"target":"y", "source":"namespace.model.f.g"}],
+            "format_string":"{x}-{y}"},
+        {"result":"f", "data":"namespace.foreign.x.y"},
+        ]]
+
+
+def test_map_plan_matches_per_key_resolve():
+    """One trie traversal and one set_many against each resolvable on its own"""
+    plan = MapPlan(_resolvables())
+    assert plan._trie is not None
+
+    batched = ModelDict()
+    values = plan(_context(), batched)
+
+    sequential = ModelDict()
+    for resolvable in _resolvables():
+        value = resolvable.compile()(_context())
+        sequential.set(resolvable.result, value, True)
+
+    assert [_dump(v) for v in values] == [_dump(v) for v in [r.compile()(_context()) for r in _resolvables()]]
+    assert batched.model_dump() == sequential.model_dump()
+    assert batched.get("c.e") == "2-4"
+
+
+class _Proxy:
+    """A source that is not a ModelGet - MapPlan resolves each key through its get"""
+    def __init__(self, context):
+        self.context = context
+
+
+    def get(self, *args, **kwargs):
+        return self.context.get(*args, **kwargs)
+
+
+def test_map_plan_per_key_fallback():
+    plan = MapPlan(_resolvables())
+
+    batched = ModelDict()
+    values = plan(_context(), batched)
+
+    fallback = ModelDict()
+    assert [_dump(v) for v in plan(_Proxy(_context()), fallback)] == [_dump(v) for v in values]
+    assert fallback.model_dump() == batched.model_dump()
@@ -0,0 +1,177 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sos_toolkit.meta import SOSContext
+from sos_toolkit.tool.docker import buildx
+from sos_toolkit.tool.docker._fingerprint import FINGERPRINT_LABEL
+
+
+class _Docker:
+    """Stand-in for the docker client - images by tag with their labels"""
+    def __init__(self):
+        self.images = {}
+        self.builds = []
+        self.image = SimpleNamespace(inspect=self._inspect, list=self._list)
+        self.buildx = SimpleNamespace(bake=self._bake)
+
+    def build(self, tags, labels={}, **kwargs):
+        self.builds.append(kwargs)
+        for tag in tags:
+            self.images[tag] = dict(labels)
+
+    def _bake(self, targets, set={}, **kwargs):
+        self.builds.append(targets)
+        self.images[f"{targets[0]}:latest"] = {FINGERPRINT_LABEL:set[f"*.labels.{FINGERPRINT_LABEL}"]}
+        return {}
+
+    def _inspect(self, tag):
+        return SimpleNamespace(config=SimpleNamespace(labels=self.images[tag]))
+
+    def _list(self, filters={}):
+        key, _, value = filters["label"].partition("=")
+        return [tag for tag, labels in self.images.items() if labels.get(key) == value]
+
+
+@pytest.fixture
+def docker(monkeypatch, tmp_path):
+    docker = _Docker()
+    monkeypatch.setattr(buildx, "get_client", lambda **kwargs: docker)
+    monkeypatch.setattr(buildx, "probe", lambda **kwargs: {"buildx":"0.0.0"})
+    monkeypatch.setattr(buildx, "exists", lambda kind, tag, snapshot=None, client_config={}: tag in docker.images)
+
+    context_dir = tmp_path / "context"
+    context_dir.mkdir()
+    (context_dir / "Dockerfile").write_text("FROM scratch\n")
+    (context_dir / "docker-bake.hcl").write_text("target \"app\" {}\n")
+    return docker, str(context_dir)
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"})
+
+
+def _build(context, context_dir, **kwargs):
+    return buildx.buildx_build(context, docker_file="Dockerfile", context_dir=context_dir, tags="app:1", platform="default", version="v1", **kwargs)
+
+
+def test_build_kwargs_are_fingerprinted(docker):
+    docker, context_dir = docker
+    context = _context()
+
+    assert "skipped" not in _build(context, context_dir)
+    assert _build(context, context_dir)["skipped"] == "fingerprint"
+
+    for build_kwargs in [{"platforms":["linux/arm64"]}, {"pull":True}]:
+        first = _build(context, context_dir, build_kwargs=build_kwargs)
+        assert "skipped" not in first
+        assert _build(context, context_dir, build_kwargs=build_kwargs)["skipped"] == "fingerprint"
+
+    # only how the build is shown
+    assert _build(context, context_dir, build_kwargs={"pull":True, "progress":"plain"})["skipped"] == "fingerprint"
+    assert len(docker.builds) == 3
+
+
+def test_bake_skip_needs_the_image(docker):
+    docker, context_dir = docker
+    context = _context()
+
+    def bake():
+        return buildx.buildx_bake(context, bake_file="docker-bake.hcl", bake_target="app", namespace="sos", context_dir=context_dir, platform="default", version="v1")
+
+    assert "skipped" not in bake()
+    assert bake()["skipped"] == "fingerprint"
+
+    docker.images.clear()
+    assert "skipped" not in bake()
+    assert len(docker.builds) == 2
+
+
+# recorded plain progress of a buildx build - parallel steps interleave
+_RECORDED = """#0 building with "default" instance using docker driver
+
+#1 [internal] load build definition from Dockerfile
+#1 transferring dockerfile: 215B done
+#1 DONE 0.0s
+
+#2 [internal] load metadata for docker.io/library/python:3.11-slim
+#2 DONE 1.2s
+
+#3 [internal] load .dockerignore
+#3 transferring context: 2B done
+#3 DONE 0.0s
+
+#4 [1/4] FROM docker.io/library/python:3.11-slim@sha256:0123
+#4 resolve docker.io/library/python:3.11-slim@sha256:0123 0.0s done
+#4 DONE 0.1s
+
+#5 [internal] load build context
+#6 [2/4] RUN pip install rich
+#5 transferring context: 1.02kB done
+#5 DONE 0.0s
+#6 CACHED
+
+#7 [3/4] COPY . /app
+#7 DONE 0.3s
+
+#8 [4/4] RUN false
+#8 0.245 /bin/sh: 1: false: not found
+#8 ERROR: process "/bin/sh -c false" did not complete successfully: exit code: 127
+------
+ > [4/4] RUN false:
+0.245 /bin/sh: 1: false: not found
+------
+"""
+
+_MALFORMED = [
+    "",
+    "#",
+    "#x not a step",
+    "#9",
+    "#10 DONE",
+    "#11 DONE 2.5s",
+    "no step at all",
+    ]
+
+
+def test_build_events_recorded():
+    events = list(buildx._build_events(_RECORDED.splitlines(True)))
+    steps = [(e["step"], e["status"], e["seconds"]) for e in events if e["status"] != "log"]
+
+    assert steps == [
+        ("0", "start", None),
+        ("1", "start", None), ("1", "done", 0.0),
+        ("2", "start", None), ("2", "done", 1.2),
+        ("3", "start", None), ("3", "done", 0.0),
+        ("4", "start", None), ("4", "done", 0.1),
+        ("5", "start", None), ("6", "start", None), ("5", "done", 0.0), ("6", "cached", None),
+        ("7", "start", None), ("7", "done", 0.3),
+        ("8", "start", None), ("8", "error", None),
+        ]
+
+    # every line is kept and names come from the first line of a step
+    assert [e["line"] for e in events] == _RECORDED.splitlines()
+    assert {e["step"]:e["name"] for e in events if e["step"] is not None}["6"] == "[2/4] RUN pip install rich"
+    assert [e["status"] for e in events if e["line"].startswith("#4 resolve")] == ["log"]
+
+
+def test_build_events_malformed():
+    events = list(buildx._build_events(_MALFORMED))
+    assert [(e["step"], e["status"]) for e in events] == [
+        (None, "log"), (None, "log"), (None, "log"), (None, "log"),
+        ("10", "start"),
+        # a step that finishes without a header line has no name
+        ("11", "done"),
+        (None, "log"),
+        ]
+    assert events[5]["name"] is None and events[5]["seconds"] == 2.5
+
+
+def test_build_stream_stats():
+    stats = buildx._build_stream(_RECORDED.splitlines(True) + _MALFORMED, slowest=2)
+
+    assert stats["steps"] == 11
+    assert stats["cached"] == 1
+    assert stats["built"] == 7
+    assert [s["name"] for s in stats["slowest"]] == [None, "[internal] load metadata for docker.io/library/python:3.11-slim"]
+    assert [s["status"] for s in stats["step_list"] if s["name"] == "[4/4] RUN false"] == ["error"]
@@ -0,0 +1,36 @@
+import os
+import pickle
+
+from pathlib import Path
+
+import pytest
+
+from sos_toolkit.meta import GLOBAL
+from sos_toolkit.meta._cache import cache_load, cache_save, cache_path
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(GLOBAL, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(GLOBAL, "CACHE_ENABLE", True)
+    return tmp_path
+
+
+class _Payload:
+    def __reduce__(self):
+        return (os.system, ("exit 1",))
+
+
+def test_cache_round_trip(cache_dir):
+    data = {"config":{"a":[1, (2, 3)], "b":None}, "path":Path("/tmp")}
+
+    assert cache_save("test", "key", data)
+    assert cache_load("test", "key") == data
+
+
+def test_cache_refuses_globals(cache_dir):
+    cache_save("test", "key", {})
+    with open(cache_path("test", "key"), "wb") as f:
+        pickle.dump({"a":_Payload()}, f)
+
+    assert cache_load("test", "key", default="miss") == "miss"
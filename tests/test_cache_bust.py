@@ -0,0 +1,71 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from sos_toolkit.meta import GLOBAL
+from sos_toolkit.tool.docker.buildx import _cache_bust_lookup, _cache_bust_resolve
+
+
+class _Gitea(BaseHTTPRequestHandler):
+    """Stand-in for the gitea commits api - GET returns the latest commit"""
+    sha = "a" * 40
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        body = json.dumps([{"sha":self.sha}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def gitea():
+    _Gitea.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Gitea)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/repos/sos/app/commits?limit=1"
+    yield server, {"kind":"gitea", "target":url, "timeout":2}
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_lookup_uses_the_remote_then_the_cache(gitea):
+    server, target = gitea
+
+    assert _cache_bust_lookup(target) == _Gitea.sha
+    assert _cache_bust_lookup(target) == _Gitea.sha
+    assert _Gitea.requests == 1
+
+    assert _cache_bust_resolve({"app":target}) == {"CACHE_BUST_APP":_Gitea.sha}
+
+
+def test_offline_uses_last_known_without_cache(gitea, monkeypatch):
+    server, target = gitea
+    monkeypatch.setattr(GLOBAL, "CACHE_ENABLE", False)
+
+    assert _cache_bust_lookup(target) == _Gitea.sha
+    assert _cache_bust_lookup(target) == _Gitea.sha
+    assert _Gitea.requests == 2
+
+    server.shutdown()
+    server.server_close()
+    assert _cache_bust_lookup(target) == _Gitea.sha
+
+
+def test_offline_without_known_sha(gitea):
+    server, target = gitea
+    server.shutdown()
+    server.server_close()
+
+    assert _cache_bust_lookup(target) is None
@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+
+from os.path import dirname, join as path_join
+
+
+# a fresh interpreter - the test session has already imported the tools
+_SCRIPT = """
+import json
+import sys
+
+from click.testing import CliRunner
+from typer.main import get_command
+
+from sos_toolkit.cli import cli_app, _action_table
+
+def imported():
+    return sorted(m for m in sys.modules if m.startswith(("sos_toolkit.action.sos.", "sos_toolkit.tool.")) or m in ["forge", "git", "IPython"])
+
+group = get_command(cli_app)
+builtin = sorted(group.commands)
+output = {"actions":sorted(_action_table()), "builtin":builtin}
+
+result = CliRunner().invoke(group, ["--help"], terminal_width=400)
+output["help"] = {"code":result.exit_code, "text":result.output, "imported":imported(), "built":sorted(group.commands)}
+
+result = CliRunner().invoke(group, [sys.argv[1], "--help"], terminal_width=400)
+output["run"] = {"code":result.exit_code, "text":result.output, "imported":imported(), "built":sorted(group.commands)}
+
+print(json.dumps(output))
+"""
+
+
+def _cli(action):
+    src = path_join(dirname(dirname(__file__)), "src")
+    result = subprocess.run([sys.executable, "-c", _SCRIPT, action], capture_output=True, text=True, env={"PYTHONPATH":src, "PATH":""}, check=True)
+    return json.loads(result.stdout)
+
+
+def test_help_lists_actions_without_importing_them():
+    output = _cli("status")
+    help = output["help"]
+
+    assert help["code"] == 0
+    assert len(output["actions"]) > 10
+    for key in output["builtin"] + output["actions"]:
+        assert f" {key} " in help["text"], key
+
+    assert help["imported"] == []
+    assert help["built"] == output["builtin"]
+
+
+def test_running_an_action_builds_only_its_command():
+    output = _cli("status")
+    run = output["run"]
+
+    assert run["code"] == 0, run["text"]
+    assert "Usage:" in run["text"] and "status" in run["text"]
+    assert run["built"] == sorted(output["builtin"] + ["status"])
+
+    # helper modules of the action are private
+    actions = [m for m in run["imported"] if m.startswith("sos_toolkit.action.sos.") and not m.rpartition(".")[2].startswith("_")]
+    assert actions == ["sos_toolkit.action.sos.status"]
+    assert "forge" in run["imported"]
@@ -0,0 +1,79 @@
+import git
+import pytest
+
+from sos_toolkit.meta import GLOBAL
+from sos_toolkit.tool.git.repo import repo_clone
+
+
+@pytest.fixture
+def history(remote):
+    """The remote with three commits on main and a second branch - file:// so depth and filters apply"""
+    path, seed = remote
+    for n in range(2):
+        with open(f"{seed.working_dir}/file_{n}.txt", "w") as f:
+            f.write(str(n))
+
+        seed.git.add(all=True)
+        seed.git.commit("-m", f"commit {n}")
+
+    seed.git.push("origin", "HEAD:main")
+    seed.git.push("origin", "HEAD:other")
+    git.Repo(path).git.config("uploadpack.allowFilter", "true")
+
+    return f"file://{path}", path
+
+
+def _clone(url, tmp_path, **kwargs):
+    result = repo_clone(remote_target=url, local_target=str(tmp_path / "local"), remote_branch="main", **kwargs)
+    return git.Repo(result["working_dir"])
+
+
+def test_shallow_clone(history, tmp_path):
+    url, _ = history
+    repo = _clone(url, tmp_path, depth=1)
+
+    assert repo.git.rev_list("--count", "HEAD") == "1"
+    assert repo.active_branch.name == "main"
+
+
+def test_single_branch_clone(history, tmp_path):
+    url, _ = history
+    repo = _clone(url, tmp_path, single_branch=True)
+
+    assert "origin/other" not in [ref.name for ref in repo.remotes.origin.refs]
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+
+
+def test_blobless_clone(history, tmp_path):
+    url, _ = history
+    repo = _clone(url, tmp_path, clone_filter="blob:none")
+
+    assert repo.git.config("remote.origin.partialclonefilter") == "blob:none"
+    assert (tmp_path / "local" / "file_1.txt").read_text() == "1"
+
+
+def test_reference_clone(history, tmp_path):
+    url, path = history
+    repo = _clone(url, tmp_path, reference=path)
+
+    assert (tmp_path / "local" / ".git" / "objects" / "info" / "alternates").exists()
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+
+
+def test_mirror_clone(history, tmp_path, monkeypatch):
+    url, _ = history
+    monkeypatch.setattr(GLOBAL, "GIT_MIRROR_DIR", str(tmp_path / "mirror"))
+
+    repo = _clone(url, tmp_path, mirror=True)
+    assert repo.remotes.origin.url == url
+    assert repo.git.rev_list("--count", "HEAD") == "3"
+    assert len(list((tmp_path / "mirror").iterdir())) == 1
+
+
+@pytest.mark.parametrize("option", [{"depth":1}, {"single_branch":True}, {"clone_filter":"blob:none"}, {"reference":"/tmp"}])
+def test_mirror_rejects_clone_options(history, tmp_path, option):
+    url, _ = history
+    with pytest.raises(RuntimeError, match="MIRROR CLONE DOES NOT SUPPORT"):
+        _clone(url, tmp_path, mirror=True, **option)
+
+    assert not (tmp_path / "local").exists()
@@ -0,0 +1,144 @@
+import operator
+
+import pytest
+
+from sos_toolkit.meta import SOSContext, MetaCondition, condition_predicate
+from sos_toolkit.meta._meta import _shared_predicate
+
+
+VALUES = {"int":3, "float":2.5, "str":"x", "num":"4", "none":None, "bool":True, "list":[1, 2]}
+KEYS = [*VALUES.keys(), "missing", "list[0]", "missing.deep"]
+
+_ORDERED = {"<":operator.lt, ">":operator.gt, "<=":operator.le, ">=":operator.ge}
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"}, namespace=dict(VALUES))
+
+
+def _baseline_in(condition, context):
+    """The interpreted in / equal of MetaCondition.resolve before conditions were compiled"""
+    key, valid = condition["ctx_key"], condition.get("valid", None)
+    list_none = isinstance(valid, list) and None in valid
+
+    if valid is None or list_none:
+        if (value := context.get(key, None)) is not None and context.has(key):
+            result = isinstance(valid, list) and value in valid
+
+        else:
+            result = True
+
+    else:
+        value = context.get(key, None)
+        result = value in valid if isinstance(valid, list) else value == valid
+
+    return result is not condition.get("is_inverse", False)
+
+
+def _interpret(condition, context):
+    """Each comparison spelled out over context.get"""
+    comparison = condition.get("comparison", "in")
+    if comparison in ("in", "equal", "="):
+        return _baseline_in(condition, context)
+
+    if comparison in ("any", "all", "none"):
+        results = [_interpret(c, context) for c in condition["conditions"]]
+        result = {"any":any(results), "all":all(results), "none":not any(results)}[comparison]
+        return result is not condition.get("is_inverse", False)
+
+    value = context.get(condition["ctx_key"], None)
+    valid = condition["valid"]
+    bounds = valid if comparison == "range" else [valid]
+    number = next((b for b in bounds if b is not None), None)
+    if isinstance(value, str) and isinstance(number, (int, float)) and not isinstance(number, bool):
+        try:
+            value = float(value)
+
+        except ValueError:
+            pass
+
+    if value is None:
+        result = False
+
+    else:
+        try:
+            if comparison == "range":
+                low, high = valid
+                result = (low is None or low <= value) and (high is None or value <= high)
+
+            else:
+                result = _ORDERED[comparison](value, valid)
+
+        except TypeError:
+            result = False
+
+    return bool(result) is not condition.get("is_inverse", False)
+
+
+def _conditions():
+    for key in KEYS:
+        ctx_key = f"namespace.{key}"
+        for inverse in (False, True):
+            for valid in [None, 3, "x", True, [1, 3], ["x", None], [None]]:
+                for comparison in ("in", "equal", "="):
+                    yield {"ctx_key":ctx_key, "comparison":comparison, "valid":valid, "is_inverse":inverse}
+
+            for valid in [3, 2.5, 4, "x"]:
+                for comparison in _ORDERED:
+                    yield {"ctx_key":ctx_key, "comparison":comparison, "valid":valid, "is_inverse":inverse}
+
+            for valid in [[1, 3], [3, None], [None, 2], [4, 4], ["a", "z"]]:
+                yield {"ctx_key":ctx_key, "comparison":"range", "valid":valid, "is_inverse":inverse}
+
+
+def test_compiled_matches_interpreted():
+    context = _context()
+    conditions = list(_conditions())
+    for condition in conditions:
+        assert condition_predicate(condition)(context) is _interpret(condition, context), condition
+        assert MetaCondition(**condition).compile()(context) is _interpret(condition, context), condition
+
+    # combinators over every pair of leaf conditions
+    for n in range(0, len(conditions) - 1, 7):
+        children = conditions[n:n + 2]
+        for comparison in ("any", "all", "none"):
+            condition = {"comparison":comparison, "conditions":children}
+            assert condition_predicate(condition)(context) is _interpret(condition, context), condition
+
+
+@pytest.mark.parametrize("condition, expected", [
+    ({"ctx_key":"namespace.int", "comparison":"<", "valid":4}, True),
+    ({"ctx_key":"namespace.num", "comparison":">=", "valid":4}, True),
+    ({"ctx_key":"namespace.str", "comparison":"<", "valid":4}, False),
+    ({"ctx_key":"namespace.missing", "comparison":">", "valid":0}, False),
+    ({"ctx_key":"namespace.missing", "comparison":">", "valid":0, "is_inverse":True}, True),
+    ({"ctx_key":"namespace.float", "comparison":"range", "valid":[2, 3]}, True),
+    ({"ctx_key":"namespace.num", "comparison":"range", "valid":[None, 3]}, False),
+    ({"ctx_key":"namespace.missing", "comparison":"range", "valid":[None, None]}, False),
+    ({"comparison":"any", "conditions":[{"ctx_key":"namespace.int", "valid":1}, {"ctx_key":"namespace.str", "valid":"x"}]}, True),
+    ({"comparison":"all", "conditions":[{"ctx_key":"namespace.int", "valid":1}, {"ctx_key":"namespace.str", "valid":"x"}]}, False),
+    ({"comparison":"none", "conditions":[{"ctx_key":"namespace.int", "valid":1}]}, True),
+    ({"comparison":"all", "conditions":[]}, True),
+    ])
+def test_comparison(condition, expected):
+    assert condition_predicate(condition)(_context()) is expected
+
+
+@pytest.mark.parametrize("condition", [
+    {"ctx_key":"namespace.int", "comparison":"<", "valid":[1, 2]},
+    {"ctx_key":"namespace.int", "comparison":">"},
+    {"ctx_key":"namespace.int", "comparison":"range", "valid":[1]},
+    {"comparison":"equal", "valid":1},
+    ])
+def test_invalid_condition(condition):
+    with pytest.raises(RuntimeError):
+        condition_predicate(condition)
+
+
+def test_shared_predicates_are_bounded():
+    assert _shared_predicate.cache_info().maxsize is not None
+
+    first = MetaCondition(ctx_key="namespace.int", comparison=">", valid=1, label="a")
+    second = MetaCondition(ctx_key="namespace.int", comparison=">", valid=1, label="b")
+    assert first.compile() is second.compile()
+    assert condition_predicate({"ctx_key":"namespace.int", "comparison":">", "valid":1}) is condition_predicate({"valid":1, "comparison":">", "ctx_key":"namespace.int"})
@@ -0,0 +1,49 @@
+import os
+import pickle
+
+import pytest
+
+from sos_toolkit.meta import GLOBAL, SOSContext
+
+
+class _Payload:
+    def __reduce__(self):
+        return (os.system, ("exit 1",))
+
+
+def test_binary_round_trip(context, tmp_path):
+    yaml_file = tmp_path / "sos-context.yaml"
+    context.file_save(context_file=str(yaml_file), file_format="yaml", run_hooks=False)
+    context.file_save(context_file=str(yaml_file), file_format="binary", run_hooks=False)
+
+    loaded = SOSContext.file_load(context_file=str(yaml_file), run_hooks=False)
+    assert loaded.dict() == context.dict()
+
+
+def test_binary_save_marks_yaml(context, tmp_path):
+    yaml_file = tmp_path / "sos-context.yaml"
+    binary_file = tmp_path / f"sos-context.yaml{GLOBAL.CONTEXT_BINARY_SUFFIX}"
+    context.file_save(context_file=str(yaml_file), file_format="yaml", run_hooks=False)
+    context.file_save(context_file=str(yaml_file), file_format="binary", run_hooks=False)
+
+    assert yaml_file.read_text().startswith(GLOBAL.CONTEXT_SUPERSEDED)
+    assert os.path.getmtime(binary_file) >= os.path.getmtime(yaml_file)
+
+    # a yaml save replaces the marker
+    context.file_save(context_file=str(yaml_file), file_format="yaml", run_hooks=False)
+    assert not yaml_file.read_text().startswith(GLOBAL.CONTEXT_SUPERSEDED)
+
+
+def test_unsafe_binary_falls_back_to_yaml(context, tmp_path):
+    yaml_file = tmp_path / "sos-context.yaml"
+    binary_file = tmp_path / f"sos-context.yaml{GLOBAL.CONTEXT_BINARY_SUFFIX}"
+    context.file_save(context_file=str(yaml_file), file_format="yaml", run_hooks=False)
+
+    with open(binary_file, "wb") as f:
+        pickle.dump(({"schema":GLOBAL.CONTEXT_BINARY_SCHEMA}, _Payload()), f)
+
+    loaded = SOSContext.file_load(context_file=str(yaml_file), run_hooks=False)
+    assert loaded.dict() == context.dict()
+
+    with pytest.raises(pickle.UnpicklingError):
+        SOSContext.file_load(context_file=str(binary_file), run_hooks=False)
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sos_toolkit.tool.docker import _client
+from sos_toolkit.tool.docker._client import image_reference, get_client, exists
+
+
+@pytest.mark.parametrize("target, reference", [
+    ("x", "x:latest"),
+    ("x:1", "x:1"),
+    ("library/x", "x:latest"),
+    ("docker.io/library/x:1", "x:1"),
+    ("docker.io/user/x", "user/x:latest"),
+    ("localhost:5000/x", "localhost:5000/x:latest"),
+    ("x:1@sha256:ab", "x@sha256:ab"),
+    ("ghcr.io/a/b:1@sha256:ab", "ghcr.io/a/b@sha256:ab"),
+    ("sha256:ab", "sha256:ab"),
+    ])
+def test_image_reference(target, reference):
+    assert image_reference(target) == reference
+
+
+def test_exists_matches_references():
+    image = SimpleNamespace(id="sha256:ab", repo_tags=["x:latest", "user/y:1"], repo_digests=["x@sha256:cd"])
+    snapshot = {"image":sorted(_client._names("image", image)), "generation":{"image":_client._GENERATION.get("image", 0)}, "client":_client._client_key({})}
+
+    for target in ["x", "x:latest", "docker.io/library/x", "docker.io/user/y:1", "x@sha256:cd", "x:latest@sha256:cd", "sha256:ab"]:
+        assert exists("image", target, snapshot), target
+
+    for target in ["x:1", "y:1", "user/x"]:
+        assert not exists("image", target, snapshot), target
+
+
+def test_compose_env_file_keeps_the_pool_key():
+    config = {"compose_files":["compose.yaml"], "compose_project_name":"sos-test"}
+
+    first = get_client(**config, compose_env_file="/tmp/first.env")
+    second = get_client(**config, compose_env_file="/tmp/second.env")
+    assert first.client_config.compose_env_file == "/tmp/first.env"
+    assert second.client_config.compose_env_file == "/tmp/second.env"
+
+    pooled = get_client(**config)
+    assert pooled.client_config.compose_env_file is None
+    assert list(_client._CLIENT_POOL.values()).count(pooled) == 1
+    assert _client._client_key({**config, "compose_env_file":"/tmp/first.env"}) == _client._client_key(config)
+
+
+def test_snapshot_is_keyed_by_client(monkeypatch):
+    daemons = {_client._client_key({}):{"local:latest"}, _client._client_key({"host":"ssh://remote"}):{"remote:latest"}}
+    monkeypatch.setattr(_client, "inventory", lambda kind, client_config={}, ttl=None: set(daemons[_client._client_key(client_config)]) if kind == "image" else set())
+
+    local = _client.snapshot(kinds=["image"])
+    remote = _client.snapshot({"host":"ssh://remote"}, kinds=["image"])
+    assert local["client"] != remote["client"]
+
+    # the default snapshot never answers for another daemon
+    assert exists("image", "local", local)
+    assert not exists("image", "local", local, {"host":"ssh://remote"})
+    assert exists("image", "remote", local, {"host":"ssh://remote"})
+
+    assert exists("image", "remote", remote, {"host":"ssh://remote"})
+    assert not exists("image", "remote", remote)
+    # the per-call compose env file is not part of the key
+    assert exists("image", "remote", remote, {"host":"ssh://remote", "compose_env_file":"/tmp/x.env"})
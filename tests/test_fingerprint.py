@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from sos_toolkit.tool.docker._fingerprint import _ignore_patterns, _ignored, tree_digest
+
+
+@pytest.fixture
+def context_dir(tmp_path):
+    # tmp_path also holds the cache dir
+    context_dir = tmp_path / "context"
+    context_dir.mkdir()
+    return context_dir
+
+
+def _patterns(tmp_path, *lines):
+    (tmp_path / ".dockerignore").write_text("\n".join(lines) + "\n")
+    return _ignore_patterns(str(tmp_path))
+
+
+@pytest.mark.parametrize("lines, path, ignored", [
+    (["*.md"], "x.md", True),
+    (["*.md"], "docs/x.md", False),
+    (["*/*.md"], "docs/x.md", True),
+    (["*/*.md"], "docs/sub/x.md", False),
+    (["**/*.md"], "x.md", True),
+    (["**/*.md"], "docs/sub/x.md", True),
+    (["docs/**"], "docs/sub/x.md", True),
+    (["docs"], "docs/sub/x.md", True),
+    (["/docs"], "docs/x.md", True),
+    (["./docs/"], "docs/x.md", True),
+    (["doc?"], "docs/x.md", True),
+    (["doc?"], "docs.md", False),
+    (["[a-c].txt"], "b.txt", True),
+    (["[^a-c].txt"], "b.txt", False),
+    (["*.md", "!README.md"], "README.md", False),
+    (["*.md", "!README.md"], "x.md", True),
+    (["docs", "!docs/keep.md"], "docs/keep.md", False),
+    (["docs", "!docs/keep.md"], "docs/drop.md", True),
+    (["!x.md", "*.md"], "x.md", True),
+    ])
+def test_docker_ignore_rules(tmp_path, lines, path, ignored):
+    assert _ignored(path, _patterns(tmp_path, *lines)) is ignored
+
+
+def test_nested_file_edit_changes_digest(context_dir):
+    (context_dir / ".dockerignore").write_text("*.md\n")
+    (context_dir / "docs").mkdir()
+    (context_dir / "docs" / "x.md").write_text("first")
+    (context_dir / "x.md").write_text("first")
+
+    digest = tree_digest(str(context_dir))
+    (context_dir / "x.md").write_text("second")
+    assert tree_digest(str(context_dir)) == digest
+
+    (context_dir / "docs" / "x.md").write_text("second")
+    assert tree_digest(str(context_dir)) != digest
+
+
+def test_negation_re_includes(context_dir):
+    (context_dir / ".dockerignore").write_text("docs\n!docs/keep.md\n")
+    (context_dir / "docs").mkdir()
+    (context_dir / "docs" / "keep.md").write_text("first")
+    (context_dir / "docs" / "drop.md").write_text("first")
+
+    digest = tree_digest(str(context_dir))
+    (context_dir / "docs" / "drop.md").write_text("second")
+    assert tree_digest(str(context_dir)) == digest
+
+    (context_dir / "docs" / "keep.md").write_text("second")
+    assert tree_digest(str(context_dir)) != digest
+
+
+def test_links_are_hashed_as_links(context_dir):
+    (context_dir / "Dockerfile").write_text("FROM scratch\n")
+    (context_dir / "sub").mkdir()
+    os.symlink("missing", context_dir / "dangling")
+    # a link back to its own directory would loop when followed
+    os.symlink("..", context_dir / "sub" / "loop")
+
+    digest = tree_digest(str(context_dir))
+    assert tree_digest(str(context_dir)) == digest
+
+    os.remove(context_dir / "dangling")
+    os.symlink("other", context_dir / "dangling")
+    assert tree_digest(str(context_dir)) != digest
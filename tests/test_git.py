@@ -0,0 +1,134 @@
+import git
+import pytest
+
+from sos_toolkit.meta import GLOBAL, SOSContext
+from sos_toolkit.tool.git.repo import repo_clone, repo_status, repo_commit, repo_pull
+from sos_toolkit.tool.git._state import status_invalidate, repo_dirty
+
+
+def _clone(remote, tmp_path, name="local"):
+    return repo_clone(remote_target=remote, local_target=str(tmp_path / name), remote_branch="main")["working_dir"]
+
+
+def _push(seed, name):
+    with open(f"{seed.working_dir}/{name}", "w") as f:
+        f.write(name)
+
+    seed.git.add(all=True)
+    seed.git.commit("-m", name)
+    seed.git.push("origin", "HEAD:main")
+
+
+def test_status_returns_the_state(remote, tmp_path):
+    remote, seed = remote
+    working_dir = _clone(remote, tmp_path)
+
+    state = repo_status(working_dir=working_dir)
+    assert state["error"] is None
+    assert (state["branch"], state["upstream"], state["dirty"], state["ahead"], state["behind"]) == ("main", "origin/main", False, 0, 0)
+
+    _push(seed, "upstream.txt")
+    assert repo_status(working_dir=working_dir, fetch=False)["behind"] == 0
+    assert repo_status(working_dir=working_dir)["behind"] == 1
+
+    with open(f"{working_dir}/README.md", "a") as f:
+        f.write("edit\n")
+
+    # an edit to a tracked file is seen once the status ttl runs out
+    status_invalidate(working_dir)
+    assert repo_status(working_dir=working_dir, fetch=False)["dirty"] is True
+
+
+def test_commit_pushes_a_dirty_repo(remote, tmp_path):
+    remote, seed = remote
+    working_dir = _clone(remote, tmp_path)
+    context = SOSContext(meta={"system_name":"test"})
+
+    state = repo_commit(context, working_dir=working_dir)
+    assert state["committed"] is False
+
+    with open(f"{working_dir}/README.md", "a") as f:
+        f.write("edit\n")
+
+    state = repo_commit(context, working_dir=working_dir, message="edit")
+    assert state["committed"] is True
+    assert git.Repo(remote).head.commit.message.strip() == "edit"
+
+
+def test_commit_refuses_a_repo_behind(remote, tmp_path):
+    remote, seed = remote
+    working_dir = _clone(remote, tmp_path)
+    context = SOSContext(meta={"system_name":"test"})
+
+    _push(seed, "upstream.txt")
+    with open(f"{working_dir}/README.md", "a") as f:
+        f.write("edit\n")
+
+    state = repo_commit(context, working_dir=working_dir, message="edit")
+    assert (state["behind"], state["committed"]) == (1, False)
+
+
+def _edit(working_dir):
+    with open(f"{working_dir}/README.md", "a") as f:
+        f.write("edit\n")
+
+
+def test_status_cache_follows_the_index(remote, tmp_path, monkeypatch):
+    remote, seed = remote
+    working_dir = _clone(remote, tmp_path)
+    monkeypatch.setattr(GLOBAL, "GIT_STATUS_TTL", 1000)
+
+    assert repo_status(working_dir=working_dir, fetch=False)["cached"] is False
+    assert repo_status(working_dir=working_dir, fetch=False)["cached"] is True
+
+    # an edit alone keeps the cached status until the ttl runs out
+    _edit(working_dir)
+    state = repo_status(working_dir=working_dir, fetch=False)
+    assert (state["cached"], state["dirty"]) == (True, False)
+
+    # add and commit change the index / HEAD
+    repo = git.Repo(working_dir)
+    repo.git.add(all=True)
+    state = repo_status(working_dir=working_dir, fetch=False)
+    assert (state["cached"], state["dirty"]) == (False, True)
+
+    repo.git.commit("-m", "edit")
+    state = repo_status(working_dir=working_dir, fetch=False)
+    assert (state["cached"], state["dirty"], state["ahead"]) == (False, False, 1)
+
+
+def test_status_cache_ttl(remote, tmp_path):
+    remote, seed = remote
+    repo = git.Repo(_clone(remote, tmp_path))
+
+    assert repo_dirty(repo, ttl=1000) == (False, False)
+    _edit(repo.working_dir)
+    assert repo_dirty(repo, ttl=1000) == (False, True)
+    assert repo_dirty(repo, ttl=0) == (True, False)
+
+
+def test_pull_and_commit_drop_the_cached_status(remote, tmp_path, monkeypatch):
+    remote, seed = remote
+    working_dir = _clone(remote, tmp_path)
+    monkeypatch.setattr(GLOBAL, "GIT_STATUS_TTL", 1000)
+    context = SOSContext(meta={"system_name":"test"})
+
+    repo_status(working_dir=working_dir, fetch=False)
+    _push(seed, "upstream.txt")
+    repo_pull(working_dir=working_dir)
+    state = repo_status(working_dir=working_dir, fetch=False)
+    assert (state["cached"], state["head"]) == (False, seed.head.commit.hexsha)
+
+    # the edit is not in the cached status - commit still sees it
+    _edit(working_dir)
+    assert repo_status(working_dir=working_dir, fetch=False)["dirty"] is False
+    assert repo_commit(context, working_dir=working_dir, message="edit")["committed"] is True
+
+
+def test_invalid_working_dir(tmp_path):
+    working_dir = str(tmp_path / "not-a-repo")
+    status_invalidate(working_dir)
+
+    for call in [lambda: repo_status(working_dir=working_dir), lambda: repo_commit(SOSContext(meta={"system_name":"test"}), working_dir=working_dir)]:
+        with pytest.raises(RuntimeError, match="GIT STATUS FAILED"):
+            call()
@@ -0,0 +1,27 @@
+from sos_toolkit.meta import SOSContext
+from sos_toolkit.tool.docker import inventory
+from sos_toolkit.action.sos._inventory import snapshot_inventory
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"})
+
+
+def test_snapshot_sets_inventory(monkeypatch):
+    snapshot = {"image":["x:latest"], "generation":{"image":0}}
+    monkeypatch.setattr(inventory, "snapshot", lambda client_config, kinds: snapshot)
+
+    context = _context()
+    snapshot_inventory(context)
+    assert context.__INVENTORY__ == snapshot
+
+
+def test_snapshot_skipped_without_docker(monkeypatch):
+    def missing(client_config, kinds):
+        raise FileNotFoundError("docker")
+
+    monkeypatch.setattr(inventory, "snapshot", missing)
+
+    context = _context()
+    snapshot_inventory(context)
+    assert context.__INVENTORY__ is None
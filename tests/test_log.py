@@ -0,0 +1,40 @@
+import json
+
+from sos_toolkit.meta import MetaRunnable, ModelDict, SOSContext, log_config, log_info, log_print
+
+
+def test_callable_objects_are_not_called(capsys):
+    log_config(level="INFO", quiet=False)
+
+    runnable = MetaRunnable(tool="tests.compose_up", params={"project_name":"test"})
+    log_info(runnable)
+    log_info(SOSContext(meta={"system_name":"test"}))
+    log_info(ModelDict(a=1))
+
+    assert "compose_up" in capsys.readouterr().out
+
+
+def test_functions_are_lazy(capsys):
+    log_config(level="INFO", quiet=True)
+
+    called = []
+    log_info(lambda: called.append(True))
+    assert called == []
+
+    log_config(level="INFO", quiet=False)
+    log_info(lambda: called.append(True) or "shown")
+    assert called == [True]
+    assert "shown" in capsys.readouterr().out
+
+
+def test_print_ignores_quiet(capsys, tmp_path):
+    log_file = tmp_path / "log.jsonl"
+    log_config(level="INFO", quiet=True, log_file=str(log_file), file_level="INFO")
+
+    log_info("hidden")
+    log_print("asked for")
+    log_config(log_file="")
+
+    assert capsys.readouterr().out == "asked for\n"
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [(r["level"], r["message"]) for r in records] == [("INFO", "hidden"), ("INFO", "asked for")]
@@ -0,0 +1,72 @@
+import json
+import os
+
+import pytest
+
+from sos_toolkit.meta import GLOBAL
+from sos_toolkit.meta import _manifest
+from sos_toolkit.meta._cache import cache_path
+from sos_toolkit.meta._manifest import generate_manifest
+
+
+_TOOL = '''
+from sos_toolkit.meta import sos_tool
+
+@sos_tool
+def first(value: int = 1):
+    """First"""
+    return value
+'''
+
+_SECOND = '''
+
+@sos_tool
+def second(value: int = 2):
+    """Second"""
+    return value
+'''
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    """A tool package with one namespace and a manifest built for it"""
+    monkeypatch.setattr(GLOBAL, "CACHE_ENABLE", True)
+
+    root = tmp_path / "package"
+    (root / "space").mkdir(parents=True)
+    (root / "space" / "tools.py").write_text(_TOOL)
+
+    generate_manifest(str(root), "package", "sos_tool", rebuild=True, save=True)
+    return root
+
+
+def _keys(entries):
+    return sorted(e.key for e in entries)
+
+
+def test_build_writes_the_package_manifest(root):
+    stored = json.loads((root / GLOBAL.MANIFEST_FILE).read_text())
+
+    assert list(stored["files"].keys()) == ["space/tools.py"]
+    assert stored["files"]["space/tools.py"]["entries"][0]["key"] == "first"
+
+
+def test_startup_never_writes_the_package(root, monkeypatch):
+    shipped = (root / GLOBAL.MANIFEST_FILE).read_bytes()
+    (root / "space" / "tools.py").write_text(_TOOL + _SECOND)
+
+    assert _keys(generate_manifest(str(root), "package", "sos_tool")) == ["first", "second"]
+    assert (root / GLOBAL.MANIFEST_FILE).read_bytes() == shipped
+
+    # the regenerated manifest comes from the user cache => nothing is parsed again
+    def parse(**kwargs):
+        raise AssertionError("parsed")
+
+    monkeypatch.setattr(_manifest, "manifest_file", parse)
+    assert _keys(generate_manifest(str(root), "package", "sos_tool")) == ["first", "second"]
+
+
+def test_matching_manifest_is_not_cached(root):
+    assert _keys(generate_manifest(str(root), "package", "sos_tool")) == ["first"]
+
+    assert not os.path.exists(cache_path("manifest"))
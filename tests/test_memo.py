@@ -0,0 +1,68 @@
+import pytest
+
+from sos_toolkit.meta import SOSContext, condition_memo, condition_check, condition_predicate
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"}, namespace={"a":{"b":0}})
+
+
+def _predicate():
+    return condition_predicate({"ctx_key":"namespace.a.b", "valid":1, "comparison":"="})
+
+
+def _write(context, kind, value):
+    match kind:
+        case "set":
+            context.set("namespace.a.b", value, True)
+
+        case "set_many":
+            context.set_many([("namespace.a.b", value)], True)
+
+        case "remove":
+            if value == 1:
+                context.set("namespace.a.b", value, True)
+
+            else:
+                context.remove("namespace.a.b")
+
+        case "parent":
+            context.set("namespace.a", {"b":value}, True)
+
+
+@pytest.mark.parametrize("kind", ["set", "set_many", "remove", "parent"])
+def test_write_invalidates_condition(kind):
+    context = _context()
+    predicate = _predicate()
+
+    with condition_memo() as memo:
+        assert condition_check(predicate, context) is False
+        assert condition_check(predicate, context) is False
+        assert memo.hits == 1
+
+        _write(context, kind, 1)
+        assert condition_check(predicate, context) is True
+
+        _write(context, kind, 2)
+        assert condition_check(predicate, context) is False
+        assert memo.hits == 1
+
+
+def test_check_during_write_is_not_kept(monkeypatch):
+    """A condition checked by another branch while a write is in progress reads the old value"""
+    context = _context()
+    predicate = _predicate()
+    _set_path = SOSContext._set_path
+
+    def racing(self, path, value, overwrite=False):
+        assert condition_check(predicate, self) is False
+        return _set_path(self, path, value, overwrite)
+
+    with condition_memo():
+        assert condition_check(predicate, context) is False
+
+        monkeypatch.setattr(SOSContext, "_set_path", racing)
+        context.set("namespace.a.b", 1, True)
+        monkeypatch.setattr(SOSContext, "_set_path", _set_path)
+
+        assert condition_check(predicate, context) is True
@@ -0,0 +1,111 @@
+from threading import Thread
+
+from sos_toolkit.meta import MetaRunnable, SOSContext
+from sos_toolkit.meta._action import ActionObject
+import _tool
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"}, namespace={"shared":{"value":1}})
+
+
+def _up(key):
+    return {"tool":"tests.compose_up", "params":{"project_name":key},
+        "result_map":[{"result":f"namespace.out.{key}", "data":"result"}]}
+
+
+def test_meta_keys_do_not_hide_children():
+    obj = ActionObject.from_config({
+        "__parallel__":2,
+        "__depends_on__":{"depends_on":["parallel"]},
+        "parallel":_up("parallel"),
+        "depends_on":_up("depends_on"),
+        })
+
+    assert isinstance(obj.get("parallel"), MetaRunnable)
+    assert isinstance(obj.get("depends_on"), MetaRunnable)
+    assert obj.model_dump()["__parallel__"] == 2
+
+    context = _context()
+    result = obj(context)
+    assert list(result.model_dump().keys()) == ["parallel", "depends_on"]
+    assert context.get("namespace.out").model_dump() == {"parallel":"parallel", "depends_on":"depends_on"}
+
+
+def test_parallel_branches_share_context_writes():
+    keys = [f"up{n}" for n in range(16)]
+    obj = ActionObject.from_config({"__parallel__":8, **{key:_up(key) for key in keys}})
+
+    context = _context()
+    context.set("__RESULT__", "parent", True)
+    obj(context)
+
+    assert context.get("namespace.out").model_dump() == {key:key for key in keys}
+    assert context.__RESULT__ == "parent"
+
+
+def test_result_is_per_thread():
+    context = _context()
+    context.set("__RESULT__", "main", True)
+
+    seen = []
+    def worker():
+        seen.append(context.__RESULT__)
+        context.set("__RESULT__", "worker", True)
+
+    thread = Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen == [None]
+    assert context.__RESULT__ == "main"
+
+
+def test_dict_conversion_is_shared():
+    context = _context()
+    found = []
+    threads = [Thread(target=lambda: found.append(context.get("namespace.shared"))) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(obj is found[0] for obj in found)
+    assert context.get("namespace.shared") is found[0]
+
+
+def test_result_reads_through_get():
+    context = _context()
+    context.set("__RESULT__", {"data":"/some/path"}, True)
+
+    assert context.get("__RESULT__") == {"data":"/some/path"}
+    assert context.get("__RESULT__.data") == "/some/path"
+    # the dotted get converted it in place
+    assert context.get("__RESULT__", None).model_dump() == {"data":"/some/path"}
+
+
+def test_result_context_map():
+    context = _context()
+    context.set("__RESULT__", {"data":"/some/path"}, True)
+
+    runnable = MetaRunnable(tool="tests.compose_up", params={"project_name":"none"},
+        context_map=[{"result":"project_name", "data":"__RESULT__.data"}],
+        result_map=[{"result":"namespace.out", "data":"result"}])
+    runnable(context)
+
+    assert context.get("namespace.out") == "/some/path"
+
+
+def test_parallel_branches_start_from_result():
+    keys = [f"up{n}" for n in range(8)]
+    obj = ActionObject.from_config({"__parallel__":4, **{key:{"tool":"tests.compose_up",
+        "params":{"project_name":"none"},
+        "context_map":[{"result":"project_name", "data":"__RESULT__"}],
+        "result_map":[{"result":f"namespace.out.{key}", "data":"result"}]} for key in keys}})
+
+    context = _context()
+    context.set("__RESULT__", "parent", True)
+    obj(context)
+
+    assert context.get("namespace.out").model_dump() == {key:"parent" for key in keys}
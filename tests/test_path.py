@@ -0,0 +1,91 @@
+import pytest
+
+from sos_toolkit.meta import SOSContext, ModelDict
+from sos_toolkit.meta._utils import compile_path
+
+
+def _context():
+    return SOSContext(meta={"system_name":"test"}, namespace={
+        "plain":{"a":{"b":1}, "none":None},
+        "model":ModelDict(items=[{"c":2}, [3, 4]], none=None),
+        "list":[1, 2],
+        "text":"value",
+        "not-identifier":{"x":1},
+        })
+
+
+def _baseline_has(context, name):
+    """has before compiled paths - any get that does not raise"""
+    try:
+        context.get(name)
+        return True
+
+    except:
+        return False
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("a", (("a", "a", None, True),)),
+    ("a.b", (("a", "a", None, True), ("b", "b", None, True))),
+    ("a[0]", (("a[0]", "a", 0, True),)),
+    ("a[-1].b", (("a[-1]", "a", -1, True), ("b", "b", None, True))),
+    ("a-b.c", (("a-b", "a-b", None, False), ("c", "c", None, True))),
+    ("a[x]", (("a[x]", "a[x]", None, False),)),
+    ("a[0", (("a[0", "a[0", None, False),)),
+    ("a..b", (("a", "a", None, True), ("", "", None, False), ("b", "b", None, True))),
+    ])
+def test_compile_path(path, expected):
+    assert compile_path(path) == expected
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("namespace", True),
+    ("namespace.plain.a.b", True),
+    ("namespace.plain.none", True),
+    ("namespace.model.none", True),
+    ("namespace.missing", False),
+    ("namespace.missing.deep", False),
+    ("namespace.plain.a.missing", False),
+    ("namespace.text.upper", False),
+    # index segments
+    ("namespace.list[0]", True),
+    ("namespace.list[-2]", True),
+    ("namespace.list[2]", False),
+    ("namespace.list[-3]", False),
+    ("namespace.model.items[0].c", True),
+    ("namespace.model.items[1][0]", False),
+    ("namespace.model.items[5].c", False),
+    ("namespace.text[0]", True),
+    ("namespace.plain[0]", False),
+    # invalid segments
+    ("namespace..plain", False),
+    ("namespace.plain.", False),
+    ("", False),
+    ("namespace.list[x]", False),
+    ("namespace.list[0", False),
+    ("namespace.not-identifier", True),
+    # methods are not objects
+    ("namespace.print", False),
+    ("meta.has", False),
+    ])
+def test_has(name, expected):
+    context = _context()
+    assert context.has(name) is expected
+    assert _baseline_has(_context(), name) is expected
+
+
+@pytest.mark.parametrize("name", [None, 5, ["namespace.missing"], {"name":"namespace.missing"}])
+def test_has_never_raises(name):
+    assert _context().has(name) is False
+
+
+def test_has_coupled_default():
+    # a coupled name/default resolves like get
+    assert _context().has(["namespace.missing", "dflt"]) is True
+    assert _context().has({"name":"namespace.plain.a.b"}) is True
+
+
+def test_has_does_not_convert():
+    context = _context()
+    assert context.has("namespace.plain.a.b")
+    assert type(context.namespace.plain) is dict
@@ -0,0 +1,75 @@
+from copy import deepcopy
+
+import pytest
+from omegaconf import OmegaConf
+
+from sos_toolkit.meta._resolve import ConfigResolver
+
+
+def _resolve(config):
+    """The resolver with the OmegaConf fallback the context uses"""
+    container = deepcopy(config)
+    if (resolved := ConfigResolver().resolve(container)) is not None:
+        return resolved
+
+    omega = OmegaConf.create(deepcopy(config))
+    OmegaConf.resolve(omega)
+    return OmegaConf.to_container(omega)
+
+
+def _omegaconf(config):
+    omega = OmegaConf.create(deepcopy(config))
+    OmegaConf.resolve(omega)
+    return OmegaConf.to_container(omega)
+
+
+CASES = {
+    "reference":{"a":1, "b":"${a}"},
+    "string":{"a":"x", "b":{"c":"y"}, "d":"${a}-${b.c}"},
+    "chain":{"a":"${b}", "b":"${c.d}", "c":{"d":[1, 2]}},
+    "container":{"a":{"b":"${c}", "c":1}, "c":2, "d":"${a}"},
+    "list":{"a":[1, "${b}"], "b":2, "c":"${a.1}"},
+    "select":{"a":"${oc.select:b.c,dflt}", "b":{"c":3}},
+    "select_missing":{"a":"${oc.select:b.x,dflt}", "b":{"c":3}},
+    "select_no_default":{"a":"${oc.select:b.c}", "b":{"c":3}},
+    "select_reference":{"a":"${oc.select:b,dflt}", "b":"${c}", "c":4},
+    "relative":{"a":{"b":1, "c":"${.b}"}},
+    "decode":{"a":"${oc.decode:'3'}", "b":"${oc.decode:'true'}"},
+    "env":{"a":"${oc.env:SOS_RESOLVE_TEST}", "b":"x-${oc.env:SOS_RESOLVE_TEST}"},
+    "env_default":{"a":"${oc.env:SOS_RESOLVE_UNSET,dflt}", "b":"${oc.env:SOS_RESOLVE_UNSET,${c}}", "c":"ref"},
+    "escape":{"a":"\\${b}", "b":1},
+    }
+
+
+@pytest.mark.parametrize("name", CASES.keys())
+def test_equivalent_to_omegaconf(name, monkeypatch):
+    monkeypatch.setenv("SOS_RESOLVE_TEST", "env")
+    config = CASES[name]
+
+    assert _resolve(config) == _omegaconf(config)
+
+
+@pytest.mark.parametrize("name", ["select", "select_missing", "select_no_default", "select_reference", "env_default"])
+def test_config_reading_resolvers_fall_back(name, monkeypatch):
+    monkeypatch.setenv("SOS_RESOLVE_TEST", "env")
+    assert ConfigResolver().resolve(deepcopy(CASES[name])) is None
+
+
+def test_decoded_container_falls_back():
+    assert ConfigResolver().resolve({"a":"${oc.decode:'[1, 2]'}"}) is None
+
+
+def test_independent_resolvers_resolve(monkeypatch):
+    monkeypatch.setenv("SOS_RESOLVE_TEST", "env")
+    assert ConfigResolver().resolve(deepcopy(CASES["env"])) == {"a":"env", "b":"x-env"}
+    assert ConfigResolver().resolve(deepcopy(CASES["decode"])) == {"a":3, "b":True}
+
+
+def test_incremental_resolve_matches():
+    resolver = ConfigResolver()
+    config = {"a":1, "b":"${a}", "c":"${b}-${d.e}", "d":{"e":"x"}}
+    assert resolver.resolve(deepcopy(config), key="k") == _omegaconf(config)
+
+    config["d"]["e"] = "y"
+    assert resolver.resolve(deepcopy(config), key="k") == _omegaconf(config)
+    assert resolver.recomputed == ["c"]
@@ -0,0 +1,156 @@
+from copy import deepcopy
+from os.path import join as path_join
+
+import pytest
+
+from sos_toolkit.meta import MetaRunnable, MetaResolvable, ModelDict, SOSContext
+
+
+def _baseline(resolvable, source, result=None):
+    """The per-call MetaResolvable.__call__ from before resolvables were compiled into plans"""
+    match resolvable.data:
+        case str():
+            if resolvable.default:
+                if (value := source.get(resolvable.data, resolvable.default)) is None and not resolvable.allow_none:
+                    value = resolvable.default
+
+            else:
+                value = source.get(resolvable.data)
+
+        case list():
+            objects = {}
+            for (n, obj) in enumerate(resolvable.data):
+                if "label" in obj.keys():
+                    _target = obj.pop("result", str(n))
+                    value = _baseline(MetaResolvable(**obj), source)
+
+                elif (_source := obj.get("source", None)) is None:
+                    _target = obj.get("target", str(n))
+                    value = obj.get("default")
+
+                elif (_default := obj.get("default", None)) is not None:
+                    _target = obj.get("target", str(n))
+                    if (value := source.get(_source, default=_default)) is None and not resolvable.allow_none:
+                        value = _default
+
+                else:
+                    _target = obj.get("target", str(n))
+                    value = source.get(_source)
+
+                objects[_target] = value
+
+            if resolvable.path_join:
+                value = path_join(*objects.values())
+
+            elif resolvable.format_string is not None:
+                value = resolvable.format_string.format(**objects)
+
+            elif resolvable.to_list:
+                value = list(objects.values())
+
+            else:
+                value = objects
+
+        case dict():
+            if (_source := resolvable.data.get("source", None)) is None:
+                value = resolvable.data["default"]
+
+            elif (_default := resolvable.data.get("default", None)) is not None:
+                if (value := source.get(_source, default=_default)) is None and not resolvable.allow_none:
+                    value = _default
+
+            else:
+                value = source.get(_source)
+
+    if resolvable.result is not None and result is not None:
+        result.set(resolvable.result, value, overwrite=True)
+
+    return value
+
+
+def _baseline_params(runnable, context):
+    params = deepcopy(runnable.params)
+    for resolvable in deepcopy(runnable.context_map):
+        _baseline(resolvable, context, params)
+
+    return params
+
+
+def _context():
+    context = SOSContext(meta={"system_name":"test"}, namespace={
+        "value":"v",
+        "none":None,
+        "nested":{"a":{"b":[1, {"c":2}]}},
+        "dir":"/data",
+        })
+    context.set("__RESULT__", {"data":"/some/path"}, True)
+    return context
+
+
+MAPS = {
+    "literal":[
+        {"result":"project_name", "data":{"default":"literal"}},
+        {"result":"plain.B", "data":[{"target":"x", "default":"y"}]},
+        ],
+    "reference":[
+        {"result":"project_name", "data":"meta.system_name"},
+        {"result":"plain.B", "data":"namespace.value"},
+        {"result":"plain.C", "data":{"source":"namespace.nested.a.b[1].c"}},
+        ],
+    "result":[
+        {"result":"project_name", "data":"__RESULT__.data"},
+        {"result":"plain.B", "data":"__RESULT__"},
+        ],
+    "nested_targets":[
+        {"result":"env_map.B", "data":"namespace.value"},
+        {"result":"items[0].B", "data":"namespace.nested.a"},
+        {"result":"deep.new.key", "data":"namespace.nested.a.b"},
+        {"result":"plain", "data":"namespace.nested"},
+        {"result":"plain.X", "data":"namespace.value"},
+        ],
+    "combined":[
+        {"result":"project_name", "data":[{"target":"a", "source":"namespace.value"}, {"target":"b", "source":"meta.system_name"}],
+            "format_string":"{a}-{b}"},
+        {"result":"plain.path", "data":[{"source":"namespace.dir"}, {"default":"sub"}], "path_join":True},
+        {"result":"plain.list", "data":[{"source":"namespace.value"}, {"default":1}], "to_list":True},
+        {"result":"plain.objects", "data":[{"target":"a", "source":"namespace.value"}, {"target":"a", "default":"last"}]},
+        {"result":"plain.inner", "data":[{"label":"inner", "result":"x", "data":"namespace.value"}, {"target":"y", "default":2}]},
+        ],
+    "missing":[
+        {"result":"project_name", "data":"namespace.missing", "default":"dflt"},
+        {"result":"plain.B", "data":"namespace.none", "default":"dflt"},
+        {"result":"plain.C", "data":"namespace.none", "default":"dflt", "allow_none":True},
+        {"result":"plain.D", "data":{"source":"namespace.missing.deep", "default":"dflt"}},
+        {"result":"plain.E", "data":[{"target":"a", "source":"namespace.missing", "default":"dflt"}], "allow_none":True},
+        {"result":"plain.F", "data":"namespace.none"},
+        ],
+    }
+
+
+def _runnable(name):
+    return MetaRunnable(
+        tool="tests.compose_up",
+        params={"project_name":"test", "env_map":ModelDict(A="a"), "plain":{"A":"a"}, "items":[{"A":"a"}]},
+        context_map=MAPS[name])
+
+
+@pytest.mark.parametrize("name", MAPS.keys())
+def test_plan_matches_per_call_resolve(name):
+    runnable = _runnable(name)
+    expected = _baseline_params(runnable, _context()).model_dump()
+
+    # compiled once, run twice
+    assert runnable.resolve_params(_context()).model_dump() == expected
+    assert runnable.resolve_params(_context()).model_dump() == expected
+
+
+@pytest.mark.parametrize("data", ["namespace.missing", {"source":"namespace.missing.deep"}, [{"source":"namespace.nested.x"}]])
+def test_missing_without_default_raises(data):
+    runnable = MetaRunnable(tool="tests.compose_up", params={"project_name":"test"},
+        context_map=[{"result":"project_name", "data":data}])
+
+    with pytest.raises(Exception):
+        _baseline_params(runnable, _context())
+
+    with pytest.raises(Exception):
+        runnable.resolve_params(_context())
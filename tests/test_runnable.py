@@ -0,0 +1,39 @@
+from sos_toolkit.meta import MetaRunnable, ModelDict, SOSContext
+
+
+def _context(value):
+    return SOSContext(meta={"system_name":"test"}, namespace={"value":value})
+
+
+def _runnable():
+    return MetaRunnable(
+        tool="tests.compose_up",
+        params={"project_name":"test", "env_map":ModelDict(A="a"), "plain":{"A":"a"}, "items":[{"A":"a"}]},
+        context_map=[
+            {"result":"env_map.B", "data":"namespace.value"},
+            {"result":"plain.B", "data":"namespace.value"},
+            {"result":"items[0].B", "data":"namespace.value"},
+            ])
+
+
+def test_dotted_context_map_keeps_template():
+    runnable = _runnable()
+    template = runnable.params.model_dump()
+
+    params = runnable.resolve_params(_context("first"))
+    assert params.model_dump()["env_map"] == {"A":"a", "B":"first"}
+    assert params.model_dump()["items"] == [{"A":"a", "B":"first"}]
+    assert runnable.params.model_dump() == template
+
+    params = runnable.resolve_params(_context("second"))
+    assert params.model_dump()["plain"] == {"A":"a", "B":"second"}
+    assert runnable.params.model_dump() == template
+
+
+def test_called_params_are_a_copy():
+    runnable = _runnable()
+    template = runnable.params.model_dump()
+
+    result = runnable._result(_context("first"), {"result":"ok"})
+    result.called_params.env_map.set("C", "c")
+    assert runnable.params.model_dump() == template
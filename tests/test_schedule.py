@@ -0,0 +1,34 @@
+from sos_toolkit.meta import SOS_TOOL
+import _tool
+from sos_toolkit.tool.docker import schedule
+
+
+def _targets(keys):
+    return [f"service.{key}.action.setup.step_1" for key in keys]
+
+
+def test_builds_run_as_actions(system, context, monkeypatch):
+    monkeypatch.setitem(schedule.BUILD_TOOLS, "tests.buildx_build", ["tag", "context_dir", "docker_file", "build_args"])
+    _, keys = system
+
+    result = SOS_TOOL.docker.build_schedule(context, targets=_targets(keys), concurrency=2)
+
+    assert result["failed"] == []
+    assert {v["status"] for v in result["result"].values()} == {"built"}
+    for key in keys:
+        # the result_map of each build ran
+        assert context.get(f"service.{key}.namespace.last_build") == context.get(f"service.{key}.namespace.image_tag")
+
+    assert context.__RESULT__ is None
+
+
+def test_duplicates_run_after_their_build(system, context, monkeypatch):
+    monkeypatch.setitem(schedule.BUILD_TOOLS, "tests.buildx_build", ["docker_file", "build_args"])
+    _, keys = system
+
+    result = SOS_TOOL.docker.build_schedule(context, targets=_targets(keys), concurrency=2)
+
+    first, second = _targets(keys)
+    assert result["result"][first]["status"] == "built"
+    assert result["result"][second] == {"status":"duplicate", "of":first, "seconds":result["result"][second]["seconds"]}
+    assert context.get(f"service.{keys[1]}.namespace.last_build") == context.get(f"service.{keys[1]}.namespace.image_tag")
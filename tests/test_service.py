@@ -0,0 +1,75 @@
+from os import makedirs
+from os.path import join as path_join
+
+import pytest
+from omegaconf import OmegaConf
+
+from sos_toolkit.meta import SOSContext
+from _system import service_path
+
+
+def _services(root, services):
+    """Write a service per key declaring its sub-services - {key:[sub-service keys]}"""
+    path = path_join(str(root), "service")
+    for key, subs in services.items():
+        platform = path_join(path, key, "platform", "default")
+        makedirs(platform, exist_ok=True)
+        config = {"meta":{"system_name":f"sos-{key}"}, "namespace":{"key":key}, "service":{sub:True for sub in subs}}
+        OmegaConf.save(OmegaConf.create(config), path_join(platform, "sos-service.yaml"))
+
+    return path
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """The service keys in the order their files were loaded"""
+    output = []
+    _service_file = SOSContext._service_file
+
+    def service_file(key, platform):
+        output.append(key)
+        return _service_file(key, platform)
+
+    monkeypatch.setattr(SOSContext, "_service_file", staticmethod(service_file))
+    return output
+
+
+def test_dependencies_before_dependents(tmp_path, loads):
+    path = _services(tmp_path, {"app":["db", "cache"], "db":["base"], "cache":["base"], "base":[], "other":[]})
+    with service_path(path):
+        output = SOSContext._service("default", system_service={"app":True, "other":True})
+
+    assert list(output.keys()) == ["base", "db", "cache", "app", "other"]
+    assert output["db"].namespace.key == "db"
+    # sub-service declarations are not kept on the merged service
+    assert dict(output["app"].service) == {}
+
+
+def test_each_service_loads_once(tmp_path, loads):
+    path = _services(tmp_path, {"a":["c"], "b":["c"], "c":["d"], "d":[]})
+    with service_path(path):
+        output = SOSContext._service("default", system_service={"a":True, "b":True, "c":True})
+
+    assert sorted(loads) == ["a", "b", "c", "d"]
+    assert list(output.keys()) == ["d", "c", "a", "b"]
+
+
+def test_false_declaration(tmp_path, loads):
+    path = _services(tmp_path, {"app":["db"], "db":[], "unused":[]})
+    with service_path(path):
+        output = SOSContext._service("default", system_service={"db":False, "unused":False, "app":True})
+
+    # a service another one depends on is loaded even when declared false
+    assert list(output.keys()) == ["db", "app"]
+    assert "unused" not in loads
+
+
+@pytest.mark.parametrize("services, cycle", [
+    ({"a":["b"], "b":["a"]}, "a -> b -> a"),
+    ({"a":["b"], "b":["c"], "c":["b"]}, "b -> c -> b"),
+    ])
+def test_dependency_cycle(tmp_path, services, cycle):
+    path = _services(tmp_path, services)
+    with service_path(path):
+        with pytest.raises(RuntimeError, match=f"SERVICE DEPENDENCY CYCLE: {cycle}"):
+            SOSContext._service("default", system_service={"a":True})
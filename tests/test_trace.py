@@ -0,0 +1,130 @@
+import json
+from threading import Thread, Barrier
+from time import sleep
+
+import pytest
+
+from sos_toolkit.meta import SOSContext, span, trace_start, trace_stop, trace_export, trace_enabled
+from sos_toolkit.meta._action import ActionConfig
+import _tool
+
+
+@pytest.fixture
+def tracing():
+    trace_start()
+    try:
+        yield
+
+    finally:
+        trace_stop()
+
+
+def _folded(target):
+    output = {}
+    with open(target, "r") as f:
+        for line in f:
+            path, _, us = line.rstrip("\n").rpartition(" ")
+            output[path] = int(us)
+
+    return output
+
+
+def _context():
+    action = ActionConfig.from_config({"up":{
+        "first":{"label":"first", "tool":"tests.compose_up", "params":{"project_name":"first"}},
+        "second":{"label":"second", "tool":"tests.compose_up", "params":{"project_name":"second"},
+            "callbacks":[{"label":"callback", "tool":"tests.compose_up", "params":{"project_name":"callback"}}]},
+        }}, label="action")
+
+    return SOSContext(meta={"system_name":"test"}, action=action)
+
+
+def test_traced_action_exports(tracing, tmp_path):
+    _context().run("action.up")
+    events = trace_stop()
+    assert not trace_enabled()
+
+    trace = json.loads(open(trace_export(str(tmp_path / "trace.json"))).read())["traceEvents"]
+    meta = [e for e in trace if e["ph"] == "M"]
+    spans = [e for e in trace if e["ph"] == "X"]
+
+    assert meta[0]["args"]["name"] == "sos-toolkit"
+    assert {e["tid"] for e in meta[1:]} == {e["tid"] for e in spans}
+    assert len(spans) == len(events)
+    assert [e["ts"] for e in spans] == sorted(e["ts"] for e in spans)
+    assert all(e["args"]["outcome"] == "ok" for e in spans)
+
+    names = {(e["cat"], e["name"]) for e in spans}
+    assert {("context", "run:action.up"), ("object", "up"), ("runnable", "first"), ("runnable", "second"),
+        ("callback", "CB::callback"), ("tool", "compose_up")} <= names
+
+    # every span is inside the context run
+    root = next(e for e in spans if e["cat"] == "context")
+    assert all(root["ts"] <= e["ts"] and e["ts"] + e["dur"] <= root["ts"] + root["dur"] + 1 for e in spans)
+
+    folded = _folded(trace_export(str(tmp_path / "trace.folded")))
+    assert all(path.startswith("run:action.up") for path in folded)
+    assert {"run:action.up;up;first;run;compose_up", "run:action.up;up;second;CB::callback;run;compose_up"} <= set(folded.keys())
+    # self times add up to the root span - each line is rounded down to a microsecond
+    assert root["dur"] - len(folded) <= sum(folded.values()) <= root["dur"]
+
+
+def test_folded_self_time(tracing, tmp_path):
+    with span("outer", "test"):
+        sleep(0.02)
+        with span("inner", "test"):
+            sleep(0.03)
+
+    events = {e["name"]:e for e in trace_stop()}
+    folded = _folded(trace_export(str(tmp_path / "trace.folded")))
+
+    assert set(folded.keys()) == {"outer", "outer;inner"}
+    # the parent keeps only its own time
+    assert abs(folded["outer;inner"] - events["inner"]["dur"]) <= 1
+    assert abs(folded["outer"] - (events["outer"]["dur"] - events["inner"]["dur"])) <= 1
+    assert folded["outer"] >= 15000 and folded["outer;inner"] >= 25000
+
+
+def test_threads_keep_their_own_stacks(tracing, tmp_path):
+    barrier = Barrier(2)
+
+    def worker(name):
+        with span(name, "test"):
+            # both spans are open at once
+            barrier.wait()
+            with span("child", "test"):
+                sleep(0.01)
+
+    threads = [Thread(target=worker, args=(name,), name=name) for name in ["left", "right"]]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    trace_stop()
+    folded = _folded(trace_export(str(tmp_path / "trace.folded")))
+    assert set(folded.keys()) >= {"left;child", "right;child"}
+
+    trace = json.loads(open(trace_export(str(tmp_path / "trace.json"))).read())["traceEvents"]
+    threads = {e["args"]["name"]:e["tid"] for e in trace if e["name"] == "thread_name"}
+    spans = {(e["name"], e["tid"]) for e in trace if e["ph"] == "X"}
+    assert spans == {("left", threads["left"]), ("child", threads["left"]), ("right", threads["right"]), ("child", threads["right"])}
+
+
+def test_error_outcome(tracing):
+    with pytest.raises(ValueError):
+        with span("failing", "test"):
+            raise ValueError()
+
+    assert trace_stop()[0]["args"]["outcome"] == "error:ValueError"
+
+
+def test_untraced_spans_are_not_recorded():
+    trace_start()
+    trace_stop()
+
+    with span("outside", "test"):
+        pass
+
+    assert trace_stop() == []